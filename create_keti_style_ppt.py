@@ -7,34 +7,41 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_VERTICAL_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.dml import MSO_FILL_TYPE
+import inspect
 import os
 
-def create_keti_style_presentation():
-    """KETI 스타일 25페이지 PPT 생성 (15분 발표용)"""
-    
-    # 기존 KETI PPT를 템플릿으로 사용
-    template_path = '/home/kim/github-sdv/중국SDV표준 소개_KETI 박부식.pptx'
-    if os.path.exists(template_path):
-        prs = Presentation(template_path)
-        # 기존 슬라이드 제거 (템플릿 레이아웃만 사용)
-        while len(prs.slides) > 0:
-            xml_slides = prs.slides._sldIdLst
-            slides = list(xml_slides)
-            xml_slides.remove(slides[0])
-    else:
-        prs = Presentation()
-        prs.slide_width = Inches(16)
-        prs.slide_height = Inches(9)
-    
-    # 색상 테마 정의 (KETI 스타일)
-    KETI_BLUE = RGBColor(0, 82, 147)  # KETI 파란색
-    KETI_NAVY = RGBColor(0, 32, 96)   # 진한 네이비
-    KETI_LIGHT_BLUE = RGBColor(218, 238, 243)  # 연한 파란색
-    KETI_GRAY = RGBColor(95, 96, 98)  # 회색
-    
-    # 슬라이드 1: 표지
-    slide_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[0]
-    slide = prs.slides.add_slide(slide_layout)
+from sdvdeck.builder import BoxStyle, ShapeSpec, SlideBuilder, Theme, TextStyle, StackStyle, page_style, save_presentation
+from sdvdeck.incremental import IncrementalBuild, slide_key
+from sdvdeck.themepack import load_theme_pack
+
+OUTPUT_FILE = '/home/kim/github-sdv/China_SDV_Standard_KETI_Style_25pages.pptx'
+TEMPLATE_FILE = '/home/kim/github-sdv/중국SDV표준 소개_KETI 박부식.pptx'
+
+# 색상 테마 정의 (KETI 스타일)
+KETI_BLUE = RGBColor(0, 82, 147)  # KETI 파란색
+KETI_NAVY = RGBColor(0, 32, 96)   # 진한 네이비
+KETI_LIGHT_BLUE = RGBColor(218, 238, 243)  # 연한 파란색
+KETI_GRAY = RGBColor(95, 96, 98)  # 회색
+
+# 타이틀을 네이비 밴드 안에 직접 쓰는 KETI 테마
+THEME = Theme(
+    name="keti",
+    header_color=KETI_NAVY,
+    header_line=False,
+    title=TextStyle(size=Pt(32), bold=True, color=RGBColor(255, 255, 255)),
+    title_in_band=True,
+    stack=StackStyle(
+        heading=TextStyle(size=Pt(24), bold=True, color=KETI_NAVY),
+        bullet=TextStyle(size=Pt(18), color=KETI_GRAY),
+        item=TextStyle(size=Pt(20), color=KETI_GRAY),
+    ),
+    page=page_style(KETI_GRAY),
+    layout_index=5,
+)
+
+def _slide_01(deck):
+    """슬라이드 1: 표지"""
+    slide = deck.new_slide(6)
     
     # KETI 로고 위치 (플레이스홀더)
     logo_box = slide.shapes.add_shape(
@@ -98,20 +105,17 @@ def create_keti_style_presentation():
     p.font.size = Pt(14)
     p.font.color.rgb = KETI_GRAY
     p.alignment = PP_ALIGN.CENTER
-    
-    # 슬라이드 2: 목차
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    return slide
+
+
+def _slide_02(deck):
+    """슬라이드 2: 목차"""
+    slide = deck.new_slide()
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(14), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "Contents"
-    p.font.size = Pt(44)
-    p.font.bold = True
-    p.font.color.rgb = KETI_NAVY
+    shapes = [ShapeSpec("textbox", Inches(1), Inches(0.5), Inches(14), Inches(1),
+                        paragraphs=(("Contents", TextStyle(size=Pt(44), bold=True, color=KETI_NAVY)),),
+                        leading_blank=True)]
     
     # 목차 내용
     contents = [
@@ -129,55 +133,29 @@ def create_keti_style_presentation():
     y_pos = 2
     for num, title in contents:
         # 번호 박스
-        num_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(2), Inches(y_pos),
-            Inches(0.8), Inches(0.6)
-        )
-        num_box.fill.solid()
-        num_box.fill.fore_color.rgb = KETI_BLUE
-        
-        text_frame = num_box.text_frame
-        text_frame.clear()
-        p = text_frame.add_paragraph()
-        p.text = num
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
-        p.alignment = PP_ALIGN.CENTER
+        shapes.append(ShapeSpec(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2), Inches(y_pos), Inches(0.8), Inches(0.6),
+            BoxStyle(fill=KETI_BLUE),
+            ((num, TextStyle(size=Pt(18), bold=True, color=RGBColor(255, 255, 255),
+                             align=PP_ALIGN.CENTER)),),
+            leading_blank=True))
         
         # 제목 텍스트
-        text_box = slide.shapes.add_textbox(Inches(3), Inches(y_pos), Inches(10), Inches(0.6))
-        text_frame = text_box.text_frame
-        text_frame.clear()
-        p = text_frame.add_paragraph()
-        p.text = title
-        p.font.size = Pt(20)
-        p.font.color.rgb = KETI_NAVY
+        shapes.append(ShapeSpec(
+            "textbox", Inches(3), Inches(y_pos), Inches(10), Inches(0.6),
+            paragraphs=((title, TextStyle(size=Pt(20), color=KETI_NAVY)),), leading_blank=True))
         
         y_pos += 0.7
-    
-    # 슬라이드 3: SDV 개요
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    deck.emit(slide, shapes)
+    return slide
+
+
+def _slide_03(deck):
+    """슬라이드 3: SDV 개요"""
+    slide = deck.new_slide()
     
     # 타이틀 밴드
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "01. SDV 패러다임 전환"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    deck.header_bar(slide, "01. SDV 패러다임 전환")
     
     # SDV 정의
     def_box = slide.shapes.add_shape(
@@ -245,28 +223,15 @@ def create_keti_style_presentation():
     p.font.size = Pt(16)
     p.font.color.rgb = KETI_GRAY
     p.alignment = PP_ALIGN.CENTER
-    
-    # 슬라이드 4: 중국 전략
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    return slide
+
+
+def _slide_04(deck):
+    """슬라이드 4: 중국 전략"""
+    slide = deck.new_slide()
     
     # 타이틀 밴드
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "02. 중국 SDV 표준화 전략"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    deck.header_bar(slide, "02. 중국 SDV 표준화 전략")
     
     # CAAM 소개
     caam_box = slide.shapes.add_shape(
@@ -328,28 +293,15 @@ def create_keti_style_presentation():
         p.line_spacing = 1.3
         
         x_pos += 5.2
-    
-    # 슬라이드 5: 참여사 (확장)
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    return slide
+
+
+def _slide_05(deck):
+    """슬라이드 5: 참여사 (확장)"""
+    slide = deck.new_slide()
     
     # 타이틀 밴드
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "03. 표준 개발 핵심 참여사"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    deck.header_bar(slide, "03. 표준 개발 핵심 참여사")
     
     # OEM 섹션
     oem_section = slide.shapes.add_shape(
@@ -452,28 +404,15 @@ def create_keti_style_presentation():
     p.font.bold = True
     p.font.color.rgb = RGBColor(255, 255, 255)
     p.alignment = PP_ALIGN.CENTER
-    
-    # 슬라이드 6: 4-Layer 아키텍처 (상세)
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    return slide
+
+
+def _slide_06(deck):
+    """슬라이드 6: 4-Layer 아키텍처 (상세)"""
+    slide = deck.new_slide()
     
     # 타이틀 밴드
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "04. SDV 4-Layer 아키텍처"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    deck.header_bar(slide, "04. SDV 4-Layer 아키텍처")
     
     # 계층 다이어그램
     layers = [
@@ -483,81 +422,43 @@ def create_keti_style_presentation():
         ("기초 플랫폼 계층", "OS, 하드웨어, 드라이버", RGBColor(150, 200, 255))
     ]
     
+    shapes = []
     for i, (name, desc, color) in enumerate(layers):
-        layer_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(2), Inches(1.8 + i*1.4),
-            Inches(8), Inches(1.2)
-        )
-        layer_box.fill.solid()
-        layer_box.fill.fore_color.rgb = color
-        
-        text_frame = layer_box.text_frame
-        text_frame.clear()
-        text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-        
-        p = text_frame.add_paragraph()
-        p.text = f"{name}: {desc}"
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.alignment = PP_ALIGN.CENTER
+        shapes.append(ShapeSpec(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2), Inches(1.8 + i*1.4), Inches(8), Inches(1.2),
+            BoxStyle(fill=color, anchor=MSO_VERTICAL_ANCHOR.MIDDLE),
+            ((f"{name}: {desc}", TextStyle(size=Pt(18), bold=True, align=PP_ALIGN.CENTER)),),
+            leading_blank=True))
         
         # 화살표
         if i < 3:
-            arrow_box = slide.shapes.add_textbox(Inches(5.8), Inches(3 + i*1.4), Inches(0.5), Inches(0.3))
-            arrow_frame = arrow_box.text_frame
-            arrow_frame.clear()
-            p = arrow_frame.add_paragraph()
-            p.text = "⬇"
-            p.font.size = Pt(20)
-            p.font.color.rgb = KETI_BLUE
-            p.alignment = PP_ALIGN.CENTER
+            shapes.append(ShapeSpec(
+                "textbox", Inches(5.8), Inches(3 + i*1.4), Inches(0.5), Inches(0.3),
+                paragraphs=(("⬇", TextStyle(size=Pt(20), color=KETI_BLUE, align=PP_ALIGN.CENTER)),),
+                leading_blank=True))
     
     # 특징 설명
-    feature_box = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(10.5), Inches(1.8),
-        Inches(4.5), Inches(5.4)
-    )
-    feature_box.fill.solid()
-    feature_box.fill.fore_color.rgb = KETI_LIGHT_BLUE
-    
-    text_frame = feature_box.text_frame
-    text_frame.clear()
-    text_frame.margin_all = Inches(0.3)
-    
-    p = text_frame.add_paragraph()
-    p.text = "핵심 특징"
-    p.font.size = Pt(20)
-    p.font.bold = True
-    p.font.color.rgb = KETI_NAVY
-    
-    p = text_frame.add_paragraph()
-    p.text = "\n✓ 계층 간 독립성\n\n✓ 표준화된 인터페이스\n\n✓ 하드웨어 추상화\n\n✓ 소프트웨어 재사용성\n\n✓ 개발 복잡도 감소"
-    p.font.size = Pt(16)
-    p.line_spacing = 1.5
-    
-    # 슬라이드 7-11: Part 1 Atomic Service API (5페이지로 확장)
-    # 슬라이드 7: Part 1 개요
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    shapes.append(ShapeSpec(
+        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(10.5), Inches(1.8), Inches(4.5), Inches(5.4),
+        BoxStyle(fill=KETI_LIGHT_BLUE),
+        (("핵심 특징", TextStyle(size=Pt(20), bold=True, color=KETI_NAVY)),
+         ("\n✓ 계층 간 독립성\n\n✓ 표준화된 인터페이스\n\n✓ 하드웨어 추상화\n\n✓ 소프트웨어 재사용성\n\n✓ 개발 복잡도 감소",
+          TextStyle(size=Pt(16), line_spacing=1.5))),
+        leading_blank=True))
+    deck.emit(slide, shapes)
+    return slide
+
+
+# 슬라이드 7-11: Part 1 Atomic Service API (5페이지로 확장)
+    return slide
+
+
+def _slide_07(deck):
+    """슬라이드 7: Part 1 개요"""
+    slide = deck.new_slide()
     
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "05. Part 1: Atomic Service API Overview"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "05. Part 1: Atomic Service API Overview")
     
     # 6대 도메인 헥사곤 배치
     domains = [
@@ -612,27 +513,15 @@ def create_keti_style_presentation():
     p.font.bold = True
     p.font.color.rgb = KETI_NAVY
     p.alignment = PP_ALIGN.CENTER
+    return slide
+
+
+def _slide_08(deck):
+    """슬라이드 8: BCM 도메인 상세"""
+    slide = deck.new_slide()
     
-    # 슬라이드 8: BCM 도메인 상세
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "05-1. BCM Domain: Body Control Module"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "05-1. BCM Domain: Body Control Module")
     
     # BCM 서비스 리스트
     services = [
@@ -684,27 +573,15 @@ def create_keti_style_presentation():
         p.font.color.rgb = KETI_BLUE
         
         y_pos += 1
+    return slide
+
+
+def _slide_09(deck):
+    """슬라이드 9: TMS/VCS/EMS 도메인"""
+    slide = deck.new_slide()
     
-    # 슬라이드 9: TMS/VCS/EMS 도메인
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "05-2. TMS/VCS/EMS Domains"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "05-2. TMS/VCS/EMS Domains")
     
     # 3개 도메인 박스
     domain_data = [
@@ -750,27 +627,15 @@ def create_keti_style_presentation():
             p.line_spacing = 1.5
         
         x_pos += 5.2
+    return slide
+
+
+def _slide_10(deck):
+    """슬라이드 10: ADAS 도메인"""
+    slide = deck.new_slide()
     
-    # 슬라이드 10: ADAS 도메인
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "05-3. ADAS Domain: Advanced Driver-Assistance"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "05-3. ADAS Domain: Advanced Driver-Assistance")
     
     # ADAS 센서 이미지 플레이스홀더
     sensor_image = slide.shapes.add_shape(
@@ -834,27 +699,15 @@ def create_keti_style_presentation():
     p.font.size = Pt(14)
     p.font.color.rgb = KETI_GRAY
     p.alignment = PP_ALIGN.CENTER
+    return slide
+
+
+def _slide_11(deck):
+    """슬라이드 11: 시나리오 예시"""
+    slide = deck.new_slide()
     
-    # 슬라이드 11: 시나리오 예시
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "05-4. 시나리오: '퇴근 모드' 구현"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "05-4. 시나리오: '퇴근 모드' 구현")
     
     # 시나리오 플로우
     steps = [
@@ -907,28 +760,19 @@ def create_keti_style_presentation():
         p.alignment = PP_ALIGN.CENTER
         
         y_pos += 1.2
+    return slide
+
+
+# 슬라이드 12-15: Part 2 Device Abstraction API (4페이지)
+    return slide
+
+
+def _slide_12(deck):
+    """슬라이드 12: Part 2 개요"""
+    slide = deck.new_slide()
     
-    # 슬라이드 12-15: Part 2 Device Abstraction API (4페이지)
-    # 슬라이드 12: Part 2 개요
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "06. Part 2: Device Abstraction API Overview"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "06. Part 2: Device Abstraction API Overview")
     
     # 5대 도메인
     domains = [
@@ -982,27 +826,15 @@ def create_keti_style_presentation():
     p.font.bold = True
     p.font.color.rgb = RGBColor(255, 255, 255)
     p.alignment = PP_ALIGN.CENTER
+    return slide
+
+
+def _slide_13(deck):
+    """슬라이드 13: 센서와 액추에이터"""
+    slide = deck.new_slide()
     
-    # 슬라이드 13: 센서와 액추에이터
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "06-1. Sensors & Actuators"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "06-1. Sensors & Actuators")
     
     # 센서 섹션
     sensor_section = slide.shapes.add_shape(
@@ -1075,27 +907,15 @@ def create_keti_style_presentation():
         p.text = actuator
         p.font.size = Pt(14)
         p.line_spacing = 1.5
+    return slide
+
+
+def _slide_14(deck):
+    """슬라이드 14: PWT 파워트레인 도메인"""
+    slide = deck.new_slide()
     
-    # 슬라이드 14: PWT 파워트레인 도메인
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "06-2. Powertrain Domain (전기차 중심)"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "06-2. Powertrain Domain (전기차 중심)")
     
     # 전기차 파워트레인 이미지
     ev_image = slide.shapes.add_shape(
@@ -1157,27 +977,15 @@ def create_keti_style_presentation():
     p.font.size = Pt(14)
     p.font.color.rgb = KETI_GRAY
     p.alignment = PP_ALIGN.CENTER
+    return slide
+
+
+def _slide_15(deck):
+    """슬라이드 15: API 연관 관계"""
+    slide = deck.new_slide()
     
-    # 슬라이드 15: API 연관 관계
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "06-3. API 계층 간 호출 흐름"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "06-3. API 계층 간 호출 흐름")
     
     # 호출 흐름도
     flow_data = [
@@ -1218,27 +1026,15 @@ def create_keti_style_presentation():
             p.alignment = PP_ALIGN.CENTER
         
         y_pos += 1.3
+    return slide
+
+
+def _slide_16(deck):
+    """슬라이드 16: Version 4 개선사항"""
+    slide = deck.new_slide()
     
-    # 슬라이드 16: Version 4 개선사항
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "07. Version 4 주요 개선사항"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "07. Version 4 주요 개선사항")
     
     # 버전 비교
     version_box = slide.shapes.add_shape(
@@ -1284,28 +1080,19 @@ def create_keti_style_presentation():
         p.alignment = PP_ALIGN.CENTER
         
         y_pos += 1.1
+    return slide
+
+
+# 슬라이드 17-18: 글로벌 비교 (2페이지)
+    return slide
+
+
+def _slide_17(deck):
+    """슬라이드 17: 표준 비교 테이블"""
+    slide = deck.new_slide()
     
-    # 슬라이드 17-18: 글로벌 비교 (2페이지)
-    # 슬라이드 17: 표준 비교 테이블
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "08. 글로벌 SDV 표준 비교"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "08. 글로벌 SDV 표준 비교")
     
     # 비교 테이블 (시각적으로 개선)
     standards = [
@@ -1368,27 +1155,15 @@ def create_keti_style_presentation():
             p.alignment = PP_ALIGN.CENTER
         
         y_pos += 1
+    return slide
+
+
+def _slide_18(deck):
+    """슬라이드 18: 경쟁 환경 분석"""
+    slide = deck.new_slide()
     
-    # 슬라이드 18: 경쟁 환경 분석
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "08-1. SDV 표준 경쟁 구도"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "08-1. SDV 표준 경쟁 구도")
     
     # 경쟁 구도 다이어그램
     # 중국
@@ -1465,28 +1240,19 @@ def create_keti_style_presentation():
     p.text = "\n• 클라우드 네이티브\n• 오픈소스\n• IT 기업 주도\n• 혁신 중심"
     p.font.size = Pt(14)
     p.line_spacing = 1.5
+    return slide
+
+
+# 슬라이드 19-21: 한국 대응 전략 (3페이지)
+    return slide
+
+
+def _slide_19(deck):
+    """슬라이드 19: 현황 분석"""
+    slide = deck.new_slide()
     
-    # 슬라이드 19-21: 한국 대응 전략 (3페이지)
-    # 슬라이드 19: 현황 분석
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "09. 한국 SDV 현황 분석"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "09. 한국 SDV 현황 분석")
     
     # SWOT 분석
     swot_data = [
@@ -1529,27 +1295,15 @@ def create_keti_style_presentation():
             y_pos += 2.8
         else:
             x_pos += 7.5
+    return slide
+
+
+def _slide_20(deck):
+    """슬라이드 20: K-SDV 전략 제안"""
+    slide = deck.new_slide()
     
-    # 슬라이드 20: K-SDV 전략 제안
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "09-1. K-SDV 표준 제안"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "09-1. K-SDV 표준 제안")
     
     # 전략 방향
     strategies = [
@@ -1613,27 +1367,15 @@ def create_keti_style_presentation():
     p.font.size = Pt(16)
     p.font.color.rgb = KETI_GRAY
     p.alignment = PP_ALIGN.CENTER
+    return slide
+
+
+def _slide_21(deck):
+    """슬라이드 21: 로드맵"""
+    slide = deck.new_slide()
     
-    # 슬라이드 21: 로드맵
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "09-2. K-SDV 추진 로드맵"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "09-2. K-SDV 추진 로드맵")
     
     # 로드맵 타임라인
     timeline_data = [
@@ -1698,27 +1440,15 @@ def create_keti_style_presentation():
             p.alignment = PP_ALIGN.CENTER
         
         x_pos += 3.8
+    return slide
+
+
+def _slide_22(deck):
+    """슬라이드 22: 시사점"""
+    slide = deck.new_slide()
     
-    # 슬라이드 22: 시사점
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "10. 종합 시사점"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "10. 종합 시사점")
     
     # 핵심 메시지
     key_msg = slide.shapes.add_shape(
@@ -1763,27 +1493,15 @@ def create_keti_style_presentation():
         p.font.color.rgb = KETI_NAVY
         
         y_pos += 0.8
+    return slide
+
+
+def _slide_23(deck):
+    """슬라이드 23: 향후 과제"""
+    slide = deck.new_slide()
     
-    # 슬라이드 23: 향후 과제
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
-    
-    title_band = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    title_band.fill.solid()
-    title_band.fill.fore_color.rgb = KETI_NAVY
-    title_band.line.fill.background()
-    
-    title_text = title_band.text_frame
-    title_text.clear()
-    title_text.margin_left = Inches(0.5)
-    p = title_text.add_paragraph()
-    p.text = "11. 향후 과제"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    # 타이틀 밴드
+    deck.header_bar(slide, "11. 향후 과제")
     
     # 과제 카테고리
     tasks = [
@@ -1826,9 +1544,12 @@ def create_keti_style_presentation():
             y_pos += 2.8
         else:
             x_pos += 7.8
-    
-    # 슬라이드 24: Q&A
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    return slide
+
+
+def _slide_24(deck):
+    """슬라이드 24: Q&A"""
+    slide = deck.new_slide()
     
     # 배경 그라데이션 효과
     bg_box = slide.shapes.add_shape(
@@ -1862,9 +1583,12 @@ def create_keti_style_presentation():
     p.font.size = Pt(32)
     p.font.color.rgb = RGBColor(200, 200, 200)
     p.alignment = PP_ALIGN.CENTER
-    
-    # 슬라이드 25: 연락처
-    slide = prs.slides.add_slide(prs.slide_layouts[5] if len(prs.slide_layouts) > 5 else prs.slide_layouts[0])
+    return slide
+
+
+def _slide_25(deck):
+    """슬라이드 25: 연락처"""
+    slide = deck.new_slide()
     
     # KETI 로고 플레이스홀더
     logo_box = slide.shapes.add_shape(
@@ -1921,10 +1645,68 @@ def create_keti_style_presentation():
     p.font.size = Pt(18)
     p.font.color.rgb = KETI_BLUE
     p.alignment = PP_ALIGN.CENTER
+    return slide
+
+
+# 발표 순서대로의 슬라이드 함수 (함수 하나가 슬라이드 한 장)
+SLIDES = (
+    _slide_01, _slide_02, _slide_03, _slide_04, _slide_05,
+    _slide_06, _slide_07, _slide_08, _slide_09, _slide_10,
+    _slide_11, _slide_12, _slide_13, _slide_14, _slide_15,
+    _slide_16, _slide_17, _slide_18, _slide_19, _slide_20,
+    _slide_21, _slide_22, _slide_23, _slide_24, _slide_25,
+)
+
+
+def create_keti_style_presentation(template_path=TEMPLATE_FILE, incremental=None):
+    """KETI 스타일 25페이지 PPT 생성 (15분 발표용)
+
+    incremental(IncrementalBuild) 을 주면 입력이 그대로인 슬라이드는 이전 출력에서 복제한다.
+    """
+    
+    # 기존 KETI PPT를 템플릿으로 사용
+    if os.path.exists(template_path):
+        # 템플릿의 마스터/레이아웃만 담은 테마 팩 (템플릿 해시로 캐시)
+        prs = load_theme_pack(template_path)
+        deck = SlideBuilder(THEME, prs)
+    else:
+        deck = SlideBuilder(THEME)
+        prs = deck.prs
+    
+    for number, add_slide in enumerate(SLIDES, start=1):
+        if incremental is None:
+            add_slide(deck)
+        else:
+            key = _slide_key(add_slide, number, template_path)
+            incremental.slide(deck, key, add_slide, deck)
     
     return prs
 
+
+def _slide_key(add_slide, number, template_path):
+    """슬라이드 함수 소스, 색상/테마, 페이지 번호, 템플릿 파일로 만든 증분 빌드 키"""
+    colors = (KETI_BLUE, KETI_NAVY, KETI_LIGHT_BLUE, KETI_GRAY)
+    return slide_key(inspect.getsource(add_slide), colors, THEME, number, files=[template_path])
+
+
 # 프레젠테이션 생성 및 저장
-prs = create_keti_style_presentation()
-prs.save('/home/kim/github-sdv/China_SDV_Standard_KETI_Style_25pages.pptx')
-print("KETI 스타일 25페이지 프레젠테이션이 생성되었습니다: China_SDV_Standard_KETI_Style_25pages.pptx")
\ No newline at end of file
+def build(output_file=OUTPUT_FILE, incremental=False):
+    """KETI 스타일 덱 생성 후 저장, 전체 페이지 수 반환
+
+    incremental=True 이면 이전 출력에서 바뀌지 않은 슬라이드를 복제해 재사용한다.
+    """
+    if incremental:
+        previous = IncrementalBuild(output_file)
+        prs = create_keti_style_presentation(incremental=previous)
+        previous.save(prs)
+    else:
+        prs = create_keti_style_presentation()
+        save_presentation(prs, output_file)
+    return len(prs.slides)
+
+def main():
+    build()
+    print("KETI 스타일 25페이지 프레젠테이션이 생성되었습니다: China_SDV_Standard_KETI_Style_25pages.pptx")
+
+if __name__ == "__main__":
+    main()
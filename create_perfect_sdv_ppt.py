@@ -7,17 +7,15 @@
 - 전문적인 레이아웃
 """
 
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.enum.shapes import MSO_SHAPE
 import os
 
-# 프레젠테이션 생성 (16:9 비율)
-prs = Presentation()
-prs.slide_width = Inches(16)
-prs.slide_height = Inches(9)
+from sdvdeck.builder import SlideBuilder, Theme, TextStyle, StackStyle, BoxStyle, page_style
+
+OUTPUT_FILE = 'China_SDV_Standard_V4_Complete_Analysis.pptx'
 
 # KETI 색상 정의
 KETI_BLUE = RGBColor(0, 82, 147)
@@ -28,217 +26,98 @@ BLACK = RGBColor(0, 0, 0)
 WHITE = RGBColor(255, 255, 255)
 DARK_GRAY = RGBColor(64, 64, 64)
 
-def safe_add_textbox(slide, left, top, width, height):
-    """안전하게 텍스트박스 추가 (화면 벗어나지 않도록)"""
-    # 화면 크기 체크
-    max_width = prs.slide_width - left
-    max_height = prs.slide_height - top
-    
-    # 크기 조정
-    if width > max_width:
-        width = max_width - Inches(0.1)
-    if height > max_height:
-        height = max_height - Inches(0.1)
-    
-    return slide.shapes.add_textbox(left, top, width, height)
+# 테마 (텍스트박스는 화면을 벗어나지 않도록 자동 조정)
+THEME = Theme(
+    name="v4_complete",
+    header_color=KETI_BLUE,
+    header_line=KETI_BLUE,
+    title=TextStyle(size=Pt(32), bold=True, color=WHITE, align=PP_ALIGN.LEFT),
+    title_box=(Inches(0.5), Inches(0.3), Inches(14), Inches(0.8)),
+    stack=StackStyle(
+        heading=TextStyle(size=Pt(24), bold=True, color=KETI_NAVY),
+        bullet=TextStyle(size=Pt(18), color=DARK_GRAY),
+        item=TextStyle(size=Pt(20), color=DARK_GRAY),
+        heading_step=Inches(0.8),
+        bullet_shrink=Inches(1),
+        bullet_step=Inches(0.6),
+        item_height=Inches(0.6),
+        item_step=Inches(0.7),
+    ),
+    page=page_style(KETI_GRAY),
+    clamp_to_slide=True,
+)
+
+# V3/V4 비교 컬럼 스타일
+COLUMN_HEADER = TextStyle(size=Pt(22), bold=True, color=KETI_NAVY, align=PP_ALIGN.CENTER)
+COLUMN_ITEMS = StackStyle(
+    heading=COLUMN_HEADER,
+    bullet=THEME.stack.bullet,
+    item=TextStyle(size=Pt(16), color=DARK_GRAY),
+)
+
+# 테이블 슬라이드 헤더: 테두리 색/왼쪽 정렬 없이 그리던 기존 모양 유지
+TABLE_HEADER = BoxStyle(fill=KETI_BLUE)
+TABLE_TITLE = TextStyle(size=Pt(32), bold=True, color=WHITE)
 
-def add_title_slide():
+def add_title_slide(deck):
     """타이틀 슬라이드"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # 빈 슬라이드
-    
-    # 배경색
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = KETI_NAVY
+    slide = deck.new_slide(background=KETI_NAVY)  # 빈 슬라이드
     
     # 메인 타이틀
-    title_box = safe_add_textbox(slide, Inches(1), Inches(2), Inches(14), Inches(2))
-    title = title_box.text_frame
-    title.text = "중국 SDV 표준 Version 4 Beta 1 분석"
-    title.paragraphs[0].font.size = Pt(48)
-    title.paragraphs[0].font.bold = True
-    title.paragraphs[0].font.color.rgb = WHITE
-    title.paragraphs[0].alignment = PP_ALIGN.CENTER
+    deck.text(slide, "중국 SDV 표준 Version 4 Beta 1 분석",
+              Inches(1), Inches(2), Inches(14), Inches(2),
+              TextStyle(size=Pt(48), bold=True, color=WHITE, align=PP_ALIGN.CENTER))
     
     # 서브타이틀
-    subtitle_box = safe_add_textbox(slide, Inches(1), Inches(4.5), Inches(14), Inches(1))
-    subtitle = subtitle_box.text_frame
-    subtitle.text = "SDV Intelligent Connected Vehicle Service Interface Specification"
-    subtitle.paragraphs[0].font.size = Pt(24)
-    subtitle.paragraphs[0].font.color.rgb = KETI_LIGHT_BLUE
-    subtitle.paragraphs[0].alignment = PP_ALIGN.CENTER
+    deck.text(slide, "SDV Intelligent Connected Vehicle Service Interface Specification",
+              Inches(1), Inches(4.5), Inches(14), Inches(1),
+              TextStyle(size=Pt(24), color=KETI_LIGHT_BLUE, align=PP_ALIGN.CENTER))
     
     # 발표자 정보
-    info_box = safe_add_textbox(slide, Inches(1), Inches(6.5), Inches(14), Inches(1.5))
-    info = info_box.text_frame
-    info.text = "한국전자기술연구원 (KETI)\n모빌리티플랫폼연구센터\n2025년 8월"
-    for para in info.paragraphs:
-        para.font.size = Pt(18)
-        para.font.color.rgb = WHITE
-        para.alignment = PP_ALIGN.CENTER
-
-def add_content_slide(title_text, content_items, slide_number):
+    deck.text(slide, "한국전자기술연구원 (KETI)\n모빌리티플랫폼연구센터\n2025년 8월",
+              Inches(1), Inches(6.5), Inches(14), Inches(1.5),
+              TextStyle(size=Pt(18), color=WHITE, align=PP_ALIGN.CENTER), style_all=True)
+
+def add_content_slide(deck, title_text, content_items, slide_number):
     """컨텐츠 슬라이드 (개선된 레이아웃)"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    
-    # 상단 바
-    header_rect = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    header_rect.fill.solid()
-    header_rect.fill.fore_color.rgb = KETI_BLUE
-    header_rect.line.color.rgb = KETI_BLUE
-    
-    # 타이틀 (검정색으로 변경)
-    title_box = safe_add_textbox(slide, Inches(0.5), Inches(0.3), Inches(14), Inches(0.8))
-    title = title_box.text_frame
-    title.text = title_text
-    title.paragraphs[0].font.size = Pt(32)
-    title.paragraphs[0].font.bold = True
-    title.paragraphs[0].font.color.rgb = WHITE
-    title.paragraphs[0].alignment = PP_ALIGN.LEFT
+    slide = deck.content_slide(title_text)
     
     # 컨텐츠 영역
-    content_top = Inches(1.8)
-    for i, item in enumerate(content_items):
-        if isinstance(item, dict):
-            # 헤딩
-            if 'heading' in item:
-                heading_box = safe_add_textbox(slide, Inches(1), content_top, Inches(14), Inches(0.6))
-                heading = heading_box.text_frame
-                heading.text = item['heading']
-                heading.paragraphs[0].font.size = Pt(24)
-                heading.paragraphs[0].font.bold = True
-                heading.paragraphs[0].font.color.rgb = KETI_NAVY
-                content_top += Inches(0.8)
-            
-            # 불릿 포인트
-            if 'bullets' in item:
-                for bullet in item['bullets']:
-                    bullet_box = safe_add_textbox(slide, Inches(1.5), content_top, Inches(13), Inches(0.5))
-                    bullet_text = bullet_box.text_frame
-                    bullet_text.text = f"• {bullet}"
-                    bullet_text.paragraphs[0].font.size = Pt(18)
-                    bullet_text.paragraphs[0].font.color.rgb = DARK_GRAY
-                    content_top += Inches(0.6)
-        else:
-            # 단순 텍스트
-            text_box = safe_add_textbox(slide, Inches(1), content_top, Inches(14), Inches(0.6))
-            text = text_box.text_frame
-            text.text = f"• {item}"
-            text.paragraphs[0].font.size = Pt(20)
-            text.paragraphs[0].font.color.rgb = DARK_GRAY
-            content_top += Inches(0.7)
+    deck.bullet_stack(slide, content_items, Inches(1), Inches(1.8), Inches(14),
+                      continue_slide=deck.continuation(title_text, Inches(1.8),
+                                                      slide_number=slide_number))
     
     # 페이지 번호
-    page_box = safe_add_textbox(slide, Inches(14.5), Inches(8.3), Inches(1), Inches(0.5))
-    page = page_box.text_frame
-    page.text = str(slide_number)
-    page.paragraphs[0].font.size = Pt(12)
-    page.paragraphs[0].font.color.rgb = KETI_GRAY
-    page.paragraphs[0].alignment = PP_ALIGN.RIGHT
-
-def add_comparison_slide(title_text, v3_items, v4_items, slide_number):
+    deck.page_number(slide, slide_number)
+
+def add_comparison_slide(deck, title_text, v3_items, v4_items, slide_number):
     """V3 vs V4 비교 슬라이드"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    
-    # 헤더
-    header_rect = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    header_rect.fill.solid()
-    header_rect.fill.fore_color.rgb = KETI_BLUE
-    header_rect.line.color.rgb = KETI_BLUE
-    
-    # 타이틀
-    title_box = safe_add_textbox(slide, Inches(0.5), Inches(0.3), Inches(14), Inches(0.8))
-    title = title_box.text_frame
-    title.text = title_text
-    title.paragraphs[0].font.size = Pt(32)
-    title.paragraphs[0].font.bold = True
-    title.paragraphs[0].font.color.rgb = WHITE
+    slide = deck.content_slide(title_text)
     
     # V3 컬럼
-    v3_header_box = safe_add_textbox(slide, Inches(1), Inches(1.8), Inches(6.5), Inches(0.8))
-    v3_header = v3_header_box.text_frame
-    v3_header.text = "Version 3 Beta 1 (2022.06)"
-    v3_header.paragraphs[0].font.size = Pt(22)
-    v3_header.paragraphs[0].font.bold = True
-    v3_header.paragraphs[0].font.color.rgb = KETI_NAVY
-    v3_header.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    # V3 내용
-    v3_top = Inches(2.8)
-    for item in v3_items:
-        item_box = safe_add_textbox(slide, Inches(1), v3_top, Inches(6.5), Inches(0.5))
-        item_text = item_box.text_frame
-        item_text.text = f"• {item}"
-        item_text.paragraphs[0].font.size = Pt(16)
-        item_text.paragraphs[0].font.color.rgb = DARK_GRAY
-        v3_top += Inches(0.6)
+    deck.text(slide, "Version 3 Beta 1 (2022.06)", Inches(1), Inches(1.8), Inches(6.5), Inches(0.8),
+              COLUMN_HEADER)
+    deck.bullet_stack(slide, v3_items, Inches(1), Inches(2.8), Inches(6.5), COLUMN_ITEMS)
     
     # 구분선
-    line = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(7.8), Inches(1.8),
-        Inches(0.4), Inches(5.5)
-    )
-    line.fill.solid()
-    line.fill.fore_color.rgb = KETI_LIGHT_BLUE
-    line.line.color.rgb = KETI_LIGHT_BLUE
+    deck.shape(slide, MSO_SHAPE.RECTANGLE,
+               Inches(7.8), Inches(1.8), Inches(0.4), Inches(5.5),
+               BoxStyle(fill=KETI_LIGHT_BLUE, line=KETI_LIGHT_BLUE))
     
     # V4 컬럼
-    v4_header_box = safe_add_textbox(slide, Inches(8.5), Inches(1.8), Inches(6.5), Inches(0.8))
-    v4_header = v4_header_box.text_frame
-    v4_header.text = "Version 4 Beta 1 (2022.12)"
-    v4_header.paragraphs[0].font.size = Pt(22)
-    v4_header.paragraphs[0].font.bold = True
-    v4_header.paragraphs[0].font.color.rgb = KETI_NAVY
-    v4_header.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    # V4 내용
-    v4_top = Inches(2.8)
-    for item in v4_items:
-        item_box = safe_add_textbox(slide, Inches(8.5), v4_top, Inches(6.5), Inches(0.5))
-        item_text = item_box.text_frame
-        item_text.text = f"• {item}"
-        item_text.paragraphs[0].font.size = Pt(16)
-        item_text.paragraphs[0].font.color.rgb = DARK_GRAY
-        v4_top += Inches(0.6)
+    deck.text(slide, "Version 4 Beta 1 (2022.12)", Inches(8.5), Inches(1.8), Inches(6.5), Inches(0.8),
+              COLUMN_HEADER)
+    deck.bullet_stack(slide, v4_items, Inches(8.5), Inches(2.8), Inches(6.5), COLUMN_ITEMS)
     
     # 페이지 번호
-    page_box = safe_add_textbox(slide, Inches(14.5), Inches(8.3), Inches(1), Inches(0.5))
-    page = page_box.text_frame
-    page.text = str(slide_number)
-    page.paragraphs[0].font.size = Pt(12)
-    page.paragraphs[0].font.color.rgb = KETI_GRAY
-    page.paragraphs[0].alignment = PP_ALIGN.RIGHT
-
-def add_table_slide(title_text, table_data, slide_number):
+    deck.page_number(slide, slide_number)
+
+def add_table_slide(deck, title_text, table_data, slide_number):
     """테이블 슬라이드"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    
-    # 헤더
-    header_rect = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(16), Inches(1.2)
-    )
-    header_rect.fill.solid()
-    header_rect.fill.fore_color.rgb = KETI_BLUE
-    
-    # 타이틀
-    title_box = safe_add_textbox(slide, Inches(0.5), Inches(0.3), Inches(14), Inches(0.8))
-    title = title_box.text_frame
-    title.text = title_text
-    title.paragraphs[0].font.size = Pt(32)
-    title.paragraphs[0].font.bold = True
-    title.paragraphs[0].font.color.rgb = WHITE
+    slide = deck.new_slide()
+    deck.shape(slide, MSO_SHAPE.RECTANGLE, 0, 0, THEME.slide_width, THEME.header_height,
+               TABLE_HEADER)
+    deck.title(slide, title_text, TABLE_TITLE)
     
     # 테이블 추가
     rows = len(table_data)
@@ -273,704 +152,735 @@ def add_table_slide(title_text, table_data, slide_number):
             para.alignment = PP_ALIGN.CENTER
     
     # 페이지 번호
-    page_box = safe_add_textbox(slide, Inches(14.5), Inches(8.3), Inches(1), Inches(0.5))
-    page = page_box.text_frame
-    page.text = str(slide_number)
-    page.paragraphs[0].font.size = Pt(12)
-    page.paragraphs[0].font.color.rgb = KETI_GRAY
-    page.paragraphs[0].alignment = PP_ALIGN.RIGHT
-
-# 슬라이드 생성
-slide_num = 1
-
-# 1. 타이틀 슬라이드
-add_title_slide()
-slide_num += 1
-
-# 2. 목차
-add_content_slide(
-    "목차",
-    [
-        "1. SDV (Software Defined Vehicle) 개요",
-        "2. 중국 SDV 표준화 현황",
-        "3. Version 3 → Version 4 주요 변경사항",
-        "4. Part 1: 아토믹 서비스 API",
-        "5. Part 2: 디바이스 추상화 API",
-        "6. 4계층 아키텍처 상세",
-        "7. 주요 참여 기업 현황",
-        "8. 글로벌 표준과의 비교",
-        "9. 한국의 대응 전략",
-        "10. Q&A"
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 3. SDV 개요
-add_content_slide(
-    "SDV (Software Defined Vehicle) 개요",
-    [
-        {
-            'heading': 'SDV의 정의',
-            'bullets': [
-                '차량의 기능과 성능이 소프트웨어에 의해 정의되는 차량',
-                '하드웨어와 소프트웨어의 완전한 분리 (Decoupling)',
-                'OTA 업데이트를 통한 지속적인 기능 개선'
-            ]
-        },
-        {
-            'heading': 'SDV의 핵심 특징',
-            'bullets': [
-                '서비스 지향 아키텍처 (Service-Oriented Architecture)',
-                '클라우드 네이티브 기술 적용',
-                '표준화된 API를 통한 개발 효율성 향상',
-                '새로운 비즈니스 모델 창출 (MaaS, Feature on Demand)'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 4. 중국 SDV 표준화 현황
-add_content_slide(
-    "중국 SDV 표준화 현황",
-    [
-        {
-            'heading': '표준 개요',
-            'bullets': [
-                '표준명: SDV/T 001-2022',
-                '주관: 중국자동차공업협회(CAAM) 소프트웨어 분과',
-                '최신 버전: Version 4 Beta 1 (2022년 12월)',
-                '참여 기업: 60개 이상'
-            ]
-        },
-        {
-            'heading': '전략적 목표',
-            'bullets': [
-                '통일된 개발 표준 수립',
-                '중국 고유의 SDV 생태계 구축',
-                '글로벌 SDV 시장 주도권 확보',
-                '자동차 산업 디지털 전환 가속화'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 5. V3 → V4 주요 변경사항
-add_comparison_slide(
-    "Version 3 → Version 4 주요 변경사항",
-    [
-        "API 총 개수: 450개",
-        "BCM_Seat: notifyOccupiedStatus() only",
-        "BCM_WiperWash: 기본 API만 제공",
-        "TMS_Battery: 기본 제어 기능",
-        "4단계 오류 등급 (FAULT_LEVEL1~4)",
-        "기본적인 센서 API"
-    ],
-    [
-        "API 총 개수: 520개 이상 (15% 증가)",
-        "BCM_Seat: getOccupiedStatus() 추가",
-        "BCM_WiperWash: setWipingLevelImme() 추가",
-        "TMS_Battery: WorkMode 관련 API 3개 추가",
-        "8단계 오류 등급 (FAULT_LEVEL1~8)",
-        "6개의 새로운 모터 서비스 추가"
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 6. Part 1: 아토믹 서비스 API - 도메인별 구성
-add_table_slide(
-    "Part 1: 아토믹 서비스 API - 6대 도메인",
-    [
-        ["도메인", "서비스 수", "주요 기능", "Version 4 신규"],
-        ["BCM (차체제어)", "31개", "도어, 창문, 시트, 조명", "+2 서비스"],
-        ["TMS (열관리)", "8개", "공조, 배터리 열관리", "+3 API"],
-        ["VCS (차량제어)", "12개", "기어, 브레이크, 조향", "변경 없음"],
-        ["EMS (에너지)", "15개", "충전, 배터리 관리", "+2 API"],
-        ["ADAS (지능형)", "18개", "인지, 센서 융합", "기능 강화"],
-        ["HMI (인터페이스)", "10개", "디스플레이, 오디오", "변경 없음"]
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 7. Part 1: BCM 도메인 상세
-add_content_slide(
-    "Part 1: BCM 도메인 주요 API (Version 4 신규)",
-    [
-        {
-            'heading': 'BCM_SafetyBelt (신규 서비스)',
-            'bullets': [
-                'getBuckleStatus(): 안전벨트 버클 상태 확인',
-                'notifyBuckleStatus(): 버클 상태 변경 알림'
-            ]
-        },
-        {
-            'heading': 'BCM_ScreenAdjust (신규 서비스)',
-            'bullets': [
-                'fold()/unfold(): 스크린 접기/펴기',
-                'adjustPosition(): 스크린 위치 조절',
-                'notifyAntiPinch(): 끼임 방지 알림'
-            ]
-        },
-        {
-            'heading': 'BCM_SeatExtended (확장 기능)',
-            'bullets': [
-                'adjustFootRestAngle(): 발 받침대 각도 조절',
-                'getFootRestAngle(): 발 받침대 각도 확인',
-                'startAdjustFootRestAngle(): 조절 시작',
-                'stopAdjustFootRestAngle(): 조절 중지'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 8. Part 2: 디바이스 추상화 API
-add_table_slide(
-    "Part 2: 디바이스 추상화 API - 5대 도메인",
-    [
-        ["도메인", "액추에이터", "센서", "Version 4 신규"],
-        ["BCM", "25개", "18개", "+6 모터 서비스"],
-        ["TMS", "12개", "8개", "매개변수 확장"],
-        ["PWT", "15개", "12개", "+2 충전포트 센서"],
-        ["CHS", "8개", "15개", "변경 없음"],
-        ["ADAS", "3개", "8개", "변경 없음"]
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 9. Part 2: Version 4 신규 모터 서비스
-add_content_slide(
-    "Part 2: Version 4 신규 모터 서비스",
-    [
-        {
-            'heading': '피드백 모터 시리즈',
-            'bullets': [
-                'Actr_SingleFbMot: 1개 DI 신호 피드백',
-                'Actr_DoubleFbMot: 2개 DI 신호 피드백',
-                'Actr_TripleFbMot: 3개 DI 신호 피드백'
-            ]
-        },
-        {
-            'heading': '특수 모터 서비스',
-            'bullets': [
-                'Actr_SlideRMot: 가변 저항 센서 모터',
-                'Actr_GradedMot: 다단 등급 모터',
-                'Actr_Heatr: NTC 센서 포함 히터'
-            ]
-        },
-        {
-            'heading': 'API 개선사항',
-            'bullets': [
-                'setOper() 매개변수 확장 (dutyRat, spd 추가)',
-                'ntfVolt() API 추가로 전압 모니터링 가능',
-                'setEnvtlVal() 환경 매개변수 설정 기능'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 10. 4계층 아키텍처 상세
-add_content_slide(
-    "4계층 소프트웨어 아키텍처",
-    [
-        {
-            'heading': 'Layer 1: 애플리케이션 계층',
-            'bullets': [
-                '사용자 애플리케이션 및 서비스',
-                'OEM 특화 기능',
-                '써드파티 앱'
-            ]
-        },
-        {
-            'heading': 'Layer 2: 아토믹 서비스 계층 (Part 1)',
-            'bullets': [
-                '표준화된 기능 서비스 API',
-                '하드웨어 독립적 인터페이스',
-                '비즈니스 로직 구현'
-            ]
-        },
-        {
-            'heading': 'Layer 3: 디바이스 추상화 계층 (Part 2)',
-            'bullets': [
-                '하드웨어 추상화 인터페이스',
-                '벤더 독립적 디바이스 제어',
-                '직접 하드웨어 상호작용'
-            ]
-        },
-        {
-            'heading': 'Layer 4: 기초 플랫폼 계층',
-            'bullets': [
-                'OS (Linux, QNX, Android Automotive)',
-                '기본 컴퓨팅 자원',
-                '하드웨어 드라이버'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 11. API 호출 흐름 예시
-add_content_slide(
-    "API 호출 흐름 예시: 창문 열기",
-    [
-        {
-            'heading': '호출 순서',
-            'bullets': [
-                '1. 사용자: HMI에서 "창문 열기" 버튼 터치',
-                '2. 애플리케이션: UI 이벤트 처리',
-                '3. 아토믹 서비스: BCM_Window.open() 호출',
-                '4. 서비스 로직: 필요한 하드웨어 동작 결정',
-                '5. 디바이스 추상화: Actr_DoubleHallMot.setOper(UP, 100)',
-                '6. 하드웨어: 모터 회전하여 창문 개방',
-                '7. 피드백: ntfHallQuarterCnt()로 위치 보고'
-            ]
-        },
-        {
-            'heading': 'Version 4 개선사항',
-            'bullets': [
-                'ntfVolt() 추가로 전압 모니터링',
-                'setOper() 매개변수로 정밀 제어',
-                '오류 상태 8단계로 세분화'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 12. 참여 기업 현황
-add_table_slide(
-    "주요 참여 기업 현황",
-    [
-        ["구분", "기업명", "역할", "기여 분야"],
-        ["OEM", "BYD, Geely, GWM", "표준 주도", "요구사항 정의"],
-        ["OEM", "FAW, SAIC, Changan", "표준 참여", "검증 및 피드백"],
-        ["Tier-1", "Huawei", "기술 주도", "E/E 아키텍처"],
-        ["Tier-1", "Bosch, Continental", "글로벌 연계", "AUTOSAR 매핑"],
-        ["IT", "Baidu, Tencent", "SW 플랫폼", "클라우드 서비스"],
-        ["IT", "Alibaba, Xiaomi", "생태계 구축", "앱 마켓플레이스"]
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 13. TMS 도메인 Version 4 개선사항
-add_content_slide(
-    "TMS 도메인 Version 4 주요 개선사항",
-    [
-        {
-            'heading': 'TMS_Battery (배터리 열관리)',
-            'bullets': [
-                'setTargetWorkMode(): 작동 모드 설정',
-                'getCurrentWorkMode(): 현재 모드 확인',
-                'notifyCurrentWorkMode(): 모드 변경 알림'
-            ]
-        },
-        {
-            'heading': 'TMS_Device (장치 방열)',
-            'bullets': [
-                'notifyCurrentFlow(): 냉각수 유량 보고',
-                'getCurrentWaterTemp(): 수온 확인',
-                'notifyCurrentWaterTemp(): 수온 변경 알림'
-            ]
-        },
-        {
-            'heading': 'API 매개변수 확장',
-            'bullets': [
-                'Actr_EWP.setOper(): enable, dutyRat, spd 추가',
-                'Actr_PTC.setOper(): enable, dutyRat, pwrLimd, gear 추가',
-                'Actr_Blower.setOper(): enable, dutyRat, spd 추가'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 14. EMS 도메인 Version 4 개선사항
-add_content_slide(
-    "EMS 도메인 Version 4 주요 개선사항",
-    [
-        {
-            'heading': '충전 포트 온도 모니터링',
-            'bullets': [
-                'notifyACTemp(): AC 충전 포트 온도 보고',
-                'notifyDCTemp(): DC 충전 포트 온도 보고',
-                'EMS_ChargePortTemp: 새로운 데이터 유형 추가'
-            ]
-        },
-        {
-            'heading': '고전압 배터리 오류 등급 확장',
-            'bullets': [
-                'Version 3: FAULT_LEVEL1~4 (4단계)',
-                'Version 4: FAULT_LEVEL1~8 (8단계)',
-                '더 세밀한 오류 진단 및 처리 가능'
-            ]
-        },
-        {
-            'heading': '고전압 인터록 추가',
-            'bullets': [
-                'hvIntlkFltFlag: 고전압 인터록 오류 플래그',
-                '안전성 향상을 위한 추가 모니터링'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 15. ADAS 도메인 강화
-add_content_slide(
-    "ADAS 도메인 기능 강화",
-    [
-        {
-            'heading': 'ADAS_Perception (시각 인지)',
-            'bullets': [
-                'getTrackObjects(): 차량, 보행자, 물체 감지',
-                'getLaneline(): 차선 감지',
-                'getTrafficLight(): 신호등 인식',
-                'getParkingSpace(): 주차공간 식별',
-                'getRoadSign(): 도로 표지판 인식'
-            ]
-        },
-        {
-            'heading': 'ADAS_Fusion (센서 융합)',
-            'bullets': [
-                'getCombinedObjects(): 융합된 센서 결과',
-                '카메라 + 레이더 + 라이다 데이터 통합',
-                '더 정확한 물체 인식 및 추적'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 16. 글로벌 표준과의 비교
-add_table_slide(
-    "글로벌 SDV 표준 비교 분석",
-    [
-        ["항목", "중국 SDV", "AUTOSAR AP", "SOAFEE"],
-        ["API 수", "520+", "200+", "150+"],
-        ["도메인", "6개", "4개", "3개"],
-        ["아키텍처", "4계층", "3계층", "3계층"],
-        ["중점", "실용성", "이론 완성도", "클라우드 연계"],
-        ["개발 속도", "빠름 (연 1회)", "보통", "느림"],
-        ["생태계", "중국 중심", "글로벌", "신흥"]
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 17. 중국 표준의 장단점
-add_content_slide(
-    "중국 SDV 표준의 장단점 분석",
-    [
-        {
-            'heading': '장점',
-            'bullets': [
-                '포괄적인 API 커버리지 (520개+)',
-                '실용적이고 구현 중심적 설계',
-                '빠른 반복 개발 (6개월마다 업데이트)',
-                '강력한 정부 및 산업계 지원',
-                '중국 시장 특성에 최적화'
-            ]
-        },
-        {
-            'heading': '단점',
-            'bullets': [
-                '국제 표준과의 호환성 부족',
-                '중국 외 지역 적용 제한적',
-                '문서의 영문 번역 부재',
-                '지적재산권 이슈 가능성'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 18. 한국의 대응 전략 (1)
-add_content_slide(
-    "한국형 SDV 표준 제안",
-    [
-        {
-            'heading': 'K-SDV 표준 구조',
-            'bullets': [
-                'Core API: 필수 핵심 API만 표준화',
-                'Extension Profiles: 도메인별 확장 프로파일',
-                '국제 호환성: AUTOSAR/ISO 20078 매핑 테이블',
-                '보안 내장: 기본 보안 및 OTA 기능 포함'
-            ]
-        },
-        {
-            'heading': '차별화 전략',
-            'bullets': [
-                'MaaS 연계: 모빌리티 서비스 통합 API',
-                'C-ITS 통합: V2X 통신 표준 API',
-                '클라우드 네이티브: 엣지-클라우드 연계',
-                'AI/ML 서비스: 온디바이스 AI API'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 19. 한국의 대응 전략 (2)
-add_content_slide(
-    "한국 SDV 생태계 구축 방안",
-    [
-        {
-            'heading': '단기 전략 (2025년)',
-            'bullets': [
-                'K-SDV 표준화 협의체 구성',
-                '현대차그룹 ccOS와 연계',
-                'AUTOSAR 기반 확장 전략',
-                '시범 프로젝트 착수'
-            ]
-        },
-        {
-            'heading': '중기 전략 (2026-2027년)',
-            'bullets': [
-                'K-SDV Version 1.0 발표',
-                'OEM-Tier1-IT 협업 체계 구축',
-                '개발자 생태계 활성화',
-                '국제 표준화 참여'
-            ]
-        },
-        {
-            'heading': '장기 전략 (2028년 이후)',
-            'bullets': [
-                '글로벌 시장 진출',
-                'SDV 기반 새로운 비즈니스 모델',
-                '동남아시아 시장 표준 주도'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 20. 핵심 액션 아이템
-add_content_slide(
-    "핵심 액션 아이템",
-    [
-        {
-            'heading': '즉시 실행 과제',
-            'bullets': [
-                'SDV 표준화 TF 구성',
-                '중국 표준 상세 분석 완료',
-                'AUTOSAR와의 갭 분석',
-                'SDV 전문 인력 양성 프로그램 시작'
-            ]
-        },
-        {
-            'heading': '3개월 내 실행 과제',
-            'bullets': [
-                'K-SDV 표준 초안 작성',
-                '파일럿 프로젝트 선정',
-                '글로벌 표준 기구와의 협력 채널 구축',
-                '산학연 협력 체계 구성'
-            ]
-        },
-        {
-            'heading': '6개월 내 실행 과제',
-            'bullets': [
-                'K-SDV Version 0.5 Beta 발표',
-                '개발자 커뮤니티 구축',
-                'SDV 해커톤 개최',
-                '정부 지원 정책 수립'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 21. 예상 시장 영향
-add_content_slide(
-    "SDV 표준화의 시장 영향",
-    [
-        {
-            'heading': '자동차 산업',
-            'bullets': [
-                '개발 비용 30% 절감 예상',
-                '출시 기간 50% 단축',
-                '새로운 수익 모델 창출 (구독 서비스)',
-                'OTA를 통한 지속적 가치 제공'
-            ]
-        },
-        {
-            'heading': 'IT/SW 산업',
-            'bullets': [
-                '자동차 SW 시장 진입 장벽 낮춤',
-                '앱 생태계 확대 (자동차 앱스토어)',
-                '클라우드 서비스 수요 증가',
-                'AI/빅데이터 활용 확대'
-            ]
-        },
-        {
-            'heading': '소비자',
-            'bullets': [
-                '개인화된 차량 경험',
-                '지속적인 기능 업그레이드',
-                '다양한 서비스 선택권',
-                '차량 가치 유지 향상'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 22. 위험 요소 및 대응
-add_content_slide(
-    "위험 요소 및 대응 방안",
-    [
-        {
-            'heading': '기술적 위험',
-            'bullets': [
-                '사이버 보안 위협 → 보안 표준 강화',
-                '시스템 복잡성 증가 → 모듈화 설계',
-                '실시간성 보장 → QoS 메커니즘 도입'
-            ]
-        },
-        {
-            'heading': '시장 위험',
-            'bullets': [
-                '표준 파편화 → 국제 협력 강화',
-                '중국 표준 독주 → 차별화 전략',
-                '기술 종속성 → 핵심 기술 자립'
-            ]
-        },
-        {
-            'heading': '규제 위험',
-            'bullets': [
-                '데이터 주권 이슈 → 현지화 전략',
-                '인증 체계 복잡 → 통합 인증 추진',
-                '책임 소재 불명확 → 법제도 정비'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 23. 성공 사례: BYD의 SDV 구현
-add_content_slide(
-    "성공 사례: BYD의 SDV 구현",
-    [
-        {
-            'heading': 'BYD DiLink 시스템',
-            'bullets': [
-                '중국 SDV 표준 기반 구현',
-                '520개 API 중 450개 구현 완료',
-                '월간 OTA 업데이트 제공',
-                '100만+ 다운로드 앱 생태계'
-            ]
-        },
-        {
-            'heading': '구현 성과',
-            'bullets': [
-                '개발 기간 40% 단축',
-                '고객 만족도 95% 달성',
-                '서비스 수익 연 20% 성장',
-                '글로벌 시장 진출 가속화'
-            ]
-        },
-        {
-            'heading': '시사점',
-            'bullets': [
-                '표준화가 혁신의 기반',
-                '생태계 구축이 성공의 핵심',
-                '빠른 실행과 개선의 중요성'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 24. 결론
-add_content_slide(
-    "결론 및 제언",
-    [
-        {
-            'heading': '핵심 인사이트',
-            'bullets': [
-                '중국 SDV 표준 V4는 실용적이고 포괄적',
-                '빠른 진화로 시장 주도권 확보 중',
-                '한국도 신속한 대응 필요'
-            ]
-        },
-        {
-            'heading': '한국의 기회',
-            'bullets': [
-                '글로벌 호환성으로 차별화',
-                'MaaS/C-ITS 연계로 독자성 확보',
-                '강력한 IT 역량 활용'
-            ]
-        },
-        {
-            'heading': '즉시 행동 필요',
-            'bullets': [
-                'K-SDV 표준화 추진',
-                '산업계 협력 강화',
-                '정부 지원 확대',
-                '글로벌 협력 추진'
-            ]
-        }
-    ],
-    slide_num
-)
-slide_num += 1
-
-# 25. Q&A
-add_content_slide(
-    "Q&A",
-    [
-        {
-            'heading': '예상 질문',
-            'bullets': [
-                'Q1: 중국 표준과 AUTOSAR의 가장 큰 차이는?',
-                'Q2: 한국 기업들의 현재 대응 수준은?',
-                'Q3: K-SDV 표준 개발 일정은?',
-                'Q4: 필요한 투자 규모는?'
-            ]
-        },
-        {
-            'heading': '연락처',
-            'bullets': [
-                '한국전자기술연구원(KETI)',
-                '모빌리티플랫폼연구센터',
-                'Email: mobility@keti.re.kr',
-                'Tel: 031-789-7000'
-            ]
-        }
-    ],
-    slide_num
-)
+    deck.page_number(slide, slide_number)
+
+def build(output_file=OUTPUT_FILE):
+    """V4 완전 분석 덱 생성 후 저장, 전체 페이지 수 반환"""
+    deck = SlideBuilder(THEME)
+    
+    # 슬라이드 생성
+    slide_num = 1
+
+    # 1. 타이틀 슬라이드
+    add_title_slide(deck)
+    slide_num += 1
+
+    # 2. 목차
+    add_content_slide(
+        deck,
+        "목차",
+        [
+            "1. SDV (Software Defined Vehicle) 개요",
+            "2. 중국 SDV 표준화 현황",
+            "3. Version 3 → Version 4 주요 변경사항",
+            "4. Part 1: 아토믹 서비스 API",
+            "5. Part 2: 디바이스 추상화 API",
+            "6. 4계층 아키텍처 상세",
+            "7. 주요 참여 기업 현황",
+            "8. 글로벌 표준과의 비교",
+            "9. 한국의 대응 전략",
+            "10. Q&A"
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 3. SDV 개요
+    add_content_slide(
+        deck,
+        "SDV (Software Defined Vehicle) 개요",
+        [
+            {
+                'heading': 'SDV의 정의',
+                'bullets': [
+                    '차량의 기능과 성능이 소프트웨어에 의해 정의되는 차량',
+                    '하드웨어와 소프트웨어의 완전한 분리 (Decoupling)',
+                    'OTA 업데이트를 통한 지속적인 기능 개선'
+                ]
+            },
+            {
+                'heading': 'SDV의 핵심 특징',
+                'bullets': [
+                    '서비스 지향 아키텍처 (Service-Oriented Architecture)',
+                    '클라우드 네이티브 기술 적용',
+                    '표준화된 API를 통한 개발 효율성 향상',
+                    '새로운 비즈니스 모델 창출 (MaaS, Feature on Demand)'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 4. 중국 SDV 표준화 현황
+    add_content_slide(
+        deck,
+        "중국 SDV 표준화 현황",
+        [
+            {
+                'heading': '표준 개요',
+                'bullets': [
+                    '표준명: SDV/T 001-2022',
+                    '주관: 중국자동차공업협회(CAAM) 소프트웨어 분과',
+                    '최신 버전: Version 4 Beta 1 (2022년 12월)',
+                    '참여 기업: 60개 이상'
+                ]
+            },
+            {
+                'heading': '전략적 목표',
+                'bullets': [
+                    '통일된 개발 표준 수립',
+                    '중국 고유의 SDV 생태계 구축',
+                    '글로벌 SDV 시장 주도권 확보',
+                    '자동차 산업 디지털 전환 가속화'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 5. V3 → V4 주요 변경사항
+    add_comparison_slide(
+        deck,
+        "Version 3 → Version 4 주요 변경사항",
+        [
+            "API 총 개수: 450개",
+            "BCM_Seat: notifyOccupiedStatus() only",
+            "BCM_WiperWash: 기본 API만 제공",
+            "TMS_Battery: 기본 제어 기능",
+            "4단계 오류 등급 (FAULT_LEVEL1~4)",
+            "기본적인 센서 API"
+        ],
+        [
+            "API 총 개수: 520개 이상 (15% 증가)",
+            "BCM_Seat: getOccupiedStatus() 추가",
+            "BCM_WiperWash: setWipingLevelImme() 추가",
+            "TMS_Battery: WorkMode 관련 API 3개 추가",
+            "8단계 오류 등급 (FAULT_LEVEL1~8)",
+            "6개의 새로운 모터 서비스 추가"
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 6. Part 1: 아토믹 서비스 API - 도메인별 구성
+    add_table_slide(
+        deck,
+        "Part 1: 아토믹 서비스 API - 6대 도메인",
+        [
+            ["도메인", "서비스 수", "주요 기능", "Version 4 신규"],
+            ["BCM (차체제어)", "31개", "도어, 창문, 시트, 조명", "+2 서비스"],
+            ["TMS (열관리)", "8개", "공조, 배터리 열관리", "+3 API"],
+            ["VCS (차량제어)", "12개", "기어, 브레이크, 조향", "변경 없음"],
+            ["EMS (에너지)", "15개", "충전, 배터리 관리", "+2 API"],
+            ["ADAS (지능형)", "18개", "인지, 센서 융합", "기능 강화"],
+            ["HMI (인터페이스)", "10개", "디스플레이, 오디오", "변경 없음"]
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 7. Part 1: BCM 도메인 상세
+    add_content_slide(
+        deck,
+        "Part 1: BCM 도메인 주요 API (Version 4 신규)",
+        [
+            {
+                'heading': 'BCM_SafetyBelt (신규 서비스)',
+                'bullets': [
+                    'getBuckleStatus(): 안전벨트 버클 상태 확인',
+                    'notifyBuckleStatus(): 버클 상태 변경 알림'
+                ]
+            },
+            {
+                'heading': 'BCM_ScreenAdjust (신규 서비스)',
+                'bullets': [
+                    'fold()/unfold(): 스크린 접기/펴기',
+                    'adjustPosition(): 스크린 위치 조절',
+                    'notifyAntiPinch(): 끼임 방지 알림'
+                ]
+            },
+            {
+                'heading': 'BCM_SeatExtended (확장 기능)',
+                'bullets': [
+                    'adjustFootRestAngle(): 발 받침대 각도 조절',
+                    'getFootRestAngle(): 발 받침대 각도 확인',
+                    'startAdjustFootRestAngle(): 조절 시작',
+                    'stopAdjustFootRestAngle(): 조절 중지'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 8. Part 2: 디바이스 추상화 API
+    add_table_slide(
+        deck,
+        "Part 2: 디바이스 추상화 API - 5대 도메인",
+        [
+            ["도메인", "액추에이터", "센서", "Version 4 신규"],
+            ["BCM", "25개", "18개", "+6 모터 서비스"],
+            ["TMS", "12개", "8개", "매개변수 확장"],
+            ["PWT", "15개", "12개", "+2 충전포트 센서"],
+            ["CHS", "8개", "15개", "변경 없음"],
+            ["ADAS", "3개", "8개", "변경 없음"]
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 9. Part 2: Version 4 신규 모터 서비스
+    add_content_slide(
+        deck,
+        "Part 2: Version 4 신규 모터 서비스",
+        [
+            {
+                'heading': '피드백 모터 시리즈',
+                'bullets': [
+                    'Actr_SingleFbMot: 1개 DI 신호 피드백',
+                    'Actr_DoubleFbMot: 2개 DI 신호 피드백',
+                    'Actr_TripleFbMot: 3개 DI 신호 피드백'
+                ]
+            },
+            {
+                'heading': '특수 모터 서비스',
+                'bullets': [
+                    'Actr_SlideRMot: 가변 저항 센서 모터',
+                    'Actr_GradedMot: 다단 등급 모터',
+                    'Actr_Heatr: NTC 센서 포함 히터'
+                ]
+            },
+            {
+                'heading': 'API 개선사항',
+                'bullets': [
+                    'setOper() 매개변수 확장 (dutyRat, spd 추가)',
+                    'ntfVolt() API 추가로 전압 모니터링 가능',
+                    'setEnvtlVal() 환경 매개변수 설정 기능'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 10. 4계층 아키텍처 상세
+    add_content_slide(
+        deck,
+        "4계층 소프트웨어 아키텍처",
+        [
+            {
+                'heading': 'Layer 1: 애플리케이션 계층',
+                'bullets': [
+                    '사용자 애플리케이션 및 서비스',
+                    'OEM 특화 기능',
+                    '써드파티 앱'
+                ]
+            },
+            {
+                'heading': 'Layer 2: 아토믹 서비스 계층 (Part 1)',
+                'bullets': [
+                    '표준화된 기능 서비스 API',
+                    '하드웨어 독립적 인터페이스',
+                    '비즈니스 로직 구현'
+                ]
+            },
+            {
+                'heading': 'Layer 3: 디바이스 추상화 계층 (Part 2)',
+                'bullets': [
+                    '하드웨어 추상화 인터페이스',
+                    '벤더 독립적 디바이스 제어',
+                    '직접 하드웨어 상호작용'
+                ]
+            },
+            {
+                'heading': 'Layer 4: 기초 플랫폼 계층',
+                'bullets': [
+                    'OS (Linux, QNX, Android Automotive)',
+                    '기본 컴퓨팅 자원',
+                    '하드웨어 드라이버'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 11. API 호출 흐름 예시
+    add_content_slide(
+        deck,
+        "API 호출 흐름 예시: 창문 열기",
+        [
+            {
+                'heading': '호출 순서',
+                'bullets': [
+                    '1. 사용자: HMI에서 "창문 열기" 버튼 터치',
+                    '2. 애플리케이션: UI 이벤트 처리',
+                    '3. 아토믹 서비스: BCM_Window.open() 호출',
+                    '4. 서비스 로직: 필요한 하드웨어 동작 결정',
+                    '5. 디바이스 추상화: Actr_DoubleHallMot.setOper(UP, 100)',
+                    '6. 하드웨어: 모터 회전하여 창문 개방',
+                    '7. 피드백: ntfHallQuarterCnt()로 위치 보고'
+                ]
+            },
+            {
+                'heading': 'Version 4 개선사항',
+                'bullets': [
+                    'ntfVolt() 추가로 전압 모니터링',
+                    'setOper() 매개변수로 정밀 제어',
+                    '오류 상태 8단계로 세분화'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 12. 참여 기업 현황
+    add_table_slide(
+        deck,
+        "주요 참여 기업 현황",
+        [
+            ["구분", "기업명", "역할", "기여 분야"],
+            ["OEM", "BYD, Geely, GWM", "표준 주도", "요구사항 정의"],
+            ["OEM", "FAW, SAIC, Changan", "표준 참여", "검증 및 피드백"],
+            ["Tier-1", "Huawei", "기술 주도", "E/E 아키텍처"],
+            ["Tier-1", "Bosch, Continental", "글로벌 연계", "AUTOSAR 매핑"],
+            ["IT", "Baidu, Tencent", "SW 플랫폼", "클라우드 서비스"],
+            ["IT", "Alibaba, Xiaomi", "생태계 구축", "앱 마켓플레이스"]
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 13. TMS 도메인 Version 4 개선사항
+    add_content_slide(
+        deck,
+        "TMS 도메인 Version 4 주요 개선사항",
+        [
+            {
+                'heading': 'TMS_Battery (배터리 열관리)',
+                'bullets': [
+                    'setTargetWorkMode(): 작동 모드 설정',
+                    'getCurrentWorkMode(): 현재 모드 확인',
+                    'notifyCurrentWorkMode(): 모드 변경 알림'
+                ]
+            },
+            {
+                'heading': 'TMS_Device (장치 방열)',
+                'bullets': [
+                    'notifyCurrentFlow(): 냉각수 유량 보고',
+                    'getCurrentWaterTemp(): 수온 확인',
+                    'notifyCurrentWaterTemp(): 수온 변경 알림'
+                ]
+            },
+            {
+                'heading': 'API 매개변수 확장',
+                'bullets': [
+                    'Actr_EWP.setOper(): enable, dutyRat, spd 추가',
+                    'Actr_PTC.setOper(): enable, dutyRat, pwrLimd, gear 추가',
+                    'Actr_Blower.setOper(): enable, dutyRat, spd 추가'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 14. EMS 도메인 Version 4 개선사항
+    add_content_slide(
+        deck,
+        "EMS 도메인 Version 4 주요 개선사항",
+        [
+            {
+                'heading': '충전 포트 온도 모니터링',
+                'bullets': [
+                    'notifyACTemp(): AC 충전 포트 온도 보고',
+                    'notifyDCTemp(): DC 충전 포트 온도 보고',
+                    'EMS_ChargePortTemp: 새로운 데이터 유형 추가'
+                ]
+            },
+            {
+                'heading': '고전압 배터리 오류 등급 확장',
+                'bullets': [
+                    'Version 3: FAULT_LEVEL1~4 (4단계)',
+                    'Version 4: FAULT_LEVEL1~8 (8단계)',
+                    '더 세밀한 오류 진단 및 처리 가능'
+                ]
+            },
+            {
+                'heading': '고전압 인터록 추가',
+                'bullets': [
+                    'hvIntlkFltFlag: 고전압 인터록 오류 플래그',
+                    '안전성 향상을 위한 추가 모니터링'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 15. ADAS 도메인 강화
+    add_content_slide(
+        deck,
+        "ADAS 도메인 기능 강화",
+        [
+            {
+                'heading': 'ADAS_Perception (시각 인지)',
+                'bullets': [
+                    'getTrackObjects(): 차량, 보행자, 물체 감지',
+                    'getLaneline(): 차선 감지',
+                    'getTrafficLight(): 신호등 인식',
+                    'getParkingSpace(): 주차공간 식별',
+                    'getRoadSign(): 도로 표지판 인식'
+                ]
+            },
+            {
+                'heading': 'ADAS_Fusion (센서 융합)',
+                'bullets': [
+                    'getCombinedObjects(): 융합된 센서 결과',
+                    '카메라 + 레이더 + 라이다 데이터 통합',
+                    '더 정확한 물체 인식 및 추적'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 16. 글로벌 표준과의 비교
+    add_table_slide(
+        deck,
+        "글로벌 SDV 표준 비교 분석",
+        [
+            ["항목", "중국 SDV", "AUTOSAR AP", "SOAFEE"],
+            ["API 수", "520+", "200+", "150+"],
+            ["도메인", "6개", "4개", "3개"],
+            ["아키텍처", "4계층", "3계층", "3계층"],
+            ["중점", "실용성", "이론 완성도", "클라우드 연계"],
+            ["개발 속도", "빠름 (연 1회)", "보통", "느림"],
+            ["생태계", "중국 중심", "글로벌", "신흥"]
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 17. 중국 표준의 장단점
+    add_content_slide(
+        deck,
+        "중국 SDV 표준의 장단점 분석",
+        [
+            {
+                'heading': '장점',
+                'bullets': [
+                    '포괄적인 API 커버리지 (520개+)',
+                    '실용적이고 구현 중심적 설계',
+                    '빠른 반복 개발 (6개월마다 업데이트)',
+                    '강력한 정부 및 산업계 지원',
+                    '중국 시장 특성에 최적화'
+                ]
+            },
+            {
+                'heading': '단점',
+                'bullets': [
+                    '국제 표준과의 호환성 부족',
+                    '중국 외 지역 적용 제한적',
+                    '문서의 영문 번역 부재',
+                    '지적재산권 이슈 가능성'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 18. 한국의 대응 전략 (1)
+    add_content_slide(
+        deck,
+        "한국형 SDV 표준 제안",
+        [
+            {
+                'heading': 'K-SDV 표준 구조',
+                'bullets': [
+                    'Core API: 필수 핵심 API만 표준화',
+                    'Extension Profiles: 도메인별 확장 프로파일',
+                    '국제 호환성: AUTOSAR/ISO 20078 매핑 테이블',
+                    '보안 내장: 기본 보안 및 OTA 기능 포함'
+                ]
+            },
+            {
+                'heading': '차별화 전략',
+                'bullets': [
+                    'MaaS 연계: 모빌리티 서비스 통합 API',
+                    'C-ITS 통합: V2X 통신 표준 API',
+                    '클라우드 네이티브: 엣지-클라우드 연계',
+                    'AI/ML 서비스: 온디바이스 AI API'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 19. 한국의 대응 전략 (2)
+    add_content_slide(
+        deck,
+        "한국 SDV 생태계 구축 방안",
+        [
+            {
+                'heading': '단기 전략 (2025년)',
+                'bullets': [
+                    'K-SDV 표준화 협의체 구성',
+                    '현대차그룹 ccOS와 연계',
+                    'AUTOSAR 기반 확장 전략',
+                    '시범 프로젝트 착수'
+                ]
+            },
+            {
+                'heading': '중기 전략 (2026-2027년)',
+                'bullets': [
+                    'K-SDV Version 1.0 발표',
+                    'OEM-Tier1-IT 협업 체계 구축',
+                    '개발자 생태계 활성화',
+                    '국제 표준화 참여'
+                ]
+            },
+            {
+                'heading': '장기 전략 (2028년 이후)',
+                'bullets': [
+                    '글로벌 시장 진출',
+                    'SDV 기반 새로운 비즈니스 모델',
+                    '동남아시아 시장 표준 주도'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 20. 핵심 액션 아이템
+    add_content_slide(
+        deck,
+        "핵심 액션 아이템",
+        [
+            {
+                'heading': '즉시 실행 과제',
+                'bullets': [
+                    'SDV 표준화 TF 구성',
+                    '중국 표준 상세 분석 완료',
+                    'AUTOSAR와의 갭 분석',
+                    'SDV 전문 인력 양성 프로그램 시작'
+                ]
+            },
+            {
+                'heading': '3개월 내 실행 과제',
+                'bullets': [
+                    'K-SDV 표준 초안 작성',
+                    '파일럿 프로젝트 선정',
+                    '글로벌 표준 기구와의 협력 채널 구축',
+                    '산학연 협력 체계 구성'
+                ]
+            },
+            {
+                'heading': '6개월 내 실행 과제',
+                'bullets': [
+                    'K-SDV Version 0.5 Beta 발표',
+                    '개발자 커뮤니티 구축',
+                    'SDV 해커톤 개최',
+                    '정부 지원 정책 수립'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 21. 예상 시장 영향
+    add_content_slide(
+        deck,
+        "SDV 표준화의 시장 영향",
+        [
+            {
+                'heading': '자동차 산업',
+                'bullets': [
+                    '개발 비용 30% 절감 예상',
+                    '출시 기간 50% 단축',
+                    '새로운 수익 모델 창출 (구독 서비스)',
+                    'OTA를 통한 지속적 가치 제공'
+                ]
+            },
+            {
+                'heading': 'IT/SW 산업',
+                'bullets': [
+                    '자동차 SW 시장 진입 장벽 낮춤',
+                    '앱 생태계 확대 (자동차 앱스토어)',
+                    '클라우드 서비스 수요 증가',
+                    'AI/빅데이터 활용 확대'
+                ]
+            },
+            {
+                'heading': '소비자',
+                'bullets': [
+                    '개인화된 차량 경험',
+                    '지속적인 기능 업그레이드',
+                    '다양한 서비스 선택권',
+                    '차량 가치 유지 향상'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 22. 위험 요소 및 대응
+    add_content_slide(
+        deck,
+        "위험 요소 및 대응 방안",
+        [
+            {
+                'heading': '기술적 위험',
+                'bullets': [
+                    '사이버 보안 위협 → 보안 표준 강화',
+                    '시스템 복잡성 증가 → 모듈화 설계',
+                    '실시간성 보장 → QoS 메커니즘 도입'
+                ]
+            },
+            {
+                'heading': '시장 위험',
+                'bullets': [
+                    '표준 파편화 → 국제 협력 강화',
+                    '중국 표준 독주 → 차별화 전략',
+                    '기술 종속성 → 핵심 기술 자립'
+                ]
+            },
+            {
+                'heading': '규제 위험',
+                'bullets': [
+                    '데이터 주권 이슈 → 현지화 전략',
+                    '인증 체계 복잡 → 통합 인증 추진',
+                    '책임 소재 불명확 → 법제도 정비'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 23. 성공 사례: BYD의 SDV 구현
+    add_content_slide(
+        deck,
+        "성공 사례: BYD의 SDV 구현",
+        [
+            {
+                'heading': 'BYD DiLink 시스템',
+                'bullets': [
+                    '중국 SDV 표준 기반 구현',
+                    '520개 API 중 450개 구현 완료',
+                    '월간 OTA 업데이트 제공',
+                    '100만+ 다운로드 앱 생태계'
+                ]
+            },
+            {
+                'heading': '구현 성과',
+                'bullets': [
+                    '개발 기간 40% 단축',
+                    '고객 만족도 95% 달성',
+                    '서비스 수익 연 20% 성장',
+                    '글로벌 시장 진출 가속화'
+                ]
+            },
+            {
+                'heading': '시사점',
+                'bullets': [
+                    '표준화가 혁신의 기반',
+                    '생태계 구축이 성공의 핵심',
+                    '빠른 실행과 개선의 중요성'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 24. 결론
+    add_content_slide(
+        deck,
+        "결론 및 제언",
+        [
+            {
+                'heading': '핵심 인사이트',
+                'bullets': [
+                    '중국 SDV 표준 V4는 실용적이고 포괄적',
+                    '빠른 진화로 시장 주도권 확보 중',
+                    '한국도 신속한 대응 필요'
+                ]
+            },
+            {
+                'heading': '한국의 기회',
+                'bullets': [
+                    '글로벌 호환성으로 차별화',
+                    'MaaS/C-ITS 연계로 독자성 확보',
+                    '강력한 IT 역량 활용'
+                ]
+            },
+            {
+                'heading': '즉시 행동 필요',
+                'bullets': [
+                    'K-SDV 표준화 추진',
+                    '산업계 협력 강화',
+                    '정부 지원 확대',
+                    '글로벌 협력 추진'
+                ]
+            }
+        ],
+        slide_num
+    )
+    slide_num += 1
+
+    # 25. Q&A
+    add_content_slide(
+        deck,
+        "Q&A",
+        [
+            {
+                'heading': '예상 질문',
+                'bullets': [
+                    'Q1: 중국 표준과 AUTOSAR의 가장 큰 차이는?',
+                    'Q2: 한국 기업들의 현재 대응 수준은?',
+                    'Q3: K-SDV 표준 개발 일정은?',
+                    'Q4: 필요한 투자 규모는?'
+                ]
+            },
+            {
+                'heading': '연락처',
+                'bullets': [
+                    '한국전자기술연구원(KETI)',
+                    '모빌리티플랫폼연구센터',
+                    'Email: mobility@keti.re.kr',
+                    'Tel: 031-789-7000'
+                ]
+            }
+        ],
+        slide_num
+    )
 
-# 프레젠테이션 저장
-output_file = 'China_SDV_Standard_V4_Complete_Analysis.pptx'
-prs.save(output_file)
-print(f"완벽한 SDV 표준 프레젠테이션이 생성되었습니다: {output_file}")
-print(f"총 {slide_num} 페이지로 구성되었습니다.")
-print("\n주요 개선사항:")
-print("- V3에서 V4로의 변경사항 상세 포함")
-print("- 글씨 색상 문제 해결 (검정/진한 색 사용)")
-print("- 도형 비율 및 화면 크기 최적화")
-print("- 전문적인 테이블 및 비교 슬라이드 추가")
-print("- 15분 발표에 적합한 구성")
\ No newline at end of file
+    # 프레젠테이션 저장
+
+    # 프레젠테이션 저장
+    deck.save(output_file)
+    return slide_num
+
+def main():
+    slide_num = build()
+    print(f"완벽한 SDV 표준 프레젠테이션이 생성되었습니다: {OUTPUT_FILE}")
+    print(f"총 {slide_num} 페이지로 구성되었습니다.")
+    print("\n주요 개선사항:")
+    print("- V3에서 V4로의 변경사항 상세 포함")
+    print("- 글씨 색상 문제 해결 (검정/진한 색 사용)")
+    print("- 도형 비율 및 화면 크기 최적화")
+    print("- 전문적인 테이블 및 비교 슬라이드 추가")
+    print("- 15분 발표에 적합한 구성")
+
+if __name__ == "__main__":
+    main()
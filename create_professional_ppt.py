@@ -8,22 +8,32 @@ from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.dml import MSO_FILL_TYPE
 
+from sdvdeck.builder import SlideBuilder, Theme, TextStyle, StackStyle, page_style, save_presentation
+
+OUTPUT_FILE = '/home/kim/github-sdv/China_SDV_Standard_Analysis_v4_Professional.pptx'
+
+# 슬라이드마다 배경색과 제목 색이 다른 덱이라 테마는 레이아웃/크기 위주로만 사용
+THEME = Theme(
+    name="professional",
+    header_color=RGBColor(20, 20, 40),
+    title=TextStyle(size=Pt(40), bold=True, color=RGBColor(0, 50, 100)),
+    stack=StackStyle(
+        heading=TextStyle(size=Pt(24), bold=True, color=RGBColor(0, 50, 100)),
+        bullet=TextStyle(size=Pt(18), color=RGBColor(80, 80, 80)),
+        item=TextStyle(size=Pt(20), color=RGBColor(80, 80, 80)),
+    ),
+    page=page_style(RGBColor(150, 150, 150)),
+    layout_index=5,
+)
+
 def create_professional_presentation():
     """전문적인 16:9 PPT 생성"""
     # 16:9 비율 설정
-    prs = Presentation()
-    prs.slide_width = Inches(16)
-    prs.slide_height = Inches(9)
+    deck = SlideBuilder(THEME)
+    prs = deck.prs
     
     # 슬라이드 1: 표지
-    slide_layout = prs.slide_layouts[5]  # 빈 슬라이드
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # 배경 색상 설정
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(20, 20, 40)
+    slide = deck.new_slide(background=RGBColor(20, 20, 40))
     
     # 메인 제목
     title_box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(14), Inches(2))
@@ -72,26 +82,12 @@ def create_professional_presentation():
     p.alignment = PP_ALIGN.CENTER
     
     # 슬라이드 2: 목차
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # 배경
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(250, 250, 250)
+    slide = deck.new_slide(background=RGBColor(250, 250, 250))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(14), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "목 차"
-    p.font.size = Pt(44)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(20, 20, 40)
-    p.alignment = PP_ALIGN.CENTER
+    deck.textbox(slide, Inches(1), Inches(0.5), Inches(14), Inches(1),
+                 [("목 차", TextStyle(size=Pt(44), bold=True, color=RGBColor(20, 20, 40), align=PP_ALIGN.CENTER))],
+                 leading_blank=True)
     
     # 목차 내용
     contents = [
@@ -120,25 +116,12 @@ def create_professional_presentation():
         p.space_after = Pt(12)
     
     # 슬라이드 3: SDV 개요
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # 배경
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(245, 245, 250)
+    slide = deck.new_slide(background=RGBColor(245, 245, 250))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "SDV(Software Defined Vehicle) 개요"
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 50, 100)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(1),
+                 [("SDV(Software Defined Vehicle) 개요", TextStyle(size=Pt(40), bold=True, color=RGBColor(0, 50, 100)))],
+                 leading_blank=True)
     
     # 정의 박스
     def_box = slide.shapes.add_shape(
@@ -231,24 +214,12 @@ def create_professional_presentation():
         p.alignment = PP_ALIGN.CENTER
     
     # 슬라이드 4: 중국 표준화 동향
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(245, 248, 250)
+    slide = deck.new_slide(background=RGBColor(245, 248, 250))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "중국 SDV 표준화 전략"
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(150, 0, 0)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(1),
+                 [("중국 SDV 표준화 전략", TextStyle(size=Pt(40), bold=True, color=RGBColor(150, 0, 0)))],
+                 leading_blank=True)
     
     # 주도 기관
     org_box = slide.shapes.add_shape(
@@ -318,24 +289,12 @@ def create_professional_presentation():
         p.line_spacing = 1.3
     
     # 슬라이드 5: 참여사
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(248, 248, 252)
+    slide = deck.new_slide(background=RGBColor(248, 248, 252))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "표준 개발 핵심 참여사"
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 80, 150)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("표준 개발 핵심 참여사", TextStyle(size=Pt(40), bold=True, color=RGBColor(0, 80, 150)))],
+                 leading_blank=True)
     
     # OEM 섹션
     oem_title = slide.shapes.add_textbox(Inches(0.5), Inches(1.3), Inches(7), Inches(0.6))
@@ -434,24 +393,12 @@ def create_professional_presentation():
     p.alignment = PP_ALIGN.CENTER
     
     # 슬라이드 6: 4-Layer 아키텍처
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill  
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(245, 245, 250)
+    slide = deck.new_slide(background=RGBColor(245, 245, 250))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "SDV 서비스 소프트웨어 4계층 아키텍처"
-    p.font.size = Pt(38)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 50, 100)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("SDV 서비스 소프트웨어 4계층 아키텍처", TextStyle(size=Pt(38), bold=True, color=RGBColor(0, 50, 100)))],
+                 leading_blank=True)
     
     # 계층 다이어그램
     layers = [
@@ -505,24 +452,12 @@ def create_professional_presentation():
     p.alignment = PP_ALIGN.CENTER
     
     # 슬라이드 7: Part 1 - Atomic Service API
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(250, 250, 255)
+    slide = deck.new_slide(background=RGBColor(250, 250, 255))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "Part 1: Atomic Service API Interface"
-    p.font.size = Pt(38)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 100, 0)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("Part 1: Atomic Service API Interface", TextStyle(size=Pt(38), bold=True, color=RGBColor(0, 100, 0)))],
+                 leading_blank=True)
     
     # 부제목
     subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.1), Inches(15), Inches(0.5))
@@ -576,24 +511,12 @@ def create_professional_presentation():
         p.line_spacing = 1.2
     
     # 슬라이드 8: BCM 도메인 상세
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(248, 252, 255)
+    slide = deck.new_slide(background=RGBColor(248, 252, 255))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "BCM 도메인: 차체 제어 서비스"
-    p.font.size = Pt(38)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 80, 160)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("BCM 도메인: 차체 제어 서비스", TextStyle(size=Pt(38), bold=True, color=RGBColor(0, 80, 160)))],
+                 leading_blank=True)
     
     # 주요 서비스
     services = [
@@ -641,24 +564,12 @@ def create_professional_presentation():
         y_pos += Inches(1.2)
     
     # 슬라이드 9: 시나리오 예시
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(252, 248, 255)
+    slide = deck.new_slide(background=RGBColor(252, 248, 255))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "시나리오: '퇴근 모드' 구현"
-    p.font.size = Pt(38)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(120, 0, 120)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("시나리오: '퇴근 모드' 구현", TextStyle(size=Pt(38), bold=True, color=RGBColor(120, 0, 120)))],
+                 leading_blank=True)
     
     # 시나리오 단계
     steps = [
@@ -719,24 +630,12 @@ def create_professional_presentation():
     p.alignment = PP_ALIGN.CENTER
     
     # 슬라이드 10: Part 2 - Device Abstraction API
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(255, 250, 245)
+    slide = deck.new_slide(background=RGBColor(255, 250, 245))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "Part 2: Device Abstraction API Interface"
-    p.font.size = Pt(38)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(200, 100, 0)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("Part 2: Device Abstraction API Interface", TextStyle(size=Pt(38), bold=True, color=RGBColor(200, 100, 0)))],
+                 leading_blank=True)
     
     # 부제목
     subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.1), Inches(15), Inches(0.5))
@@ -789,24 +688,12 @@ def create_professional_presentation():
         p.line_spacing = 1.2
     
     # 슬라이드 11: API 연관 관계
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(245, 250, 255)
+    slide = deck.new_slide(background=RGBColor(245, 250, 255))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "API 계층 간 호출 흐름: '창문 열기'"
-    p.font.size = Pt(38)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 50, 150)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("API 계층 간 호출 흐름: '창문 열기'", TextStyle(size=Pt(38), bold=True, color=RGBColor(0, 50, 150)))],
+                 leading_blank=True)
     
     # 흐름도
     flow_steps = [
@@ -849,24 +736,12 @@ def create_professional_presentation():
             arrow.line.width = Pt(3)
     
     # 슬라이드 12: 한국형 표준 제안
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(250, 252, 255)
+    slide = deck.new_slide(background=RGBColor(250, 252, 255))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(15), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "한국형 SDV 표준 제안 방향"
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 50, 200)
+    deck.textbox(slide, Inches(0.5), Inches(0.3), Inches(15), Inches(0.8),
+                 [("한국형 SDV 표준 제안 방향", TextStyle(size=Pt(40), bold=True, color=RGBColor(0, 50, 200)))],
+                 leading_blank=True)
     
     # 제안 사항
     proposals = [
@@ -918,24 +793,12 @@ def create_professional_presentation():
         p.line_spacing = 1.3
     
     # 슬라이드 13: 시사점 및 결론
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(20, 30, 50)
+    slide = deck.new_slide(background=RGBColor(20, 30, 50))
     
     # 제목
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.clear()
-    
-    p = title_frame.add_paragraph()
-    p.text = "결론 및 시사점"
-    p.font.size = Pt(44)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
+    deck.textbox(slide, Inches(0.5), Inches(0.5), Inches(15), Inches(1),
+                 [("결론 및 시사점", TextStyle(size=Pt(44), bold=True, color=RGBColor(255, 255, 255)))],
+                 leading_blank=True)
     
     # 핵심 메시지
     core_msg = slide.shapes.add_shape(
@@ -982,13 +845,7 @@ def create_professional_presentation():
         p.font.color.rgb = RGBColor(255, 255, 255)
     
     # 마지막 슬라이드: Q&A
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(20, 20, 40)
+    slide = deck.new_slide(background=RGBColor(20, 20, 40))
     
     # Q&A
     qa_box = slide.shapes.add_textbox(Inches(3), Inches(3.5), Inches(10), Inches(2))
@@ -1027,6 +884,15 @@ def create_professional_presentation():
     return prs
 
 # 프레젠테이션 생성 및 저장
-prs = create_professional_presentation()
-prs.save('/home/kim/github-sdv/China_SDV_Standard_Analysis_v4_Professional.pptx')
-print("전문적인 16:9 프레젠테이션이 생성되었습니다: China_SDV_Standard_Analysis_v4_Professional.pptx")
\ No newline at end of file
+def build(output_file=OUTPUT_FILE):
+    """전문 디자인 덱 생성 후 저장, 전체 페이지 수 반환"""
+    prs = create_professional_presentation()
+    save_presentation(prs, output_file)
+    return len(prs.slides)
+
+def main():
+    build()
+    print("전문적인 16:9 프레젠테이션이 생성되었습니다: China_SDV_Standard_Analysis_v4_Professional.pptx")
+
+if __name__ == "__main__":
+    main()
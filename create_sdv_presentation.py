@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 
-def add_title_slide(prs, title, subtitle):
+from sdvdeck.builder import SlideBuilder, Theme, TextStyle, StackStyle, page_style, save_presentation
+
+OUTPUT_FILE = '/home/kim/github-sdv/중국_SDV_표준_분석_v4.pptx'
+
+# 기본 템플릿(4:3)의 플레이스홀더 레이아웃을 그대로 쓰는 테마
+THEME = Theme(
+    name="basic",
+    header_color=RGBColor(0, 0, 0),
+    title=TextStyle(),
+    stack=StackStyle(
+        heading=TextStyle(size=Pt(20), bold=True),
+        bullet=TextStyle(size=Pt(16)),
+        item=TextStyle(size=Pt(18)),
+    ),
+    page=page_style(RGBColor(128, 128, 128)),
+    slide_width=Inches(10),
+    slide_height=Inches(7.5),
+)
+
+def add_title_slide(deck, title, subtitle):
     """타이틀 슬라이드 추가"""
-    slide_layout = prs.slide_layouts[0]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = deck.new_slide(0)
     title_shape = slide.shapes.title
     subtitle_shape = slide.placeholders[1] if len(slide.placeholders) > 1 else None
     
@@ -20,84 +37,55 @@ def add_title_slide(prs, title, subtitle):
     
     return slide
 
-def add_content_slide(prs, title, content):
+def add_content_slide(deck, title, content):
     """내용 슬라이드 추가"""
-    slide_layout = prs.slide_layouts[1]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = deck.new_slide(1)
     
     title_shape = slide.shapes.title
     title_shape.text = title
     
     content_shape = slide.placeholders[1] if len(slide.placeholders) > 1 else None
     if content_shape:
-        text_frame = content_shape.text_frame
-        text_frame.clear()
-        
-        for item in content:
-            p = text_frame.add_paragraph()
-            p.text = item
-            p.level = 0
-            p.font.size = Pt(18)
+        deck.fill_text_frame(content_shape.text_frame,
+                             [(item, deck.theme.stack.item) for item in content])
             
     return slide
 
-def add_two_content_slide(prs, title, left_title, left_content, right_title, right_content):
+def add_two_content_slide(deck, title, left_title, left_content, right_title, right_content):
     """두 컬럼 슬라이드 추가"""
-    slide_layout = prs.slide_layouts[3] if len(prs.slide_layouts) > 3 else prs.slide_layouts[1]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = deck.new_slide(3)
     
     title_shape = slide.shapes.title
     title_shape.text = title
     
-    # 왼쪽 컬럼
-    left = Inches(0.5)
+    stack = deck.theme.stack
     top = Inches(1.5)
     width = Inches(4.5)
     height = Inches(4.5)
     
-    left_box = slide.shapes.add_textbox(left, top, width, height)
-    left_frame = left_box.text_frame
-    left_frame.clear()
-    
-    p = left_frame.add_paragraph()
-    p.text = left_title
-    p.font.bold = True
-    p.font.size = Pt(20)
-    
-    for item in left_content:
-        p = left_frame.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(16)
+    # 왼쪽 컬럼
+    deck.textbox(slide, Inches(0.5), top, width, height,
+                 [(left_title, stack.heading)] + [(f"• {item}", stack.bullet) for item in left_content],
+                 leading_blank=True)
         
     # 오른쪽 컬럼
-    right_left = Inches(5.5)
-    right_box = slide.shapes.add_textbox(right_left, top, width, height)
-    right_frame = right_box.text_frame
-    right_frame.clear()
-    
-    p = right_frame.add_paragraph()
-    p.text = right_title
-    p.font.bold = True
-    p.font.size = Pt(20)
-    
-    for item in right_content:
-        p = right_frame.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(16)
+    deck.textbox(slide, Inches(5.5), top, width, height,
+                 [(right_title, stack.heading)] + [(f"• {item}", stack.bullet) for item in right_content],
+                 leading_blank=True)
     
     return slide
 
 def create_presentation():
     """중국 SDV 표준 분석 프레젠테이션 생성"""
-    prs = Presentation()
+    deck = SlideBuilder(THEME)
     
     # 슬라이드 1: 표지
-    add_title_slide(prs, 
+    add_title_slide(deck, 
                     "중국 지능형 커넥티드카 서비스 인터페이스 표준\n(SDV/T 001-2022) 분석 보고",
                     "Part 1. Atomic Service & Part 2. Device Abstraction API 중심\nVersion 4 Beta 1")
     
     # 슬라이드 2: SDV 전환과 표준의 중요성
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "SDV 전환과 표준의 중요성",
                       ["• 소프트웨어 중심 자동차(SDV): 하드웨어가 아닌 소프트웨어에 의해 기능이 정의",
                        "• 지속적 업데이트: 스마트폰처럼 SW 업데이트만으로 새로운 기능 추가",
@@ -105,7 +93,7 @@ def create_presentation():
                        "• 개발 복잡성 감소 및 산업 생태계 구축의 기반"])
     
     # 슬라이드 3: 중국 SDV 표준화 동향
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "중국의 표준화 전략: SDV/T 001-2022",
                       ["• 주도 기관: 중국자동차공업협회(CAAM) 소프트웨어 분과",
                        "• 표준화 목표:",
@@ -114,7 +102,7 @@ def create_presentation():
                        "  - 부품사-완성차 간 개발 비용 절감 및 빠른 상용화"])
     
     # 슬라이드 4: 표준 개발 핵심 참여사
-    add_two_content_slide(prs,
+    add_two_content_slide(deck,
                           "표준 개발 핵심 참여사",
                           "주요 완성차 업체(OEM)",
                           ["BYD(比亚迪汽车工业有限公司)",
@@ -129,7 +117,7 @@ def create_presentation():
                            "Baidu(北京百度智行科技有限公司)"])
     
     # 슬라이드 5: 4-Layer 아키텍처
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "SDV 서비스 소프트웨어 4계층 아키텍처",
                       ["• 애플리케이션 계층: 사용자 경험 및 차량 특화 기능 구현",
                        "• 아토믹 서비스 계층 (Part 1): 표준화된 기능 단위 제공",
@@ -137,7 +125,7 @@ def create_presentation():
                        "• 기초 플랫폼 계층: OS, 컴퓨팅 하드웨어 등 기본 실행 환경"])
     
     # 슬라이드 6: API 계층의 역할과 관계
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "소프트웨어와 하드웨어의 분리(Decoupling)",
                       ["• 아토믹 서비스 API (Part 1):",
                        "  - 애플리케이션 개발자가 물리적 구조를 몰라도 기능 호출 가능",
@@ -150,7 +138,7 @@ def create_presentation():
                        "• 기대 효과: 하드웨어 교체 시 SW 변경 최소화, 재사용성 극대화"])
     
     # 슬라이드 7: Part 1 개요
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "Part 1: 아토믹 서비스 API - '기능'의 표준화",
                       ["• 애플리케이션이 차량 핵심 기능을 쉽게 사용하도록 표준화된 서비스 집합",
                        "",
@@ -163,7 +151,7 @@ def create_presentation():
                        "  - HMI (Human Machine Interface): 사용자 인터페이스"])
     
     # 슬라이드 8: BCM 도메인
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "BCM: 차량 편의 기능 서비스",
                       ["• BCM_Door: unlock(), lock(), open(), close(), adjustPosition()",
                        "• BCM_Window: lock(), unlock(), open(), close(), adjustPosition()",
@@ -172,7 +160,7 @@ def create_presentation():
                        "• BCM_WiperWash: startWiping(), stopWiping(), startSprayWashing()"])
     
     # 슬라이드 9: TMS/VCS/EMS 도메인
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "TMS/VCS/EMS: 차량 운행 핵심 기능 서비스",
                       ["• TMS (열 관리):",
                        "  - TMS_AC.setTargetTemp(): 실내 목표 온도 설정",
@@ -187,7 +175,7 @@ def create_presentation():
                        "  - EMS_HVBatt.getSOC(): 고전압 배터리 충전 상태 조회"])
     
     # 슬라이드 10: ADAS 도메인
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "ADAS: 지능형 주행 기능 서비스",
                       ["• ADAS_Perception (시각 인지):",
                        "  - getTrackObjects(): 차량, 보행자 등 객체 정보 획득",
@@ -199,7 +187,7 @@ def create_presentation():
                        "  - notifyObjects(): 레이더/라이다가 탐지한 객체 정보 획득"])
     
     # 슬라이드 11: 시나리오 예시
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "시나리오: '퇴근 모드' 기능 구현",
                       ["• 시트 및 미러 조정:",
                        "  - BCM_Seat.adjustMainXDir(position): 운전석 시트 위치 조정",
@@ -213,7 +201,7 @@ def create_presentation():
                        "  - BCM_Massage.startMassage(KNEAD, GENTLE): 부드러운 주무르기"])
     
     # 슬라이드 12: Part 2 개요
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "Part 2: 디바이스 추상화 API - '장치'의 표준화",
                       ["• 차량의 물리적 장치(센서, 모터 등) 제어를 위한 표준 인터페이스",
                        "• 특정 제조사 부품에 상관없이 동일한 API로 제어",
@@ -226,7 +214,7 @@ def create_presentation():
                        "  - ADAS: 첨단 운전자 보조"])
     
     # 슬라이드 13: BCM 장치 제어
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "BCM: 차체 편의 장치 제어",
                       ["• Actr_DoorLock: 도어 잠금 모터 제어",
                        "• Actr_DoubleHallMot: 홀 센서가 장착된 창문/선루프 모터 제어",
@@ -235,7 +223,7 @@ def create_presentation():
                        "• Snsr_SeatOccupied: 좌석 탑승 감지 센서"])
     
     # 슬라이드 14: PWT 도메인
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "PWT: 동력 및 충전 관련 장치 제어",
                       ["• Actr_ChrgElecLock: 충전 포트 잠금 장치 제어",
                        "• Snsr_AcChrgPortT: 교류(AC) 충전 포트 온도 센서",
@@ -244,7 +232,7 @@ def create_presentation():
                        "• Actr_DcdcCtrl: DC-DC 컨버터 제어"])
     
     # 슬라이드 15: ADAS 센서
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "ADAS: 센서 원시 데이터(Raw Data) 제공",
                       ["• Snsr_Camera:",
                        "  - ntfRawData: 카메라 원본 이미지",
@@ -256,7 +244,7 @@ def create_presentation():
                        "• Snsr_GPS: GPS 위치 정보"])
     
     # 슬라이드 16: API 연관 관계
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "API 계층 간 호출 흐름: '창문 열기'",
                       ["1. 애플리케이션: 사용자가 '창문 열기' 버튼 터치",
                        "",
@@ -274,7 +262,7 @@ def create_presentation():
                        "   - ntfHallQuarterCnt()로 현재 위치 전달"])
     
     # 슬라이드 17: 특징 요약
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "중국 SDV 표준의 특징 요약",
                       ["• 생태계:",
                        "  - BYD, Huawei 등 중국 완성차, 부품사, SW 기업 대거 참여",
@@ -288,7 +276,7 @@ def create_presentation():
                        "  - 편의 기능부터 ADAS, 파워트레인까지 차량 전체 시스템 포괄"])
     
     # 슬라이드 18: 시사점 및 제언
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "시사점 및 국내 전략 제언",
                       ["• 시사점:",
                        "  - 중국 시장 진출 시 표준 준수가 필수 요건화 가능성",
@@ -301,7 +289,7 @@ def create_presentation():
                        "  - 고부가가치 소프트웨어 시장 대비"])
     
     # 슬라이드 19: 한국형 표준 제안
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "한국형 SDV 표준 제안 방향",
                       ["• Core API + Extension Profiles:",
                        "  - 핵심 API만 표준화, 확장은 Profile 형식으로 추가",
@@ -318,7 +306,7 @@ def create_presentation():
                        "  - V2X 및 데이터 공유 기능 표준화"])
     
     # 슬라이드 20: 향후 계획
-    add_content_slide(prs,
+    add_content_slide(deck,
                       "향후 추진 계획",
                       ["• 도메인별 심층 분석:",
                        "  - 핵심 도메인(ADAS, PWT 등) API 상세 사양 분석",
@@ -330,11 +318,19 @@ def create_presentation():
                        "  - 국내 실정에 맞는 표준 API 개발 추진"])
     
     # 슬라이드 21: Q&A
-    add_title_slide(prs, "Q & A", "감사합니다.")
+    add_title_slide(deck, "Q & A", "감사합니다.")
     
-    return prs
+    return deck.prs
+
+def build(output_file=OUTPUT_FILE):
+    """기본 분석 덱 생성 후 저장, 전체 페이지 수 반환"""
+    prs = create_presentation()
+    save_presentation(prs, output_file)
+    return len(prs.slides)
+
+def main():
+    build()
+    print("프레젠테이션이 성공적으로 생성되었습니다: 중국_SDV_표준_분석_v4.pptx")
 
-# 프레젠테이션 생성 및 저장
-prs = create_presentation()
-prs.save('/home/kim/github-sdv/중국_SDV_표준_분석_v4.pptx')
-print("프레젠테이션이 성공적으로 생성되었습니다: 중국_SDV_표준_분석_v4.pptx")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
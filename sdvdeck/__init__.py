@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+SDV 발표 자료 생성용 공용 패키지
+"""
+
+from sdvdeck.builder import (
+    BoxStyle,
+    ShapeSpec,
+    SlideBuilder,
+    StackStyle,
+    TextStyle,
+    Theme,
+    page_style,
+    split_lines,
+)
+from sdvdeck.images import UnsupportedImageError
+
+__all__ = [
+    "BoxStyle",
+    "ShapeSpec",
+    "SlideBuilder",
+    "StackStyle",
+    "TextStyle",
+    "Theme",
+    "UnsupportedImageError",
+    "page_style",
+    "split_lines",
+]
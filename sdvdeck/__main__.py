@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+python -m sdvdeck build [-o 출력 폴더] [-j 프로세스 수] [-z 스레드 수] [-i] [-r] [스크립트 이름 ...]
+python -m sdvdeck build-all [-o 출력 폴더] [-j 프로세스 수] [-r]
+python -m sdvdeck compile [-o 출력 폴더] [-i] [-z 스레드 수] [-r] 명세.yaml [변형 이름 ...]
+python -m sdvdeck image-cache {stats,prune,clear} [--max-mb N]
+python -m sdvdeck duplicates [이미지 폴더] [-t 거리]
+python -m sdvdeck assets [이미지 폴더] [-t 태그 ...]
+python -m sdvdeck merge -o 출력.pptx [-r] 덱.pptx[:1-5,8] ...
+python -m sdvdeck split [-o 출력 폴더] [-r] 덱.pptx [1-5 6-12 ...]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+from sdvdeck import reproducible
+from sdvdeck.batch import DECK_SCRIPTS, INCREMENTAL_SCRIPTS, ROOT, build_all, build_everything
+from sdvdeck.phash import DEFAULT_THRESHOLD
+
+REPRODUCIBLE_HELP = "같은 입력이면 같은 바이트로 저장 (SOURCE_DATE_EPOCH, 없으면 1980-01-01)"
+
+
+def cmd_build(parser, args):
+    for name in args.names:
+        if name not in DECK_SCRIPTS:
+            parser.error(f"알 수 없는 스크립트: {name}")
+    started = time.perf_counter()
+    _print_results(build_all(args.out_dir or ROOT, args.names or None, args.jobs or 1,
+                             args.zip_threads, args.incremental), started)
+
+
+def cmd_build_all(parser, args):
+    from sdvdeck.spec import SpecError
+
+    started = time.perf_counter()
+    try:
+        results = build_everything(args.out_dir or ROOT, args.jobs)
+    except SpecError as e:
+        print(f"명세 오류 - {e}", file=sys.stderr)
+        return 1
+    _print_results(results, started)
+
+
+def _print_results(results, started):
+    for name, path, seconds in results:
+        print(f"{name:36s} {seconds:6.2f}s  {path}")
+    total = sum(seconds for _, _, seconds in results)
+    print(f"합계 {total:.2f}s (실제 경과 {time.perf_counter() - started:.2f}s)")
+
+
+def cmd_compile(parser, args):
+    from sdvdeck import zipwriter
+    from sdvdeck.spec import SpecError, build_variants, load_spec
+
+    if args.zip_threads:
+        zipwriter.set_threads(args.zip_threads)
+    try:
+        spec = load_spec(args.spec)
+        results = build_variants(spec, args.out_dir, args.names or None, args.incremental)
+        for name, path, seconds, reused in results:
+            note = f"  (재사용 {reused}장)" if args.incremental or reused else ""
+            print(f"{name:24s} {seconds:6.2f}s  {path}{note}")
+    except SpecError as e:
+        print(f"명세 오류 - {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_image_cache(parser, args):
+    from sdvdeck.imagecache import DEFAULT_MAX_BYTES, ImageCache
+
+    max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else DEFAULT_MAX_BYTES
+    cache = ImageCache(max_bytes=max_bytes)
+    if args.action == "prune":
+        print(f"{cache.prune()}개 삭제")
+    elif args.action == "clear":
+        print(f"{cache.clear()}개 삭제")
+    stats = cache.stats()
+    print(f"위치     {cache.root}")
+    print(f"항목     {stats['entries']}개, {stats['bytes'] / 1048576:.1f} MB "
+          f"/ 상한 {stats['max_bytes'] / 1048576:.0f} MB")
+    print(f"적중률   {stats['hit_rate']:.1%} (적중 {stats['hits']}, 미스 {stats['misses']})")
+
+
+def cmd_duplicates(parser, args):
+    from sdvdeck.phash import duplicate_report
+
+    report = duplicate_report(args.folder, args.threshold)
+    for group, saved in report:
+        print(f"[{saved / 1024:.0f} KB 절약 가능]")
+        for path in group:
+            print(f"    {os.path.relpath(path, args.folder)}")
+    total = sum(saved for _, saved in report)
+    print(f"중복 묶음 {len(report)}개, 합치면 {total / 1024:.0f} KB 절약")
+
+
+def cmd_assets(parser, args):
+    from sdvdeck.assets import AssetManifest
+
+    manifest = AssetManifest(args.folder)
+    analyzed, removed = manifest.refresh()
+    for asset in manifest.tagged(*args.tags):
+        print(f"{asset.name[:48]:48s} {asset.format:5s} {asset.width:5d}x{asset.height:<5d} "
+              f"{asset.aspect:5.2f}  {' '.join(asset.colors)}  {','.join(asset.tags)}")
+    print(f"에셋 {len(manifest)}개 (이번에 분석 {analyzed}개, 뺀 항목 {removed}개)  {manifest.path}")
+
+
+def cmd_merge(parser, args):
+    from sdvdeck.merge import merge_decks
+
+    started = time.perf_counter()
+    try:
+        count = merge_decks([_deck_and_ranges(arg) for arg in args.decks], args.output)
+    except ValueError as e:
+        parser.error(str(e))
+    except Exception as e:
+        print(f"합치기 실패 - {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    print(f"{count}장 {time.perf_counter() - started:6.2f}s  {args.output}")
+
+
+def cmd_split(parser, args):
+    from sdvdeck.merge import split_deck
+
+    started = time.perf_counter()
+    try:
+        results = split_deck(args.deck, args.ranges or None, args.out_dir)
+    except ValueError as e:
+        parser.error(str(e))
+    except Exception as e:
+        print(f"나누기 실패 - {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    for path, count in results:
+        print(f"{count:4d}장  {path}")
+    print(f"파일 {len(results)}개 {time.perf_counter() - started:6.2f}s")
+
+
+def _deck_and_ranges(arg):
+    """'덱.pptx:1-5,8' -> ('덱.pptx', '1-5,8') (범위가 없으면 None)"""
+    path, sep, ranges = arg.rpartition(":")
+    if sep and re.fullmatch(r"[\d,\s-]+", ranges) and path:
+        return path, ranges
+    return arg, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="sdvdeck", description="SDV 발표 자료 일괄 생성")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="덱 스크립트 실행")
+    build.add_argument("-o", "--out-dir", help="출력 폴더 (기본: 저장소 루트)")
+    build.add_argument("-j", "--jobs", type=int, help="동시에 실행할 프로세스 수 (기본: 1)")
+    build.add_argument("-z", "--zip-threads", type=int, help="저장 시 DEFLATE 스레드 수 (기본: 1)")
+    build.add_argument("-i", "--incremental", action="store_true",
+                       help=f"{', '.join(INCREMENTAL_SCRIPTS)} 는 바뀌지 않은 슬라이드를 이전 출력에서 복제")
+    build.add_argument("-r", "--reproducible", action="store_true", help=REPRODUCIBLE_HELP)
+    build.add_argument("names", nargs="*", help="생성할 스크립트 (기본: 전체)", metavar="SCRIPT")
+    build.set_defaults(func=cmd_build)
+
+    build_all_ = sub.add_parser("build-all", help="덱 스크립트 + decks/ 명세의 모든 변형 병렬 생성")
+    build_all_.add_argument("-o", "--out-dir", help="출력 폴더 (기본: 저장소 루트)")
+    build_all_.add_argument("-j", "--jobs", type=int, help="동시에 실행할 프로세스 수 (기본: CPU 수)")
+    build_all_.add_argument("-r", "--reproducible", action="store_true", help=REPRODUCIBLE_HELP)
+    build_all_.set_defaults(func=cmd_build_all)
+
+    compile_ = sub.add_parser("compile", help="YAML/JSON 명세 컴파일")
+    compile_.add_argument("spec", help="명세 파일")
+    compile_.add_argument("-o", "--out-dir", help="출력 폴더 (기본: 명세 파일 기준 output 경로)")
+    compile_.add_argument("-i", "--incremental", action="store_true",
+                          help="입력이 그대로인 슬라이드는 이전 출력에서 복제")
+    compile_.add_argument("-z", "--zip-threads", type=int, help="저장 시 DEFLATE 스레드 수 (기본: 1)")
+    compile_.add_argument("-r", "--reproducible", action="store_true", help=REPRODUCIBLE_HELP)
+    compile_.add_argument("names", nargs="*", help="생성할 변형 (기본: 전체)", metavar="VARIANT")
+    compile_.set_defaults(func=cmd_compile)
+
+    image_cache = sub.add_parser("image-cache", help="변환 이미지 캐시 통계/정리")
+    image_cache.add_argument("action", nargs="?", default="stats", choices=("stats", "prune", "clear"))
+    image_cache.add_argument("--max-mb", type=float, help="용량 상한 (기본: 512)")
+    image_cache.set_defaults(func=cmd_image_cache)
+
+    duplicates = sub.add_parser("duplicates", help="눈으로 같은 이미지 묶음 찾기 (dHash)")
+    duplicates.add_argument("folder", nargs="?", default=os.path.join(ROOT, "img"))
+    duplicates.add_argument("-t", "--threshold", type=int, default=DEFAULT_THRESHOLD,
+                            help=f"같은 이미지로 볼 해밍 거리 (기본: {DEFAULT_THRESHOLD}, 최대 64)")
+    duplicates.set_defaults(func=cmd_duplicates)
+
+    assets = sub.add_parser("assets", help="이미지 에셋 매니페스트 갱신/조회 (크기, 대표 색, 태그)")
+    assets.add_argument("folder", nargs="?", default=os.path.join(ROOT, "img"))
+    assets.add_argument("-t", "--tag", dest="tags", action="append", default=[],
+                        help="이 태그가 붙은 에셋만 (여러 번 지정하면 모두 가진 것)")
+    assets.set_defaults(func=cmd_assets)
+
+    merge = sub.add_parser("merge", help="덱 여러 개를 하나로 합치기 (이미지/미디어 중복 제거)")
+    merge.add_argument("decks", nargs="+", metavar="DECK[:범위]",
+                       help="합칠 덱 (첫 덱의 마스터/테마를 바탕으로 씀, 예: deck.pptx:1-5,8)")
+    merge.add_argument("-o", "--output", required=True, help="출력 파일")
+    merge.add_argument("-r", "--reproducible", action="store_true", help=REPRODUCIBLE_HELP)
+    merge.set_defaults(func=cmd_merge)
+
+    split = sub.add_parser("split", help="덱을 구간/구역별 파일로 나누기")
+    split.add_argument("deck", help="나눌 덱")
+    split.add_argument("ranges", nargs="*", metavar="RANGE",
+                       help="파일 하나에 넣을 슬라이드 범위 (예: 1-5,8, 기본: 구역별)")
+    split.add_argument("-o", "--out-dir", help="출력 폴더 (기본: 덱과 같은 폴더)")
+    split.add_argument("-r", "--reproducible", action="store_true", help=REPRODUCIBLE_HELP)
+    split.set_defaults(func=cmd_split)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "reproducible", False):
+        reproducible.enable()
+    return args.func(parser, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 폴더의 에셋 매니페스트 (픽셀 크기, 비율, 대표 색, dHash, 태그)
+
+덱 스크립트가 후보 파일 이름을 차례로 os.path.exists() 하고 add_picture 를
+try/except 로 감싸 넣어 보는 대신, 폴더를 한 번 훑어 만든 매니페스트에서 사전
+조회로 고르고 크기를 정하도록 한다. 읽을 수 없는 파일은 매니페스트에 없으므로
+넣다가 실패하는 일이 없다.
+
+    .sdvdeck/assets/<폴더 이름>-<경로 해시>.json
+
+파일마다 (크기, mtime_ns) 를 적어 두고 refresh() 는 바뀐 파일만 다시 분석한다
+(지운 파일은 뺌). 태그는 파일 이름의 키워드(TAG_KEYWORDS)와 64px 축소본의 색
+분포로 정한다.
+
+- logo: 이름에 logo/로고, 또는 투명 영역이 있고 색이 적은 이미지
+- diagram: 흰 바탕에 색이 몇 개 안 되는 도표/스크린숏 (architecture 는 항상 diagram)
+- photo: logo, diagram 이 아닌 이미지
+- landscape / portrait / square: 가로/세로 비율
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+
+from sdvdeck.phash import dhash
+from sdvdeck.probe import image_info
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            ".sdvdeck", "assets")
+DEFAULT_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "img")
+
+# 저장 형식/태그 기준이 바뀌면 올려서 다시 분석
+MANIFEST_VERSION = 1
+
+# 파일 이름(소문자)에 들어 있으면 붙이는 태그
+TAG_KEYWORDS = {
+    "logo": ("logo", "로고"),
+    "architecture": ("architecture", "아키텍처", "구조도", "platform", "플랫폼"),
+    "infographic": ("infographic", "인포그래픽"),
+}
+
+# 색 분포 분석용 축소본 크기, 대표 색 수
+THUMBNAIL_SIZE = 64
+DOMINANT_COLORS = 4
+
+# 상위 8색이 이 비율 이상을 덮고 밝은 픽셀이 LIGHT_SHARE 이상이면 diagram
+FLAT_SHARE = 0.6
+LIGHT_SHARE = 0.4
+# 투명 영역이 있고 색이 이 수 이하면 logo
+LOGO_MAX_COLORS = 32
+# 이 범위 밖이면 landscape/portrait
+SQUARE_TOLERANCE = 0.1
+
+
+@dataclass(frozen=True)
+class Asset:
+    """매니페스트 항목 (width/height 는 EXIF 회전을 반영한 픽셀 크기)"""
+    name: str
+    path: str
+    format: str
+    width: int
+    height: int
+    colors: tuple = ()          # 대표 색 "#rrggbb" (많이 쓴 순)
+    phash: int = 0              # phash.dhash 값
+    tags: tuple = ()
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    @property
+    def aspect(self):
+        """가로/세로 비율"""
+        return self.width / self.height
+
+    def fit(self, width, height):
+        """비율을 지키며 width × height 상자에 들어가는 (가로, 세로) EMU"""
+        scaled = int(round(width * self.height / self.width))
+        if scaled <= height:
+            return width, scaled
+        return int(round(height * self.width / self.height)), height
+
+
+class AssetManifest:
+    """folder 의 이미지 에셋 색인 (이름 -> Asset)"""
+
+    def __init__(self, folder=DEFAULT_FOLDER, path=None):
+        self.folder = folder
+        self.path = path or manifest_path(folder)
+        self._entries = None            # 이름 -> {"stamp": [...], "asset": {...}} (읽을 수 없으면 asset 없음)
+        self._assets = {}
+
+    def refresh(self):
+        """바뀐 파일만 다시 분석하고 저장, (분석한 수, 뺀 수) 반환"""
+        if self._entries is None:
+            self._entries = self._read()
+        entries = self._entries
+        seen = set()
+        analyzed = 0
+        for entry in sorted(os.scandir(self.folder), key=lambda entry: entry.name):
+            if not entry.is_file() or entry.name.startswith("."):
+                continue
+            stat = entry.stat()
+            stamp = [stat.st_size, stat.st_mtime_ns]
+            seen.add(entry.name)
+            old = entries.get(entry.name)
+            if old is not None and old["stamp"] == stamp:
+                continue
+            entries[entry.name] = {"stamp": stamp, **_analyze(entry.path, entry.name)}
+            analyzed += 1
+        removed = [name for name in entries if name not in seen]
+        for name in removed:
+            del entries[name]
+        self._assets = {name: self._asset(name, entry["asset"])
+                        for name, entry in sorted(entries.items()) if "asset" in entry}
+        if analyzed or removed:
+            self._save()
+        return analyzed, len(removed)
+
+    def get(self, name):
+        """이름으로 Asset 조회 (없거나 읽을 수 없는 파일이면 None)"""
+        return self._assets.get(name)
+
+    def first(self, names):
+        """names 중 매니페스트에 있는 첫 Asset (없으면 None)"""
+        for name in names:
+            asset = self._assets.get(name)
+            if asset is not None:
+                return asset
+        return None
+
+    def tagged(self, *tags):
+        """tags 를 모두 가진 Asset 목록 (이름 순)"""
+        return [asset for asset in self._assets.values() if all(tag in asset.tags for tag in tags)]
+
+    def __contains__(self, name):
+        return name in self._assets
+
+    def __iter__(self):
+        return iter(self._assets.values())
+
+    def __len__(self):
+        return len(self._assets)
+
+    def _asset(self, name, fields):
+        return Asset(name, os.path.join(self.folder, name), fields["format"], fields["width"],
+                     fields["height"], tuple(fields["colors"]), int(fields["phash"], 16),
+                     tuple(fields["tags"]))
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save(self):
+        folder = os.path.dirname(self.path)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "folder": os.path.abspath(self.folder),
+                           "files": self._entries}, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass                        # 못 써도 이번 실행에는 지장 없음
+
+
+def manifest_path(folder, root=DEFAULT_ROOT):
+    folder = os.path.abspath(folder)
+    digest = hashlib.sha1(folder.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(root, f"{os.path.basename(folder)}-{digest}.json")
+
+
+def _analyze(path, name):
+    """{"asset": {...}}, 읽을 수 없는 파일이면 {} (다음 refresh 에서도 다시 보지 않음)"""
+    from PIL import Image
+
+    try:
+        info = image_info(path)
+        with Image.open(path) as im:
+            hash_value = dhash(im)      # phash.image_signature 와 같은 값 (draft 는 한 번만 먹으므로 따로 엶)
+        with Image.open(path) as im:
+            im.draft("RGB", (THUMBNAIL_SIZE * 2, THUMBNAIL_SIZE * 2))
+            transparent = _transparent(im)
+            thumb = im.convert("RGB")
+            thumb.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError):
+        return {}
+    width, height = info.display_size
+    colors = _dominant_colors(thumb)
+    return {"asset": {
+        "format": info.format, "width": width, "height": height, "colors": colors,
+        "phash": f"{hash_value:016x}",
+        "tags": _tags(name, width, height, thumb, transparent),
+    }}
+
+
+def _transparent(im):
+    if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+        return im.convert("RGBA").getchannel("A").getextrema()[0] < 255
+    return False
+
+
+def _dominant_colors(thumb):
+    palette = thumb.quantize(DOMINANT_COLORS).convert("RGB")
+    counts = sorted(palette.getcolors(DOMINANT_COLORS), reverse=True)
+    return ["#%02x%02x%02x" % rgb for _, rgb in counts]
+
+
+def _tags(name, width, height, thumb, transparent):
+    lowered = name.lower()
+    tags = [tag for tag, words in TAG_KEYWORDS.items() if any(word in lowered for word in words)]
+    # 4비트로 줄인 색의 분포: 상위 8색 비율, 밝은 색 비율
+    counts = sorted(thumb.point(lambda v: v & 0xF0).getcolors(THUMBNAIL_SIZE ** 2), reverse=True)
+    total = sum(count for count, _ in counts)
+    flat = sum(count for count, _ in counts[:8]) / total
+    light = sum(count for count, rgb in counts if min(rgb) >= 0xD0) / total
+    if "logo" not in tags and transparent and len(counts) <= LOGO_MAX_COLORS:
+        tags.append("logo")
+    if "logo" not in tags and ("architecture" in tags or (flat >= FLAT_SHARE and light >= LIGHT_SHARE)):
+        tags.append("diagram")
+    if "logo" not in tags and "diagram" not in tags:
+        tags.append("photo")
+    if transparent:
+        tags.append("transparent")
+    aspect = width / height
+    if aspect > 1 + SQUARE_TOLERANCE:
+        tags.append("landscape")
+    elif aspect < 1 - SQUARE_TOLERANCE:
+        tags.append("portrait")
+    else:
+        tags.append("square")
+    return tags
+
+
+_MANIFESTS = {}
+
+
+def image_assets(folder=DEFAULT_FOLDER):
+    """folder 의 공용 매니페스트 (프로세스에서 처음 부를 때 한 번 refresh)"""
+    key = os.path.abspath(folder)
+    manifest = _MANIFESTS.get(key)
+    if manifest is None:
+        manifest = _MANIFESTS[key] = AssetManifest(folder)
+        manifest.refresh()
+    return manifest
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+여러 덱을 한 번에 생성
+
+python-pptx 임포트와 테마별 도형 프로토타입을 한 번만 준비하고
+여섯 개 스크립트의 build() 를 차례로 호출한다.
+jobs 를 2 이상 주면 프로세스 풀에서 덱 단위로 나눠 생성한다.
+"""
+
+import glob
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sdvdeck.imagecache import flush_stats
+from sdvdeck.probe import flush_manifest
+
+# 저장소 루트 (스크립트가 img/ 상대 경로를 사용하므로 여기서 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 선언형 명세 폴더 (decks/*.yaml, *.json)
+SPEC_DIR = os.path.join(ROOT, "decks")
+
+DECK_SCRIPTS = [
+    "create_sdv_presentation",
+    "create_professional_ppt",
+    "create_keti_style_ppt",
+    "create_china_sdv_focused_ppt",
+    "create_perfect_sdv_ppt",
+    "create_15min_sdv_ppt_with_images",
+]
+
+# build(output_file, incremental=True) 로 바뀐 슬라이드만 다시 만들 수 있는 스크립트
+INCREMENTAL_SCRIPTS = ("create_keti_style_ppt",)
+
+
+def output_path(module, out_dir):
+    """스크립트 기본 출력 파일명을 out_dir 아래 경로로 변환"""
+    return os.path.join(out_dir, os.path.basename(module.OUTPUT_FILE))
+
+
+def spec_files(spec_dir=SPEC_DIR):
+    return sorted(glob.glob(os.path.join(spec_dir, "*.yaml")) +
+                  glob.glob(os.path.join(spec_dir, "*.yml")) +
+                  glob.glob(os.path.join(spec_dir, "*.json")))
+
+
+def build_all(out_dir=ROOT, names=None, jobs=1, zip_threads=None, incremental=False):
+    """덱 스크립트 전체(또는 names)를 생성하고 [(이름, 출력 경로, 초)] 반환
+
+    incremental=True 이면 INCREMENTAL_SCRIPTS 는 이전 출력의 슬라이드를 재사용한다.
+    """
+    tasks = [("script", name, incremental and name in INCREMENTAL_SCRIPTS)
+             for name in names or DECK_SCRIPTS]
+    return run_tasks(tasks, out_dir, jobs, zip_threads)
+
+
+def build_everything(out_dir=ROOT, jobs=None, specs=None):
+    """덱 스크립트 + 명세의 모든 변형을 생성 (jobs 기본값: CPU 수)"""
+    from sdvdeck.spec import load_spec
+
+    tasks = [("script", name, False) for name in DECK_SCRIPTS]
+    for path in specs if specs is not None else spec_files():
+        tasks += [("spec", os.path.abspath(path), variant) for variant in load_spec(path).variants]
+    return run_tasks(tasks, out_dir, jobs or os.cpu_count() or 1)
+
+
+def run_tasks(tasks, out_dir, jobs=1, zip_threads=None):
+    """("script", 이름, 증분 여부) / ("spec", 명세 경로, 변형) 작업들을 실행해 입력 순서대로 결과 반환
+
+    zip_threads 는 프로세스마다 저장 시 쓸 DEFLATE 스레드 수 (기본: 1).
+    """
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = min(jobs, len(tasks))
+    if jobs <= 1:
+        cwd = os.getcwd()
+        _prepare_worker(zip_threads)
+        try:
+            return [_run_task(task, out_dir) for task in tasks]
+        finally:
+            os.chdir(cwd)
+    # 작업마다 프로세스를 새로 띄우지 않고, 워커별로 임포트/프로토타입 캐시를 재사용
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_prepare_worker,
+                             initargs=(zip_threads,)) as pool:
+        return list(pool.map(_run_task, tasks, [out_dir] * len(tasks)))
+
+
+def _prepare_worker(zip_threads=None):
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    if zip_threads:
+        from sdvdeck import zipwriter
+
+        zipwriter.set_threads(zip_threads)
+
+
+def _run_task(task, out_dir):
+    """작업 하나 실행 후 (이름, 출력 경로, 소요 초) 반환 (워커 프로세스에서 호출)"""
+    started = time.perf_counter()
+    if task[0] == "script":
+        name, incremental = task[1:]
+        module = importlib.import_module(name)
+        path = output_path(module, out_dir)
+        if incremental:
+            module.build(path, incremental=True)
+        else:
+            module.build(path)
+    else:
+        from sdvdeck.spec import build_variants, load_spec
+
+        spec_path, variant = task[1:]
+        name = f"{os.path.basename(spec_path)}:{variant}"
+        path = build_variants(load_spec(spec_path), out_dir, [variant])[0][1]
+    flush_stats()
+    flush_manifest()
+    return name, path, time.perf_counter() - started
@@ -0,0 +1,533 @@
+# -*- coding: utf-8 -*-
+"""
+공용 슬라이드 빌더
+
+여섯 개의 생성 스크립트가 각자 구현하던 헤더 바, 타이틀, 불릿, 페이지 번호를
+한 곳에 모은 모듈. 스타일이 적용된 도형 XML은 (테마, 스타일)별로 한 번만
+만들어 두고 슬라이드마다 복제(deepcopy)해서 붙인다.
+"""
+
+import copy
+import io
+import os
+from dataclasses import dataclass
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.shapes.autoshape import AutoShapeType, Shape
+from pptx.text.text import _Paragraph
+from pptx.util import Inches, Pt
+
+from sdvdeck import fastpackage, fonts, lazyzip, probe, reproducible, textfit, zipwriter
+from sdvdeck.images import DEFAULT_DPI, prepare_image
+from sdvdeck.overflow import CONTINUED, entry_box, entry_steps, plan_stack, stack_entries
+from sdvdeck.phash import DuplicateIndex
+from sdvdeck.streaming import StreamingWriter
+
+# 이미지 파트 sha1 색인 (add_picture 가 패키지 전체를 훑지 않도록)
+fastpackage.install()
+# add_picture 의 형식/크기/DPI 는 PIL 대신 헤더만 읽어서
+probe.install()
+# 템플릿 .pptx 를 열 때 쓰지 않는 미디어는 압축을 풀지 않음
+lazyzip.install()
+# Linux 에서도 TextFrame.fit_text 가 글꼴을 찾도록 (색인은 .sdvdeck/ 에 저장)
+fonts.install()
+# 한중일 문자 줄바꿈과 글자 너비 캐시로 fit_text 계산
+textfit.install()
+# 이미 압축된 미디어는 STORED 로, XML 은 DEFLATE 로 저장 (스레드 수는 zipwriter.set_threads)
+zipwriter.install()
+# SOURCE_DATE_EPOCH 가 있으면 zip 시각 고정, 파트 이름 순 저장
+reproducible.install()
+
+
+@dataclass(frozen=True)
+class TextStyle:
+    """문단 단위 글꼴 스타일 (a:pPr/a:defRPr 로 기록됨)"""
+    size: int = None
+    bold: bool = None
+    color: RGBColor = None
+    align: PP_ALIGN = None
+    font: str = None
+    line_spacing: float = None
+    space_after: int = None
+
+
+@dataclass(frozen=True)
+class BoxStyle:
+    """도형/텍스트박스 단위 스타일 (채우기, 테두리, 여백, 앵커)"""
+    fill: RGBColor = None
+    line: object = None          # None: 기본값, False: 테두리 없음, RGBColor: 테두리 색
+    line_width: int = None
+    margin_left: int = None
+    margin_right: int = None
+    margin_top: int = None
+    anchor: object = None
+    word_wrap: bool = None
+
+
+@dataclass(frozen=True)
+class StackStyle:
+    """헤딩/불릿/일반 항목이 세로로 쌓이는 본문 영역 스타일"""
+    heading: TextStyle
+    bullet: TextStyle
+    item: TextStyle
+    heading_height: int = Inches(0.6)
+    heading_step: int = Inches(0.6)
+    bullet_indent: int = Inches(0.5)
+    bullet_shrink: int = Inches(0.5)
+    bullet_height: int = Inches(0.5)
+    bullet_step: int = Inches(0.5)
+    item_height: int = Inches(0.5)
+    item_step: int = Inches(0.6)
+    bullet_mark: str = "• "
+
+
+@dataclass(frozen=True)
+class ShapeSpec:
+    """SlideBuilder.emit 로 한 번에 추가할 도형 하나 (shape() 인자와 같음)"""
+    kind: object                 # "textbox" 또는 MSO_SHAPE 값
+    left: int
+    top: int
+    width: int
+    height: int
+    box: BoxStyle = BoxStyle()
+    paragraphs: tuple = ()
+    leading_blank: bool = False
+
+
+@dataclass(frozen=True)
+class Theme:
+    """덱 하나의 공통 모양 (헤더 바, 타이틀, 페이지 번호, 본문 스택)"""
+    name: str
+    header_color: RGBColor
+    title: TextStyle
+    stack: StackStyle
+    page: TextStyle
+    header_height: int = Inches(1.2)
+    header_line: object = None
+    title_box: tuple = (Inches(0.5), Inches(0.2), Inches(14), Inches(0.8))
+    title_in_band: bool = False       # True: 타이틀을 헤더 바 도형 안에 직접 기록 (KETI 스타일)
+    band_margin_left: int = Inches(0.5)
+    page_box: tuple = (Inches(14.5), Inches(8.3), Inches(1), Inches(0.5))
+    content_box: tuple = (Inches(0.5), Inches(1.5), Inches(14))   # 본문 스택 (left, top, width)
+    content_bottom: int = None        # 본문 스택 아래 한계 (None: 페이지 번호 위)
+    overflow: str = "auto"            # 스택이 넘칠 때 (overflow.OVERFLOW_POLICIES, None: 검사 안 함)
+    layout_index: int = 6
+    slide_width: int = Inches(16)
+    slide_height: int = Inches(9)
+    clamp_to_slide: bool = False
+
+
+# 재배치한 불릿 스택 글상자 (overflow 가 줄 바꿈을 가정하고 높이를 잼)
+_WRAPPED_BOX = BoxStyle(word_wrap=True)
+
+# 테마별 프로토타입 캐시: 키 -> 스타일이 적용된 lxml 요소
+# 모듈 수준에 두어 같은 프로세스에서 여러 덱을 만들 때 재사용된다
+_SHAPE_PROTOTYPES = {}
+_PARAGRAPH_PROTOTYPES = {}
+
+
+def _shape_prototype(kind, box):
+    """스타일이 적용된 p:sp 프로토타입 (kind 는 'textbox' 또는 MSO_SHAPE 값)"""
+    key = (kind, box)
+    proto = _SHAPE_PROTOTYPES.get(key)
+    if proto is None:
+        if kind == "textbox":
+            sp = CT_Shape.new_textbox_sp(0, "TextBox", 0, 0, 0, 0)
+            basename = "TextBox"
+        else:
+            autoshape_type = AutoShapeType(kind)
+            sp = CT_Shape.new_autoshape_sp(0, autoshape_type.basename, autoshape_type.prst, 0, 0, 0, 0)
+            basename = autoshape_type.basename
+        _apply_box_style(Shape(sp, None), box)
+        proto = (sp, basename)
+        _SHAPE_PROTOTYPES[key] = proto
+    return proto
+
+
+def _apply_box_style(shape, box):
+    if box.fill is not None:
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = box.fill
+    if box.line is False:
+        shape.line.fill.background()
+    elif box.line is not None:
+        shape.line.color.rgb = box.line
+    if box.line_width is not None:
+        shape.line.width = box.line_width
+    text_frame = shape.text_frame
+    if box.margin_left is not None:
+        text_frame.margin_left = box.margin_left
+    if box.margin_right is not None:
+        text_frame.margin_right = box.margin_right
+    if box.margin_top is not None:
+        text_frame.margin_top = box.margin_top
+    if box.anchor is not None:
+        text_frame.vertical_anchor = box.anchor
+    if box.word_wrap is not None:
+        text_frame.word_wrap = box.word_wrap
+
+
+def _paragraph_prototype(style):
+    """스타일이 적용된 a:p 프로토타입"""
+    proto = _PARAGRAPH_PROTOTYPES.get(style)
+    if proto is None:
+        proto = parse_xml("<a:p %s/>" % nsdecls("a"))
+        if style is not None:
+            apply_text_style(_Paragraph(proto, None), style)
+        _PARAGRAPH_PROTOTYPES[style] = proto
+    return proto
+
+
+def apply_text_style(paragraph, style):
+    """python-pptx 문단 프록시에 TextStyle 적용"""
+    if style.size is not None:
+        paragraph.font.size = style.size
+    if style.bold is not None:
+        paragraph.font.bold = style.bold
+    if style.font is not None:
+        paragraph.font.name = style.font
+    if style.color is not None:
+        paragraph.font.color.rgb = style.color
+    if style.align is not None:
+        paragraph.alignment = style.align
+    if style.line_spacing is not None:
+        paragraph.line_spacing = style.line_spacing
+    if style.space_after is not None:
+        paragraph.space_after = style.space_after
+
+
+def clear_prototype_cache():
+    """프로토타입 캐시 비우기 (테스트/메모리 정리용)"""
+    _SHAPE_PROTOTYPES.clear()
+    _PARAGRAPH_PROTOTYPES.clear()
+
+
+class SlideBuilder:
+    """Presentation 하나에 테마를 입혀 슬라이드를 쌓는 빌더"""
+
+    def __init__(self, theme, prs=None, image_dpi=DEFAULT_DPI, dedupe_images=True):
+        self.theme = theme
+        self.image_dpi = image_dpi      # None 이면 이미지 원본 그대로 삽입
+        # 눈으로 같은 이미지는 처음 쓴 파일로 바꿔 한 파트만 넣음 (image_index.merged 에 기록)
+        self.image_index = DuplicateIndex() if dedupe_images else None
+        if prs is None:
+            prs = Presentation()
+            prs.slide_width = theme.slide_width
+            prs.slide_height = theme.slide_height
+        self.prs = prs
+        self.writer = None              # stream() 중이면 StreamingWriter
+
+    # 슬라이드 ----------------------------------------------------------
+
+    def new_slide(self, layout_index=None, background=None):
+        """빈 슬라이드 추가 (background 지정 시 단색 배경)"""
+        if layout_index is None:
+            layout_index = self.theme.layout_index
+        layouts = self.prs.slide_layouts
+        layout = layouts[layout_index] if len(layouts) > layout_index else layouts[0]
+        slide = self.prs.slides.add_slide(layout)
+        # 스크립트가 slide.shapes.add_* 를 직접 불러도 id 를 캐시에서 매기도록
+        turbo_shapes(slide)
+        if background is not None:
+            fill = slide.background.fill
+            fill.solid()
+            fill.fore_color.rgb = background
+        return slide
+
+    # 도형 --------------------------------------------------------------
+
+    def shape(self, slide, kind, left, top, width, height, box=BoxStyle(),
+              paragraphs=(), leading_blank=False):
+        """프로토타입을 복제해 도형/텍스트박스 추가
+
+        paragraphs 는 (텍스트, TextStyle 또는 None) 목록.
+        leading_blank=True 이면 text_frame.clear() 후 add_paragraph() 하던 기존
+        스크립트처럼 첫 번째 빈 문단을 남겨 둔다.
+        """
+        shapes = turbo_shapes(slide)
+        sp = self._new_sp(ShapeSpec(kind, left, top, width, height, box, paragraphs, leading_blank),
+                          shapes._next_shape_id)
+        shapes._spTree.insert_element_before(sp, "p:extLst")
+        return shapes._shape_factory(sp)
+
+    def emit(self, slide, specs):
+        """ShapeSpec 목록을 한 번에 추가하고 도형 목록 반환
+
+        id 는 슬라이드의 최대 id 를 한 번만 구해 차례로 매기고, 완성된 p:sp 들을
+        spTree 에 한 번에 끼워 넣는다 (도형마다 spTree 전체를 훑지 않음).
+        """
+        shapes = turbo_shapes(slide)
+        first_id = shapes._next_shape_id
+        elements = [self._new_sp(spec, first_id + i) for i, spec in enumerate(specs)]
+        shapes._cached_max_shape_id = first_id + len(elements) - 1
+        spTree = shapes._spTree
+        extLst = spTree.find(qn("p:extLst"))
+        index = len(spTree) if extLst is None else spTree.index(extLst)
+        spTree[index:index] = elements
+        return [shapes._shape_factory(sp) for sp in elements]
+
+    def textbox(self, slide, left, top, width, height, paragraphs=(), box=BoxStyle(),
+                leading_blank=False):
+        return self.shape(slide, "textbox", left, top, width, height, box, paragraphs, leading_blank)
+
+    def text(self, slide, text, left, top, width, height, style, style_all=False, box=BoxStyle()):
+        """text_frame.text = ... 후 첫 문단(또는 전체 문단)에 스타일을 주던 패턴"""
+        return self.textbox(slide, left, top, width, height, split_lines(text, style, style_all), box)
+
+    def fill_text_frame(self, text_frame, paragraphs):
+        """기존 텍스트 프레임(플레이스홀더 등)을 비우고 문단 추가"""
+        text_frame.clear()
+        self._fill_paragraphs(text_frame._txBody, paragraphs, leading_blank=True)
+
+    def picture(self, slide, image_file, left, top, width=None, height=None):
+        """이미지 추가 (표시 크기 × image_dpi 로 줄이고, AVIF/WebP 는 PNG/JPEG 로 변환)
+
+        읽을 수 없는 이미지는 UnsupportedImageError.
+        """
+        if not isinstance(image_file, str):
+            return slide.shapes.add_picture(image_file, left, top, width=width, height=height)
+        if self.image_index is not None:
+            image_file = self.image_index.canonical(image_file)
+        prepared, size = prepare_image(image_file, width, height, self.image_dpi)
+        if size is not None:
+            # 줄인 이미지의 반올림 오차 없이 원본 비율로 나머지 변 계산
+            px_width, px_height = size
+            if height is None and width is not None:
+                height = int(round(width * px_height / px_width))
+            elif width is None and height is not None:
+                width = int(round(height * px_width / px_height))
+        pic = slide.shapes.add_picture(prepared, left, top, width=width, height=height)
+        if size is not None:
+            # 스트림으로 넣으면 설명이 image.jpg 가 되므로 원본 파일명 유지
+            pic._element._nvXxPr.cNvPr.set("descr", os.path.basename(image_file))
+        return pic
+
+    def save(self, path):
+        """도형 id 중복을 검사한 뒤 저장 (stream() 중이면 남은 파트를 쓰고 마무리)"""
+        if self.writer is None:
+            save_presentation(self.prs, path)
+            return
+        if os.path.abspath(path) != os.path.abspath(self.writer.path):
+            raise ValueError(f"스트리밍 중인 파일은 {self.writer.path}")
+        self.writer.close()
+        self.writer = None
+
+    def stream(self, path):
+        """스트리밍 저장 시작: flush() 한 슬라이드를 path 에 바로 쓰고 save(path) 로 마무리"""
+        self.writer = StreamingWriter(self.prs, path, check_slide=check_slide_shape_ids)
+        return self.writer
+
+    def flush(self, slide=None):
+        """slide 까지 (없으면 지금까지) 만든 슬라이드를 써서 메모리에서 내림 (stream() 중일 때만)"""
+        if self.writer is not None:
+            self.writer.flush(slide)
+
+    # 테마 구성요소 -----------------------------------------------------
+
+    def header_bar(self, slide, text=None):
+        """상단 헤더 바 (title_in_band 테마면 타이틀까지 바 안에 기록)"""
+        theme = self.theme
+        box = BoxStyle(fill=theme.header_color, line=theme.header_line,
+                       margin_left=theme.band_margin_left if theme.title_in_band else None)
+        paragraphs = ()
+        if theme.title_in_band and text is not None:
+            paragraphs = ((text, theme.title),)
+        return self.shape(slide, MSO_SHAPE.RECTANGLE, 0, 0, theme.slide_width, theme.header_height,
+                          box, paragraphs, leading_blank=theme.title_in_band)
+
+    def title(self, slide, text, style=None):
+        """헤더 바 위 타이틀 텍스트"""
+        left, top, width, height = self.theme.title_box
+        return self.text(slide, text, left, top, width, height, style or self.theme.title)
+
+    def content_slide(self, title_text, slide_number=None, background=None):
+        """헤더 바 + 타이틀 (+ 페이지 번호) 까지 갖춘 슬라이드"""
+        slide = self.new_slide(background=background)
+        if self.theme.title_in_band:
+            self.header_bar(slide, title_text)
+        else:
+            self.header_bar(slide)
+            self.title(slide, title_text)
+        if slide_number is not None:
+            self.page_number(slide, slide_number)
+        return slide
+
+    def continuation(self, title_text, top, background=None, slide_number=None):
+        """bullet_stack 의 continue_slide 용: "(계속)" 타이틀 슬라이드와 본문 top 을 만드는 함수
+
+        slide_number 를 주면 이어지는 슬라이드에도 원래 슬라이드와 같은 페이지 번호를 단다.
+        """
+        return lambda: (self.content_slide(title_text + CONTINUED, slide_number, background), top)
+
+    def page_number(self, slide, number):
+        left, top, width, height = self.theme.page_box
+        return self.text(slide, str(number), left, top, width, height, self.theme.page)
+
+    def bullet_stack(self, slide, items, left, top, width, stack=None, bottom=None,
+                     overflow=None, continue_slide=None):
+        """헤딩/불릿 dict 또는 문자열 항목을 세로로 쌓고 다음 top 위치 반환
+
+        bottom(기본: theme.content_bottom) 아래로 넘치면 overflow 방식으로 줄이거나
+        두 단으로 나누거나, continue_slide() 가 돌려주는 (슬라이드, top) 으로 이어 쌓는다.
+        넘치지 않으면 예전처럼 고정 간격으로 쌓고, 재배치한 스택은 측정한 줄 수대로
+        간격을 두고 글상자 줄 바꿈을 켠다 (측정과 PowerPoint 렌더링이 같도록).
+        """
+        stack = stack or self.theme.stack
+        overflow = self.theme.overflow if overflow is None else overflow
+        entries = stack_entries(items)
+        if not overflow:
+            return self._stack(slide, entries, left, top, width, stack)
+        if bottom is None:
+            bottom = self.theme.content_bottom or self.theme.page_box[1]
+        plan = plan_stack(entries, stack, width, bottom - top, overflow,
+                          can_split=continue_slide is not None)
+        if plan.action == "fit":
+            return self._stack(slide, entries, left, top, width, stack)
+        for page_number, columns in enumerate(plan.pages):
+            if page_number:
+                slide, top = continue_slide()
+            end = top
+            for offset, column_width, column in columns:
+                steps = entry_steps(column, plan.stack, column_width)
+                end = max(end, self._stack(slide, column, left + offset, top, column_width,
+                                           plan.stack, steps))
+        return end
+
+    # 내부 --------------------------------------------------------------
+
+    def _stack(self, slide, entries, left, top, width, stack, steps=None):
+        """펼친 항목을 한 번에 추가
+
+        steps 가 없으면 스타일의 고정 간격으로 쌓고 줄 바꿈은 프로토타입 그대로(wrap="none"),
+        있으면 그 간격으로 쌓고 측정한 대로 줄이 넘어가도록 줄 바꿈을 켠다.
+        """
+        box = BoxStyle() if steps is None else _WRAPPED_BOX
+        specs = []
+        for i, (kind, text, _) in enumerate(entries):
+            style, step, height, indent, box_width, mark = entry_box(kind, stack, width)
+            specs.append(ShapeSpec("textbox", left + indent, top, box_width, height, box,
+                                   paragraphs=split_lines(f"{mark}{text}", style)))
+            top += step if steps is None else steps[i]
+        self.emit(slide, specs)
+        return top
+
+    def _new_sp(self, spec, shape_id):
+        """ShapeSpec 하나를 프로토타입 복제로 만든 p:sp (아직 슬라이드에 붙이지 않음)"""
+        width, height = spec.width, spec.height
+        if self.theme.clamp_to_slide and spec.kind == "textbox":
+            width, height = self._clamp(spec.left, spec.top, width, height)
+        proto, basename = _shape_prototype(spec.kind, spec.box)
+        sp = copy.deepcopy(proto)
+        cNvPr = sp.nvSpPr.cNvPr
+        cNvPr.id = shape_id
+        cNvPr.name = "%s %d" % (basename, shape_id - 1)
+        xfrm = sp.spPr.xfrm
+        xfrm.off.set("x", str(int(spec.left)))
+        xfrm.off.set("y", str(int(spec.top)))
+        xfrm.ext.set("cx", str(int(width)))
+        xfrm.ext.set("cy", str(int(height)))
+        self._fill_paragraphs(sp.txBody, spec.paragraphs, spec.leading_blank)
+        return sp
+
+    def _clamp(self, left, top, width, height):
+        """화면 밖으로 나가지 않도록 크기 조정 (화면 밖에서 시작하면 0)"""
+        max_width = self.prs.slide_width - left
+        max_height = self.prs.slide_height - top
+        if width > max_width:
+            width = max_width - Inches(0.1)
+        if height > max_height:
+            height = max_height - Inches(0.1)
+        return max(width, 0), max(height, 0)
+
+    @staticmethod
+    def _fill_paragraphs(txBody, paragraphs, leading_blank):
+        if not paragraphs:
+            return
+        if not leading_blank:
+            for p in txBody.p_lst:
+                txBody.remove(p)
+        for text, style in paragraphs:
+            p = copy.deepcopy(_paragraph_prototype(style))
+            p.append_text(text)
+            txBody.append(p)
+
+
+def turbo_shapes(slide):
+    """turbo 모드(최대 id 캐시)를 켠 slide.shapes
+
+    Slide 객체는 SlidePart 마다 하나라 prs.slides[i] 로 다시 꺼내도 캐시를 같이 쓴다.
+    캐시를 거치지 않는 경로(그룹 안 도형 추가, spTree 직접 수정)는 id 가 겹칠 수
+    있으므로 저장 전에 check_shape_ids() 로 확인한다.
+    """
+    shapes = slide.shapes
+    if shapes._cached_max_shape_id is None:
+        shapes.turbo_add_enabled = True
+    return shapes
+
+
+def slide_duplicate_ids(slide):
+    """슬라이드 하나에서 겹치는 도형 id 목록"""
+    result = []
+    seen = set()
+    for value in slide._element.cSld.spTree.xpath(".//p:cNvPr/@id"):
+        if value in seen:
+            result.append(int(value))
+        seen.add(value)
+    return result
+
+
+def duplicate_shape_ids(prs):
+    """슬라이드마다 겹치는 도형 id [(슬라이드 번호, id)] (번호는 1부터)"""
+    return [(number, shape_id) for number, slide in enumerate(prs.slides, 1)
+            for shape_id in slide_duplicate_ids(slide)]
+
+
+def check_shape_ids(prs):
+    """도형 id 가 겹치면 ValueError (PowerPoint 가 복구 대화상자를 띄우는 파일)"""
+    _raise_duplicates(duplicate_shape_ids(prs))
+
+
+def check_slide_shape_ids(number, slide):
+    """스트리밍 저장에서 슬라이드를 쓰기 전에 하는 같은 검사"""
+    _raise_duplicates([(number, shape_id) for shape_id in slide_duplicate_ids(slide)])
+
+
+def _raise_duplicates(duplicates):
+    if duplicates:
+        detail = ", ".join(f"슬라이드 {number} id {shape_id}" for number, shape_id in duplicates[:10])
+        raise ValueError(f"도형 id 중복 {len(duplicates)}개: {detail}")
+
+
+def save_presentation(prs, path):
+    """도형 id 를 검사하고 저장 (재현 모드에서 내용이 같은 파일은 다시 쓰지 않음, 썼으면 True)"""
+    check_shape_ids(prs)
+    if not reproducible.enabled() or not os.path.exists(path):
+        prs.save(path)
+        return True
+    stream = io.BytesIO()
+    prs.save(stream)
+    blob = stream.getvalue()
+    if os.path.getsize(path) == len(blob):
+        with open(path, "rb") as f:
+            if f.read() == blob:
+                return False        # mtime 을 그대로 두어 CI/캐시가 건너뛰도록
+    with open(path, "wb") as f:
+        f.write(blob)
+    return True
+
+
+def split_lines(text, style, style_all=False):
+    """TextFrame.text 처럼 줄바꿈마다 문단을 나눈 (텍스트, 스타일) 목록"""
+    lines = text.split("\n")
+    return [(line, style if (i == 0 or style_all) else None) for i, line in enumerate(lines)]
+
+
+def page_style(color, size=Pt(12), align=PP_ALIGN.RIGHT):
+    """페이지 번호 기본 스타일"""
+    return TextStyle(size=size, color=color, align=align)
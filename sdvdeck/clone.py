@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+슬라이드 복제 (다른 Presentation 의 슬라이드 포함)
+
+슬라이드 XML 을 통째로 복사하고, 이미지/미디어/외부 링크 관계는 대상 패키지에
+다시 연결한 뒤 r:id 를 새 번호로 바꿔 쓴다. 이미지와 미디어(동영상, 소리)는 원본
+파트의 sha1 로 대상 패키지에서 찾아, 같은 내용이 있으면 그 파트를 공유한다 (이미지는
+다시 해시하거나 헤더를 읽지 않음). PIL 이 읽지 못하는 이미지(HD Photo, SVG, EMF, WMF)는
+콘텐츠 형식과 확장자를 그대로 둔 채 내용만 복사한다. 노트가 있으면 노트 본문도 복사한다.
+
+SlidePool 은 입력 키 -> 만들어 둔 슬라이드 색인이다. 변형 덱 여러 개가 같은 슬라이드를
+쓰면 처음 한 번만 만들고 나머지 덱에는 복제해 넣는다.
+
+    pool = SlidePool()
+    slide = pool.clone(key, deck.prs)
+    if slide is None:
+        slide = pool.add(key, build_slide(deck))
+"""
+
+import copy
+import hashlib
+import posixpath
+
+from pptx.media import Video
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory
+from pptx.parts.image import Image, ImagePart
+
+from sdvdeck.fastpackage import image_index, slide_index
+
+# 이 관계들은 새 슬라이드가 직접 가지므로 복사하지 않는다
+_SKIP_RELTYPES = (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE)
+
+# sha1 로 대상 패키지의 같은 파트를 찾아 공유하는 관계 (HD Photo 는 그림 효과용 원본 사진)
+_IMAGE_RELTYPES = (RT.IMAGE, "http://schemas.microsoft.com/office/2007/relationships/hdphoto")
+_MEDIA_RELTYPES = (RT.MEDIA, RT.VIDEO, RT.AUDIO)
+
+# ImagePart.new(PIL) 로 만드는 이미지. 나머지는 내용 그대로 새 파트로 복사
+_RASTER_CONTENT_TYPES = (CT.PNG, CT.JPEG, CT.GIF, CT.BMP, CT.TIFF)
+
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+
+def can_clone(slide):
+    """복제할 수 있는 슬라이드인지 (이미지/미디어/외부 링크 외 관계가 없어야 함)"""
+    for rel in slide.part.rels.values():
+        if rel.reltype in _SKIP_RELTYPES or rel.is_external or rel.reltype in _IMAGE_RELTYPES \
+                or rel.reltype in _MEDIA_RELTYPES:
+            continue
+        return False
+    return True
+
+
+def clone_slide(slide, prs, layout=None):
+    """slide 를 prs 끝에 복제해 새 슬라이드 반환
+
+    layout 을 주지 않으면 이름이 같은 레이아웃, 없으면 같은 순번의 레이아웃을 쓴다.
+    차트/OLE 등 지원하지 않는 관계가 있으면 ValueError.
+    """
+    if not can_clone(slide):
+        raise ValueError(f"복제할 수 없는 관계가 있는 슬라이드: {slide.part.partname}")
+    if layout is None:
+        layout = _matching_layout(slide.slide_layout, prs)
+    # 레이아웃 플레이스홀더는 어차피 원본 내용으로 덮어쓰므로 복제하지 않고 빈 슬라이드만 만듦
+    rId, new_slide = prs.part.add_slide(layout)
+    sldIdLst = prs.slides._sldIdLst
+    sldIdLst._add_sldId(id=slide_index(prs.part).next_id(sldIdLst), rId=rId)
+    src_part, dst_part = slide.part, new_slide.part
+
+    rId_map = {}
+    for rId, rel in src_part.rels.items():
+        if rel.reltype in _SKIP_RELTYPES:
+            continue
+        if rel.is_external:
+            rId_map[rId] = dst_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+        elif rel.reltype in _IMAGE_RELTYPES:
+            image_part = shared_image_part(dst_part.package, rel.target_part)
+            rId_map[rId] = dst_part.relate_to(image_part, rel.reltype)
+        else:
+            media_part = shared_media_part(dst_part.package, rel.target_part)
+            rId_map[rId] = dst_part.relate_to(media_part, rel.reltype)
+
+    # 내용 전체를 원본으로 교체
+    src, dst = slide._element, new_slide._element
+    for child in list(dst):
+        dst.remove(child)
+    for child in src:
+        dst.append(copy.deepcopy(child))
+    for name, value in src.attrib.items():
+        dst.set(name, value)
+    _remap_rIds(dst, rId_map)
+    # 만들어 둔 shapes/placeholders 가 있으면 떼어 낸 spTree 를 가리키므로
+    # (turbo id 캐시 포함) 버리고 새 내용으로 다시 만들게 함
+    for name in ("shapes", "placeholders"):
+        new_slide.__dict__.pop(name, None)
+    if slide.has_notes_slide:
+        _copy_notes(slide.notes_slide, new_slide)
+    return new_slide
+
+
+def clone_slides(slides, prs):
+    """slides 를 차례로 prs 끝에 복제해 새 슬라이드 목록 반환 (레이아웃 대응은 한 번만 계산)"""
+    layouts = {}
+    cloned = []
+    for slide in slides:
+        src_layout = slide.slide_layout
+        layout = layouts.get(src_layout.part)
+        if layout is None:
+            layout = layouts[src_layout.part] = _matching_layout(src_layout, prs)
+        cloned.append(clone_slide(slide, prs, layout))
+    return cloned
+
+
+class SlidePool:
+    """입력 키 -> 만들어 둔 슬라이드 (다른 덱의 슬라이드여도 됨)"""
+
+    def __init__(self):
+        self.slides = {}
+        self.cloned = 0
+
+    def add(self, key, slide):
+        """slide 를 key 로 등록하고 그대로 반환 (복제할 수 없는 슬라이드는 등록하지 않음)"""
+        if can_clone(slide):
+            self.slides.setdefault(key, slide)
+        return slide
+
+    def clone(self, key, prs):
+        """key 의 슬라이드를 prs 에 복제해 반환 (없으면 None)"""
+        slide = self.slides.get(key)
+        if slide is None:
+            return None
+        self.cloned += 1
+        return clone_slide(slide, prs)
+
+    def __contains__(self, key):
+        return key in self.slides
+
+    def __len__(self):
+        return len(self.slides)
+
+
+def shared_image_part(package, src_part):
+    """대상 패키지에서 src_part 와 같은 이미지 파트 (없으면 새로 만듦)"""
+    index = image_index(package)
+    blob = src_part.blob
+    sha1 = src_part.sha1 if isinstance(src_part, ImagePart) else hashlib.sha1(blob).hexdigest()
+    part = index.find(sha1, len(blob))
+    if part is None:
+        if src_part.content_type in _RASTER_CONTENT_TYPES:
+            image = Image(blob, posixpath.basename(src_part.partname))
+            part = ImagePart.new(package, image)
+        else:
+            partname = package.next_image_partname(src_part.partname.ext)
+            part = PartFactory(partname, src_part.content_type, package, blob)
+        index.add(part, sha1)
+    return part
+
+
+def shared_media_part(package, src_part):
+    """대상 패키지에서 src_part 와 같은 미디어 파트 (없으면 새로 만듦)"""
+    media = Video.from_blob(src_part.blob, src_part.content_type,
+                            posixpath.basename(src_part.partname))
+    return package.get_or_add_media_part(media)
+
+
+def _copy_notes(src_notes, new_slide):
+    src_frame = src_notes.notes_text_frame
+    if src_frame is None:
+        return
+    dst_frame = new_slide.notes_slide.notes_text_frame
+    if dst_frame is None:
+        return
+    src_body, dst_body = src_frame._txBody, dst_frame._txBody
+    for child in list(dst_body):
+        dst_body.remove(child)
+    for child in src_body:
+        dst_body.append(copy.deepcopy(child))
+
+
+def _matching_layout(layout, prs):
+    layouts = prs.slide_layouts
+    for candidate in layouts:
+        if candidate.name == layout.name:
+            return candidate
+    index = layout.slide_master.slide_layouts.index(layout)
+    return layouts[index] if index < len(layouts) else layouts[0]
+
+
+def _remap_rIds(element, rId_map):
+    """r:id, r:embed, r:link 등 관계 속성을 한 번에 바꿔 쓰기 (서로 겹쳐도 안전)"""
+    for node in element.iter():
+        for name, value in node.attrib.items():
+            if name.startswith(_R_NS) and value in rId_map:
+                node.set(name, rId_map[value])
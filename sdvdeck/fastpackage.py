@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+python-pptx 이미지/슬라이드 파트 조회 가속
+
+_ImageParts.get_or_add_image_part 는 add_picture 마다 패키지 관계 그래프 전체를
+돌며 기존 ImagePart 의 sha1 을 매번 다시 계산하고, Package.next_image_partname 은
+iter_parts() 를 다시 훑는다. 슬라이드 쪽 relate_to 도 관계 전체를 훑는다.
+이미지가 많은 덱에서는 O(n²) 이 되므로 패키지마다 sha1 -> ImagePart 색인과
+사용 중인 image 번호 집합을, 관계 모음마다 (reltype, 대상 파트) -> rId 색인을
+한 번만 만들고 추가할 때 갱신한다. 결과(파트 재사용, 파트 이름, rId)는 원래 구현과 같다.
+
+슬라이드도 마찬가지로 CT_SlideIdList._next_id 는 add_slide 마다 sldId 전체를 XPath 로
+다시 읽고, 새 슬라이드 파트 이름은 len(sldIdLst)+1 이라 슬라이드를 지웠거나 sldId 만
+떼어 낸 템플릿 슬라이드가 패키지에 남아 있으면 이미 있는 slideN.xml 과 겹친다 (zip 에
+같은 이름이 두 번 들어감). 프레젠테이션 파트마다 사용 중인 slide 번호 집합과 최대
+sldId 를 두고 비어 있는 가장 작은 번호, 최대 id + 1 을 준다. 겹치는 일이 없으면 원래
+구현과 같은 이름/id 가 나온다. 처음 열 때 슬라이드 이름을 1, 2, ... 로 다시 매기는
+rename_slide_parts 도 목록에 없는 슬라이드 파트의 번호는 건너뛴다.
+
+install() 은 여러 번 불러도 한 번만 적용된다.
+"""
+
+import os
+
+from pptx.opc.package import _Relationships
+from pptx.opc.packuri import PackURI
+from pptx.oxml.presentation import CT_SlideIdList
+from pptx.package import Package, _ImageParts
+from pptx.parts.image import Image, ImagePart
+from pptx.parts.presentation import PresentationPart
+from pptx.slide import Slides
+
+from sdvdeck.probe import file_sha1
+
+_IMAGE_PREFIX = "/ppt/media/image"
+_SLIDE_PREFIX = "/ppt/slides/slide"
+_MAX_SLIDE_ID = 2147483647
+
+
+class _ImageIndex:
+    """패키지 하나의 sha1 -> ImagePart, 사용 중인 image 번호
+
+    아직 압축을 풀지 않은 템플릿 이미지(lazyzip)는 크기별로만 모아 두었다가
+    새 이미지와 크기가 같을 때만 풀어서 sha1 을 비교한다.
+    """
+
+    def __init__(self, package):
+        self.by_sha1 = {}
+        self.pending = {}           # 압축 해제 크기 -> [풀지 않은 ImagePart]
+        self.used = set()
+        self.cursor = 1
+        for part in package.iter_parts():
+            partname = part.partname
+            if partname.startswith(_IMAGE_PREFIX) and partname.idx is not None:
+                self.used.add(partname.idx)
+            if not isinstance(part, ImagePart):
+                continue
+            if getattr(part, "blob_loaded", True):
+                self.by_sha1.setdefault(part.sha1, part)
+            else:
+                self.pending.setdefault(part.blob_size, []).append(part)
+
+    def find(self, sha1, size):
+        part = self.by_sha1.get(sha1)
+        if part is None and size in self.pending:
+            for candidate in self.pending.pop(size):
+                self.by_sha1.setdefault(candidate.sha1, candidate)
+            part = self.by_sha1.get(sha1)
+        return part
+
+    def next_idx(self):
+        """비어 있는 가장 작은 번호 (원래 구현처럼 빈 번호를 먼저 채움)"""
+        while self.cursor in self.used:
+            self.cursor += 1
+        return self.cursor
+
+    def add(self, part, sha1):
+        self.by_sha1[sha1] = part
+        if part.partname.idx is not None:
+            self.used.add(part.partname.idx)
+
+
+def image_index(package):
+    index = package.__dict__.get("_sdvdeck_image_index")
+    if index is None:
+        index = package.__dict__["_sdvdeck_image_index"] = _ImageIndex(package)
+    return index
+
+
+def forget_image_index(package):
+    """파트를 지운 뒤 색인을 다시 만들도록 버림"""
+    package.__dict__.pop("_sdvdeck_image_index", None)
+
+
+class _SlideIndex:
+    """프레젠테이션 파트 하나의 사용 중인 slide 번호, 최대 sldId
+
+    프레젠테이션 관계 수가 마지막으로 본 값과 다르면(슬라이드 삭제, 외부에서 관계 추가)
+    번호 집합을 다시 만든다. 최대 sldId 는 지운 슬라이드의 id 를 다시 쓰지 않도록 유지한다.
+    """
+
+    def __init__(self, pres_part, max_id=255):
+        self.used = _slide_numbers(pres_part.package)
+        self.cursor = 1
+        self.rels_count = len(pres_part.rels)
+        self.max_id = max_id
+        self.id_count = None            # max_id 를 구할 때의 sldId 수
+
+    def next_partname(self):
+        while self.cursor in self.used:
+            self.cursor += 1
+        self.used.add(self.cursor)
+        self.rels_count += 1            # 곧 relate_to 로 관계 하나가 늘어남
+        return PackURI("%s%d.xml" % (_SLIDE_PREFIX, self.cursor))
+
+    def next_id(self, sldIdLst):
+        count = len(sldIdLst)
+        if count != self.id_count:
+            self.max_id = max([self.max_id] + [int(sldId.get("id")) for sldId in sldIdLst])
+        if self.max_id >= _MAX_SLIDE_ID:
+            return _original_next_id.fget(sldIdLst)     # 빈 id 를 아래부터 찾음
+        self.max_id += 1
+        self.id_count = count + 1
+        return self.max_id
+
+
+def _slide_numbers(package):
+    return {part.partname.idx for part in package.iter_parts()
+            if part.partname.startswith(_SLIDE_PREFIX) and part.partname.idx is not None}
+
+
+def slide_index(pres_part):
+    index = pres_part.__dict__.get("_sdvdeck_slide_index")
+    if index is None or index.rels_count != len(pres_part.rels):
+        max_id = 255 if index is None else index.max_id
+        index = pres_part.__dict__["_sdvdeck_slide_index"] = _SlideIndex(pres_part, max_id)
+    return index
+
+
+def retarget(rels, rId, part):
+    """rId 관계의 대상을 part 로 바꿈 (관계 색인이 이전 파트를 붙잡지 않도록 함께 갱신)"""
+    rel = rels[rId]
+    old = rel._target
+    rel._target = part
+    rel.__dict__.pop("target_part", None)      # lazyproperty 캐시
+    index = rels.__dict__.get("_sdvdeck_targets")
+    if index is not None:
+        targets = index[1]
+        if targets.get((rel.reltype, old)) == rId:
+            del targets[(rel.reltype, old)]
+            targets[(rel.reltype, part)] = rId
+
+
+def _get_or_add_image_part(self, image_file):
+    index = image_index(self._package)
+    if isinstance(image_file, str):
+        # 경로면 메모한 sha1 로 먼저 찾아 이미 있는 이미지는 파일을 읽지 않음
+        sha1 = file_sha1(image_file)
+        image_part = index.find(sha1, os.path.getsize(image_file))
+        if image_part is not None:
+            return image_part
+    image = Image.from_file(image_file)
+    image_part = index.find(image.sha1, len(image.blob))
+    if image_part is None:
+        image_part = ImagePart.new(self._package, image)
+        index.add(image_part, image.sha1)
+    return image_part
+
+
+def _next_image_partname(self, ext):
+    return PackURI("%s%d.%s" % (_IMAGE_PREFIX, image_index(self).next_idx(), ext))
+
+
+def _rels_get_or_add(self, reltype, target_part):
+    rels = self._rels
+    # 색인 밖에서 관계가 추가/삭제되면(외부 링크, pop, load_from_xml) 개수가 달라지므로 다시 만듦
+    index = self.__dict__.get("_sdvdeck_targets")
+    if index is None or index[0] != len(rels):
+        targets = {}
+        for rel in rels.values():
+            if not rel.is_external:
+                targets.setdefault((rel.reltype, rel.target_part), rel.rId)
+        index = self.__dict__["_sdvdeck_targets"] = [len(rels), targets]
+    targets = index[1]
+    rId = targets.get((reltype, target_part))
+    if rId is not None:
+        rel = rels.get(rId)
+        if rel is not None and rel.reltype == reltype and rel._target is target_part:
+            return rId
+    rId = self._add_relationship(reltype, target_part)
+    targets[(reltype, target_part)] = rId
+    index[0] = len(rels)
+    return rId
+
+
+def _next_slide_partname(self):
+    return slide_index(self).next_partname()
+
+
+def _add_slide(self, slide_layout):
+    rId, slide = self.part.add_slide(slide_layout)
+    slide.shapes.clone_layout_placeholders(slide_layout)
+    sldIdLst = self._sldIdLst
+    sldIdLst._add_sldId(id=slide_index(self.part).next_id(sldIdLst), rId=rId)
+    return slide
+
+
+def _rename_slide_parts(self, rIds):
+    slide_parts = [self.related_part(rId) for rId in rIds]
+    listed = set(map(id, slide_parts))
+    # 목록에 없지만 패키지에 남은 슬라이드 파트(떼어 낸 템플릿 슬라이드 등)의 번호는 건너뜀
+    reserved = {part.partname.idx for part in self.package.iter_parts()
+                if id(part) not in listed and part.partname.startswith(_SLIDE_PREFIX)}
+    number = 0
+    for slide_part in slide_parts:
+        number += 1
+        while number in reserved:
+            number += 1
+        slide_part.partname = PackURI("%s%d.xml" % (_SLIDE_PREFIX, number))
+    index = self.__dict__.get("_sdvdeck_slide_index")
+    if index is not None:
+        index.rels_count = None         # 번호 집합만 다시 만들게 함 (최대 sldId 는 유지)
+
+
+_original_next_id = CT_SlideIdList._next_id
+
+
+def install():
+    if getattr(_ImageParts, "_sdvdeck_fast", False):
+        return
+    _ImageParts.get_or_add_image_part = _get_or_add_image_part
+    Package.next_image_partname = _next_image_partname
+    _Relationships.get_or_add = _rels_get_or_add
+    PresentationPart._next_slide_partname = property(_next_slide_partname)
+    PresentationPart.rename_slide_parts = _rename_slide_parts
+    Slides.add_slide = _add_slide
+    _ImageParts._sdvdeck_fast = True
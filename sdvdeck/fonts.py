@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+TextFrame.fit_text 용 글꼴 찾기 (Linux 지원 + 디스크 색인)
+
+python-pptx 의 FontFiles 는 macOS/Windows 글꼴 폴더만 알고 Linux 에서는
+OSError("unsupported operating system") 를 낸다. 또 처음 찾을 때마다 모든
+.ttf/.otf 를 열어 이름 테이블을 읽는다. 여기서는
+
+- Linux 에서는 fontconfig 설정(<dir>)과 XDG/홈/시스템 글꼴 폴더를 쓰고
+- .ttc 컬렉션은 첫 번째 글꼴로 색인하며 (Noto CJK 등)
+- (패밀리, 굵게, 기울임) -> 경로 색인을 .sdvdeck/font-index.json 에 저장해
+  폴더들의 mtime 이 그대로면 다음 실행부터 글꼴을 열지 않는다.
+
+폴더 mtime 은 그 폴더에 파일이 추가/삭제될 때만 바뀌므로, 같은 이름으로 글꼴 파일을
+덮어쓴 경우에는 clear_font_index() 로 색인을 지운다.
+install() 은 여러 번 불러도 한 번만 적용된다.
+"""
+
+import glob
+import json
+import os
+import struct
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+from pptx.text.fonts import FontFiles, _Font
+from pptx.util import lazyproperty
+
+DEFAULT_INDEX = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             ".sdvdeck", "font-index.json")
+
+# 색인 형식이 바뀌면 올려서 이전 색인을 무효화
+INDEX_VERSION = 1
+
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+_FONTCONFIG_FILES = ("/etc/fonts/fonts.conf", "/etc/fonts/conf.d/*.conf")
+_LINUX_DIRECTORIES = ("/usr/share/fonts", "/usr/local/share/fonts")
+
+
+class _CollectionFont(_Font):
+    """.ttc 컬렉션의 첫 번째 글꼴 (테이블 오프셋은 파일 처음 기준)"""
+
+    @lazyproperty
+    def _offset(self):
+        tag, _, _, count = self._stream.read_fields(">4sHHL", 0)
+        if tag != b"ttcf" or count == 0:
+            raise ValueError("not a font collection")
+        return self._stream.read_fields(">L", 12)[0]
+
+    @lazyproperty
+    def _fields(self):
+        return self._stream.read_fields(">4sHHHH", self._offset)
+
+    def _iter_table_records(self):
+        count = self._table_count
+        bufr = self._stream.read(offset=self._offset + 12, length=count * 16)
+        for i in range(count):
+            tag, _, off, len_ = struct.unpack_from(">4sLLL", bufr, i * 16)
+            yield tag.decode("utf-8"), off, len_
+
+
+def fontconfig_directories(conf_files=_FONTCONFIG_FILES):
+    """fontconfig 설정 파일의 <dir> 항목 (prefix="xdg", "~" 처리)"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    result = []
+    for pattern in conf_files:
+        for path in sorted(glob.glob(pattern)):
+            try:
+                root = ET.parse(path).getroot()
+            except (OSError, ET.ParseError):
+                continue
+            for node in root.iter("dir"):
+                text = (node.text or "").strip()
+                if not text:
+                    continue
+                if node.get("prefix") == "xdg":
+                    text = os.path.join(data_home, text)
+                result.append(os.path.expanduser(text))
+    return result
+
+
+def font_directories():
+    """현재 플랫폼의 글꼴 폴더 (존재하는 것만, 중복 제거)"""
+    if sys.platform.startswith("darwin"):
+        candidates = FontFiles._os_x_font_directories()
+    elif sys.platform.startswith("win32"):
+        candidates = FontFiles._windows_font_directories()
+    else:
+        data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        candidates = fontconfig_directories() + [
+            os.path.join(data_home, "fonts"), os.path.expanduser("~/.fonts"),
+            *_LINUX_DIRECTORIES,
+        ]
+    result = []
+    for directory in candidates:
+        directory = os.path.realpath(directory)
+        if os.path.isdir(directory) and directory not in result:
+            result.append(directory)
+    return result
+
+
+def read_font(path):
+    """(패밀리, 굵게, 기울임), 읽을 수 없으면 None"""
+    font_class = _CollectionFont if path.lower().endswith(".ttc") else _Font
+    try:
+        with font_class.open(path) as font:
+            family = font.family_name
+            if not family:
+                return None
+            return family, font.is_bold, font.is_italic
+    except (OSError, ValueError, KeyError, struct.error, UnicodeDecodeError):
+        return None
+
+
+def scan_fonts(directories):
+    """(색인 {(패밀리, 굵게, 기울임): 경로}, 폴더별 mtime_ns {경로: mtime_ns})"""
+    fonts = {}
+    stamps = {}
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            try:
+                stamps[root] = os.stat(root).st_mtime_ns
+            except OSError:
+                continue
+            for filename in sorted(files):
+                if os.path.splitext(filename)[1].lower() not in FONT_EXTENSIONS:
+                    continue
+                path = os.path.abspath(os.path.join(root, filename))
+                key = read_font(path)
+                if key is not None:
+                    # 같은 이름이 여러 개면 .ttf/.otf 를 .ttc 보다 우선
+                    if key not in fonts or fonts[key].lower().endswith(".ttc"):
+                        fonts[key] = path
+    return fonts, stamps
+
+
+class FontIndex:
+    """글꼴 색인 파일 (폴더 mtime 이 바뀌면 다시 훑음)"""
+
+    def __init__(self, path=DEFAULT_INDEX, directories=None):
+        self.path = path
+        self.directories = directories
+        self.scanned = False            # 이번 호출에서 글꼴 파일을 다시 읽었는지
+
+    def load(self):
+        """{(패밀리, 굵게, 기울임): 경로}"""
+        directories = font_directories() if self.directories is None else self.directories
+        fonts = self._read(directories)
+        if fonts is None:
+            fonts, stamps = scan_fonts(directories)
+            self.scanned = True
+            self._write(directories, fonts, stamps)
+        return fonts
+
+    def _read(self, directories):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != INDEX_VERSION or data.get("directories") != directories:
+            return None
+        for directory, mtime in data["stamps"].items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return None
+            except OSError:
+                return None
+        return {(family, bold, italic): path for family, bold, italic, path in data["fonts"]}
+
+    def _write(self, directories, fonts, stamps):
+        data = {
+            "version": INDEX_VERSION,
+            "directories": directories,
+            "stamps": stamps,
+            "fonts": sorted([*key, path] for key, path in fonts.items()),
+        }
+        folder = os.path.dirname(self.path)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass                        # 색인을 못 써도 이번 실행에는 지장 없음
+
+
+def clear_font_index(path=DEFAULT_INDEX):
+    """디스크 색인과 FontFiles 의 프로세스 캐시를 지움"""
+    FontFiles._font_files = None
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def find_font(family, bold=False, italic=False):
+    """글꼴 파일 경로, 없으면 None (굵게/기울임이 없으면 같은 패밀리 기본형으로)"""
+    for key in ((family, bold, italic), (family, bold, False), (family, False, False)):
+        try:
+            return FontFiles.find(*key)
+        except KeyError:
+            continue
+    return None
+
+
+def _installed_fonts(cls):
+    return FontIndex().load()
+
+
+def install():
+    if getattr(FontFiles, "_sdvdeck_index", False):
+        return
+    FontFiles._installed_fonts = classmethod(_installed_fonts)
+    FontFiles._font_directories = classmethod(lambda cls: font_directories())
+    FontFiles._sdvdeck_index = True
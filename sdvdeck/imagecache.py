@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+변환된 이미지 디스크 캐시 (내용 주소 방식)
+
+키는 sha1(원본 내용) + 표시 크기 + DPI + 품질. 같은 이미지를 같은 크기로 쓰는
+모든 스크립트/빌드/워커 프로세스가 PIL 로 다시 디코딩하지 않고 결과를 공유한다.
+
+    .sdvdeck/image-cache/ab/ab12....jpg   변환 결과
+    .sdvdeck/image-cache/ab/ab12....orig  원본을 그대로 쓰라는 표시 (빈 파일)
+    .sdvdeck/image-cache/ab/ab12....bad   읽을 수 없는 파일이라는 표시 (빈 파일)
+    .sdvdeck/image-cache/stats.log        프로세스별 "적중 미스" 누적 기록
+
+용량이 max_bytes 를 넘으면 가장 오래 쓰지 않은(mtime) 항목부터 지운다.
+"""
+
+import atexit
+import hashlib
+import os
+import tempfile
+
+from sdvdeck.probe import file_sha1
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            ".sdvdeck", "image-cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# 변환 방식이 바뀌면 올려서 이전 결과를 무효화
+CACHE_VERSION = 1
+
+ORIGINAL = "orig"
+UNSUPPORTED = "bad"
+_EXTENSIONS = ("jpg", "png", ORIGINAL, UNSUPPORTED)
+
+
+class ImageCache:
+    """변환 결과 디스크 캐시"""
+
+    def __init__(self, root=DEFAULT_ROOT, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None           # 첫 put 에서 한 번 계산한 뒤 누적
+
+    def key(self, source, *params):
+        text = f"{CACHE_VERSION}:{file_sha1(source)}:" + ":".join(str(p) for p in params)
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """(결과 확장자, 내용) 반환, 없으면 None. 표시 항목이면 ("orig" 또는 "bad", b"")"""
+        for ext in _EXTENSIONS:
+            path = self._path(key, ext)
+            try:
+                with open(path, "rb") as f:
+                    blob = f.read()
+            except OSError:
+                continue
+            self.hits += 1
+            try:
+                os.utime(path)      # LRU: 최근 사용 시각 갱신
+            except OSError:
+                pass
+            return ext, blob
+        self.misses += 1
+        return None
+
+    def put(self, key, ext, blob=b""):
+        """결과 저장 (임시 파일에 쓰고 rename 해서 다른 프로세스와 겹쳐도 안전)"""
+        path = self._path(key, ext)
+        folder = os.path.dirname(path)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        if self._size is None:
+            self._size = self.usage()[1]
+        else:
+            self._size += len(blob)
+        if self._size > self.max_bytes:
+            self.prune()
+
+    def entries(self):
+        """[(mtime, 크기, 경로)]"""
+        result = []
+        if not os.path.isdir(self.root):
+            return result
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".tmp"):
+                    continue
+                stat = entry.stat()
+                result.append((stat.st_mtime, stat.st_size, entry.path))
+        return result
+
+    def usage(self):
+        """(항목 수, 전체 바이트)"""
+        entries = self.entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def prune(self, max_bytes=None):
+        """오래 쓰지 않은 항목부터 지워 max_bytes 이하로 맞추고 지운 개수 반환"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._size = total
+        return removed
+
+    def clear(self):
+        return self.prune(0)
+
+    def record_stats(self):
+        """이번 프로세스의 적중/미스 횟수를 stats.log 에 추가"""
+        if not (self.hits or self.misses):
+            return
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, "stats.log"), "a", encoding="utf-8") as f:
+            f.write(f"{self.hits} {self.misses}\n")
+        self.hits = self.misses = 0
+
+    def stats(self):
+        """누적 통계 dict (적중, 미스, 적중률, 항목 수, 바이트, 상한)"""
+        hits, misses = self.hits, self.misses
+        try:
+            with open(os.path.join(self.root, "stats.log"), encoding="utf-8") as f:
+                for line in f:
+                    h, m = line.split()
+                    hits += int(h)
+                    misses += int(m)
+        except (OSError, ValueError):
+            pass
+        count, size = self.usage()
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": count,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _path(self, key, ext):
+        return os.path.join(self.root, key[:2], f"{key}.{ext}")
+
+
+_DEFAULT = None
+
+
+def default_cache():
+    """프로세스 공용 캐시 (종료 시 통계 기록)"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = ImageCache()
+        atexit.register(_DEFAULT.record_stats)
+    return _DEFAULT
+
+
+def flush_stats():
+    """공용 캐시 통계를 바로 기록 (atexit 가 돌지 않는 풀 워커용)"""
+    if _DEFAULT is not None:
+        _DEFAULT.record_stats()
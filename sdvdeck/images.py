@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 전처리 (PIL)
+
+슬라이드에 표시될 크기 × DPI 로 줄이고, 내용에 맞춰 JPEG/PNG 를 고르고,
+EXIF/텍스트 등 메타데이터를 떼어 낸 뒤 삽입한다.
+원본보다 커지거나 PIL 이 읽지 못하는 파일은 원본 그대로 쓴다.
+AVIF/WebP 처럼 PowerPoint 에 넣을 수 없는 형식은 크기와 상관없이 PNG/JPEG 로 바꾼다.
+변환 결과(원본을 쓰라는 판단, 읽을 수 없다는 판단 포함)는 ImageCache 에 남겨
+다음 빌드에서 재사용한다.
+"""
+
+import io
+import os
+
+from PIL import Image, ImageOps
+from pptx.util import Emu
+
+from sdvdeck.imagecache import ORIGINAL, UNSUPPORTED, default_cache
+from sdvdeck.probe import image_info
+
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+
+# 이 색 수 이하면 도표/로고로 보고 PNG 유지
+PNG_MAX_COLORS = 256
+
+# 다시 인코딩할 입력 형식 (GIF 애니메이션, WMF 등은 그대로)
+_REENCODE_FORMATS = ("JPEG", "PNG", "BMP", "TIFF")
+
+# python-pptx/PowerPoint 가 그대로 넣을 수 있는 형식. 나머지는 PNG/JPEG 로 변환
+EMBEDDABLE_FORMATS = ("JPEG", "PNG", "BMP", "GIF", "TIFF", "WMF")
+
+# 확장자만 보고 변환이 필요하다고 판단하는 형식 (image_dpi=None 일 때도 변환)
+TRANSCODE_EXTENSIONS = (".avif", ".webp", ".heic", ".heif", ".jxl")
+
+_EMU_PER_INCH = 914400
+
+
+class UnsupportedImageError(ValueError):
+    """PIL 도 python-pptx 도 읽을 수 없는 이미지"""
+
+
+def needs_transcode(path):
+    return os.path.splitext(path)[1].lower() in TRANSCODE_EXTENSIONS
+
+
+def target_pixels(size, width=None, height=None, dpi=DEFAULT_DPI):
+    """표시 크기(EMU)와 DPI 로 필요한 픽셀 크기 계산 (비율 유지, 확대 없음, dpi=None 이면 원본)"""
+    px_width, px_height = size
+    if dpi is None:
+        return px_width, px_height
+    scales = []
+    if width is not None:
+        scales.append(Emu(width) * dpi / _EMU_PER_INCH / px_width)
+    if height is not None:
+        scales.append(Emu(height) * dpi / _EMU_PER_INCH / px_height)
+    scale = min(max(scales), 1.0) if scales else 1.0
+    return max(1, round(px_width * scale)), max(1, round(px_height * scale))
+
+
+def prepare_image(image_file, width=None, height=None, dpi=DEFAULT_DPI, quality=JPEG_QUALITY,
+                  cache=None):
+    """삽입용 이미지 준비: (파일 경로 또는 BytesIO, 원본 픽셀 크기 또는 None) 반환
+
+    변환했을 때만 원본 픽셀 크기를 돌려준다 (표시 비율을 원본 기준으로 계산하도록).
+    width/height 가 둘 다 없거나 dpi=None 이면 변환이 필요한 형식만 원본 크기로 바꾼다.
+    읽을 수 없는 파일은 UnsupportedImageError (한 번 실패한 파일은 캐시로 바로 판정).
+    cache 를 주지 않으면 공용 디스크 캐시를 쓴다.
+    """
+    if (dpi is None or (width is None and height is None)) and not needs_transcode(image_file):
+        return image_file, None
+    cache = cache or default_cache()
+    try:
+        key = cache.key(image_file, width, height, dpi, quality)
+    except OSError:
+        return image_file, None
+    cached = cache.get(key)
+    if cached is not None:
+        ext, blob = cached
+        if ext == ORIGINAL:
+            return image_file, None
+        if ext == UNSUPPORTED:
+            raise UnsupportedImageError(f"읽을 수 없는 이미지: {image_file}")
+        return io.BytesIO(blob), source_size(image_file)
+
+    ext, blob, size = _convert(image_file, width, height, dpi, quality)
+    cache.put(key, ext, blob)
+    if ext == ORIGINAL:
+        return image_file, None
+    if ext == UNSUPPORTED:
+        raise UnsupportedImageError(f"읽을 수 없는 이미지: {image_file}")
+    return io.BytesIO(blob), size
+
+
+def source_size(image_file):
+    """원본 픽셀 크기 (헤더만 읽음, EXIF 회전 반영, probe 메모 사용)"""
+    return image_info(image_file).display_size
+
+
+def _convert(image_file, width, height, dpi, quality):
+    """(확장자, 내용, 원본 크기) 반환
+
+    원본을 써야 하면 ("orig", b"", None), 읽을 수 없으면 ("bad", b"", None).
+    """
+    try:
+        with Image.open(image_file) as im:
+            transcode = im.format not in EMBEDDABLE_FORMATS
+            if not transcode and (im.format not in _REENCODE_FORMATS or
+                                  getattr(im, "n_frames", 1) > 1):
+                return ORIGINAL, b"", None
+            im = ImageOps.exif_transpose(im)   # 애니메이션 WebP 는 첫 프레임
+            ext, blob = _reencode(im, width, height, dpi, quality)
+    except Image.DecompressionBombError:
+        return ORIGINAL, b"", None
+    except (OSError, ValueError, SyntaxError):
+        return UNSUPPORTED, b"", None
+    if not transcode and len(blob) >= os.path.getsize(image_file):
+        return ORIGINAL, b"", None
+    return ext, blob, im.size
+
+
+def _reencode(im, width, height, dpi, quality):
+    size = target_pixels(im.size, width, height, dpi)
+    if im.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+        im = im.convert("RGBA" if "A" in im.mode else "RGB")
+    if size != im.size:
+        if im.mode == "P":
+            im = im.convert("RGBA")
+        im = im.resize(size, Image.LANCZOS)
+
+    out = io.BytesIO()
+    if _keep_png(im):
+        im.save(out, "PNG")
+        return "png", out.getvalue()
+    if im.mode != "RGB":
+        im = im.convert("RGB")
+    im.save(out, "JPEG", quality=quality, optimize=True)
+    return "jpg", out.getvalue()
+
+
+def _keep_png(im):
+    """투명 영역이 있거나 색 수가 적은(도표/로고) 이미지는 PNG"""
+    if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+        alpha = im.convert("RGBA").getchannel("A")
+        if alpha.getextrema()[0] < 255:
+            return True
+    return im.getcolors(PNG_MAX_COLORS) is not None
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+증분 빌드
+
+슬라이드마다 입력(텍스트, 레이아웃, 참조 이미지 파일)으로 키를 만들어
+출력 파일 옆 .sdvdeck/<출력 이름>.json 에 순서대로 적어 둔다.
+다음 빌드에서 키가 같은 슬라이드는 다시 만들지 않고 이전 .pptx 에서 복제한다.
+키에는 sdvdeck 패키지 소스 전체의 해시가 들어가므로 그리는 코드(builder, textfit,
+overflow ...)가 바뀌면 CACHE_VERSION 을 올리지 않아도 모든 슬라이드를 다시 만든다.
+
+    build = IncrementalBuild(output_file)
+    for ...:
+        build.slide(deck, slide_key(data, files=[img]), add_my_slide, deck, data)
+    build.save(deck.prs)
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+from pptx import Presentation
+
+from sdvdeck.builder import save_presentation
+from sdvdeck.clone import can_clone, clone_slide
+
+CACHE_DIR = ".sdvdeck"
+CACHE_VERSION = 1
+
+
+_CODE_DIGEST = None
+
+
+def code_digest():
+    """sdvdeck 패키지 .py 소스 전체의 sha1 (프로세스에서 한 번만 계산)"""
+    global _CODE_DIGEST
+    if _CODE_DIGEST is None:
+        h = hashlib.sha1()
+        folder = os.path.dirname(os.path.abspath(__file__))
+        for path in sorted(glob.glob(os.path.join(folder, "*.py"))):
+            h.update(os.path.basename(path).encode("utf-8") + b"\0")
+            with open(path, "rb") as f:
+                h.update(f.read())
+        _CODE_DIGEST = h.hexdigest()
+    return _CODE_DIGEST
+
+
+def slide_key(*parts, files=()):
+    """슬라이드 입력 키 (sdvdeck 코드 해시 + parts 의 repr + 파일 경로/크기/수정 시각)"""
+    h = hashlib.sha1(code_digest().encode("ascii"))
+    h.update(repr(parts).encode("utf-8"))
+    for path in files:
+        try:
+            stat = os.stat(path)
+            h.update(f"\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+        except OSError:
+            h.update(f"\0{path}\0missing".encode("utf-8"))
+    return h.hexdigest()
+
+
+def cache_path(output_file):
+    folder, name = os.path.split(os.path.abspath(output_file))
+    return os.path.join(folder, CACHE_DIR, name + ".json")
+
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class IncrementalBuild:
+    """이전 빌드 결과를 재사용하며 덱 하나를 만드는 동안의 상태"""
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.cache_file = cache_path(output_file)
+        self.keys = []
+        self.reused = 0
+        self._previous = self._load_previous()
+
+    def _load_previous(self):
+        """키 -> 이전 슬라이드 (캐시와 출력 파일이 어긋나면 빈 dict)"""
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return {}
+            # 다른 도구로 고쳐 저장한 파일이면 재사용하지 않는다
+            if _file_stamp(self.output_file) != data.get("output"):
+                return {}
+        except (OSError, ValueError):
+            return {}
+        slides = list(Presentation(self.output_file).slides)
+        if len(slides) != len(data.get("slides", ())):
+            return {}
+        return {key: slide for key, slide in zip(data["slides"], slides) if can_clone(slide)}
+
+    def reuse(self, deck, key):
+        """이전 빌드에서 같은 키의 슬라이드를 복제해 반환 (없으면 None)"""
+        slide = self._previous.get(key)
+        if slide is None:
+            return None
+        self.reused += 1
+        return clone_slide(slide, deck.prs)
+
+    def slide(self, deck, key, build, *args):
+        """키가 같은 이전 슬라이드가 있으면 복제, 없으면 build(*args) 로 생성"""
+        self.keys.append(key)
+        slide = self.reuse(deck, key)
+        if slide is None:
+            slide = build(*args)
+        return slide
+
+    def save(self, prs):
+        """덱 저장 후 이번 빌드의 키 목록 기록"""
+        save_presentation(prs, self.output_file)
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        data = {
+            "version": CACHE_VERSION,
+            "output": _file_stamp(self.output_file),
+            "slides": self.keys,
+        }
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
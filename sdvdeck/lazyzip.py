@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+필요할 때만 압축을 푸는 .pptx 읽기
+
+python-pptx 의 _ZipPkgReader 는 열 때 zip 멤버 전체를 dict 로 풀어 두고, 모든 파트가
+blob 을 받아 만들어진다. 템플릿을 열고 슬라이드를 지우는 KETI 스크립트처럼
+미디어 대부분을 쓰지 않는 경우에도 전부 풀리므로,
+
+- zip 파일은 압축된 상태 그대로 메모리에 한 번 읽어 두고 (같은 경로에 다시 저장해도 안전)
+- XML 이 아닌 파트(이미지, 미디어, 글꼴 등)는 blob 에 처음 접근할 때 푼다.
+
+XML 파트는 관계를 따라가려면 파싱해야 하므로 기존처럼 바로 읽는다.
+install() 은 여러 번 불러도 한 번만 적용된다.
+"""
+
+import io
+import zipfile
+
+from pptx.opc import serialized
+from pptx.opc.package import PartFactory, _PackageLoader
+from pptx.opc.serialized import _PhysPkgReader, _ZipPkgReader
+from pptx.util import lazyproperty
+
+
+class LazyZipPkgReader(_ZipPkgReader):
+    """멤버를 요청할 때마다 그 멤버만 푸는 zip 읽기"""
+
+    def __init__(self, pkg_file):
+        if isinstance(pkg_file, str):
+            with open(pkg_file, "rb") as f:
+                data = f.read()
+        else:
+            pkg_file.seek(0)            # ZipFile 처럼 현재 위치와 상관없이 스트림 전체
+            data = pkg_file.read()
+        self._zip = zipfile.ZipFile(io.BytesIO(data))
+        self._infos = {info.filename: info for info in self._zip.infolist()}
+
+    def __contains__(self, pack_uri):
+        return pack_uri.membername in self._infos
+
+    def __getitem__(self, pack_uri):
+        try:
+            return self._zip.read(self._infos[pack_uri.membername])
+        except KeyError:
+            raise KeyError("no member '%s' in package" % pack_uri)
+
+    def size(self, pack_uri):
+        """압축 해제 크기 (풀지 않고 zip 디렉터리에서)"""
+        return self._infos[pack_uri.membername].file_size
+
+
+class _LazyBlobMixin:
+    """blob 을 처음 읽을 때 zip 에서 푸는 파트 (클래스는 원래 파트 클래스를 상속해 생성)"""
+
+    @property
+    def _blob(self):
+        blob = self.__dict__.get("_lazy_blob")
+        if blob is None:
+            blob = self.__dict__["_lazy_blob"] = self._lazy_reader[self._partname]
+            self.__dict__.pop("_lazy_reader", None)
+        return blob
+
+    @_blob.setter
+    def _blob(self, value):
+        if value is not None:
+            self.__dict__["_lazy_blob"] = value
+            self.__dict__.pop("_lazy_reader", None)
+
+    @property
+    def blob_loaded(self):
+        return "_lazy_blob" in self.__dict__
+
+    @property
+    def blob_size(self):
+        """압축 해제 크기 (블롭을 풀지 않고)"""
+        reader = self.__dict__.get("_lazy_reader")
+        return len(self._blob) if reader is None else reader.size(self._partname)
+
+
+_LAZY_CLASSES = {}
+
+
+def _lazy_class(cls):
+    lazy = _LAZY_CLASSES.get(cls)
+    if lazy is None:
+        lazy = _LAZY_CLASSES[cls] = type("Lazy" + cls.__name__, (_LazyBlobMixin, cls), {})
+    return lazy
+
+
+def is_xml_content_type(content_type):
+    return content_type.endswith("+xml") or content_type.endswith("/xml")
+
+
+def _lazy_parts(self):
+    """_PackageLoader._parts 대체: XML 이 아닌 파트는 blob 없이 만들어 두기"""
+    content_types = self._content_types
+    package = self._package
+    reader = self._package_reader
+    zip_reader = reader._blob_reader
+    lazy = isinstance(zip_reader, LazyZipPkgReader)
+
+    parts = {}
+    for partname in self._xml_rels:
+        if partname == "/" or partname not in reader:
+            continue
+        content_type = content_types[partname]
+        if not lazy or is_xml_content_type(content_type):
+            parts[partname] = PartFactory(partname, content_type, package, blob=reader[partname])
+            continue
+        part = PartFactory(partname, content_type, package, blob=None)
+        part.__dict__.pop("_blob", None)
+        part.__class__ = _lazy_class(type(part))
+        part.__dict__["_lazy_reader"] = zip_reader
+        parts[partname] = part
+    return parts
+
+
+_original_factory = _PhysPkgReader.factory.__func__
+
+
+def _factory(cls, pkg_file):
+    reader = _original_factory(cls, pkg_file)
+    if type(reader) is _ZipPkgReader:
+        return LazyZipPkgReader(pkg_file)
+    return reader
+
+
+def install():
+    if getattr(_PackageLoader, "_sdvdeck_lazy", False):
+        return
+    serialized._PhysPkgReader.factory = classmethod(_factory)
+    _PackageLoader._parts = lazyproperty(_lazy_parts)
+    _PackageLoader._sdvdeck_lazy = True
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+덱 합치기/나누기
+
+merge_decks([(경로, 슬라이드 범위 또는 None), ...], 출력 경로)
+  첫 입력을 바탕(마스터, 레이아웃, 테마, 문서 속성)으로 삼고 나머지 입력의 슬라이드를
+  clone_slide 로 덧붙인다. 원본 마스터와 같은(마스터, 레이아웃, 테마, 이미지 내용이 같은)
+  마스터가 결과에 있으면 그 레이아웃을 쓰고, 없으면 원본 마스터를 레이아웃/테마/이미지와
+  함께 결과 패키지로 옮겨 온다 (파트 내용과 rId 는 그대로). 이미지/미디어는 모든 입력을
+  통틀어 sha1 하나당 파트 하나만 들어간다. 입력 하나를 다 붙일 때마다 StreamingWriter 로
+  써서 메모리에서 내린다.
+
+split_deck(경로, 범위 목록)
+  구간마다 원본을 다시 열어 구간 밖 슬라이드를 지우고 저장한다. 저장은 도달 가능한
+  파트만 쓰므로 다른 구간에서만 쓰는 이미지는 들어가지 않는다 (lazyzip 이라 압축도
+  풀지 않음). 구간을 주지 않으면 구역(p14:section)별로 나눈다.
+
+슬라이드 범위는 '1-5,8' 같은 문자열이나 번호 목록이다. 덱을 열 때 그 덱의 장수로
+검사하므로 장수를 세려고 따로 열 필요가 없다.
+"""
+
+import hashlib
+import os
+import re
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+from pptx.parts.image import ImagePart
+
+from sdvdeck.builder import save_presentation
+from sdvdeck.clone import clone_slide, shared_image_part
+from sdvdeck.fastpackage import image_index, retarget
+from sdvdeck.slides import delete_slides
+from sdvdeck.streaming import StreamingWriter
+
+_P14 = "{http://schemas.microsoft.com/office/powerpoint/2010/main}"
+
+# 마스터/레이아웃 id 는 프레젠테이션 전체에서 겹치면 안 되고 이 값 이상이어야 함
+_MIN_MASTER_ID = 2147483648
+
+
+def parse_slide_numbers(text, count):
+    """'1-5,8' -> [1, 2, 3, 4, 5, 8] (count 장 덱 기준, 잘못된 범위면 ValueError)"""
+    numbers = []
+    for chunk in text.split(","):
+        match = re.fullmatch(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?", chunk)
+        if match is None:
+            raise ValueError(f"잘못된 슬라이드 범위: {text!r}")
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        if not 1 <= first <= last <= count:
+            raise ValueError(f"슬라이드 범위 {chunk.strip()} 가 1-{count} 밖입니다")
+        numbers.extend(range(first, last + 1))
+    return numbers
+
+
+def merge_decks(inputs, output):
+    """inputs [(경로, 슬라이드 범위 또는 None=전부)] 를 차례로 합쳐 output 에 저장
+
+    결과 슬라이드 수 반환. 범위가 잘못되면 ValueError (쓰던 output 은 지움).
+    """
+    inputs = list(inputs)
+    if not inputs:
+        raise ValueError("합칠 덱이 없습니다")
+    base_path, base_ranges = inputs[0]
+    prs = Presentation(base_path)
+    _keep_slides(prs, slide_numbers(base_ranges, len(prs.slides._sldIdLst)))
+    _share_images(prs)
+    layouts = _LayoutMap(prs)
+    try:
+        with StreamingWriter(prs, output) as writer:
+            writer.flush()
+            for path, ranges in inputs[1:]:
+                slides = list(Presentation(path).slides)
+                for number in slide_numbers(ranges, len(slides)) or range(1, len(slides) + 1):
+                    slide = slides[number - 1]
+                    clone_slide(slide, prs, layouts.layout_for(slide.slide_layout))
+                writer.flush()
+    except BaseException:
+        if os.path.exists(output):
+            os.remove(output)
+        raise
+    return len(prs.slides._sldIdLst)
+
+
+def split_deck(path, ranges=None, out_dir=None):
+    """범위마다 파일 하나로 나눠 저장하고 [(출력 경로, 슬라이드 수)] 반환
+
+    ranges 가 None 이면 구역별로 나눈다 (구역이 없으면 ValueError).
+    출력 이름은 <원본 이름>-01.pptx, -02.pptx ...
+    """
+    prs = Presentation(path)
+    if ranges is None:
+        ranges = [numbers for _, numbers in deck_sections(prs)]
+        if not ranges:
+            raise ValueError(f"구역이 없는 덱이라 나눌 구간을 지정해야 합니다: {path}")
+    else:
+        count = len(prs.slides._sldIdLst)
+        ranges = [slide_numbers(text, count) for text in ranges]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    out_dir = out_dir or os.path.dirname(os.path.abspath(path))
+    os.makedirs(out_dir, exist_ok=True)
+    results = []
+    for i, numbers in enumerate(ranges, start=1):
+        # 장수를 세려고 연 덱은 첫 파일에 그대로 씀
+        prs = prs or Presentation(path)
+        _keep_slides(prs, numbers)
+        _drop_empty_sections(prs)
+        output = os.path.join(out_dir, f"{stem}-{i:02d}.pptx")
+        save_presentation(prs, output)
+        results.append((output, len(numbers)))
+        prs = None
+    return results
+
+
+def slide_numbers(ranges, count):
+    """범위 문자열 또는 번호 목록을 count 장 덱 기준으로 검사한 번호 목록 (None 은 그대로)"""
+    if ranges is None:
+        return None
+    if isinstance(ranges, str):
+        return parse_slide_numbers(ranges, count)
+    numbers = list(ranges)
+    for number in numbers:
+        if not 1 <= number <= count:
+            raise ValueError(f"슬라이드 번호 {number} 가 1-{count} 밖입니다")
+    return numbers
+
+
+def deck_sections(prs):
+    """구역 [(이름, 슬라이드 번호 목록)] (구역이 없으면 빈 목록, 빈 구역은 뺌)"""
+    numbers = {str(sldId.id): i for i, sldId in enumerate(prs.slides._sldIdLst, start=1)}
+    sections = []
+    for section in prs.part._element.iter(_P14 + "section"):
+        slide_numbers = [numbers[sldId.get("id")] for sldId in section.iter(_P14 + "sldId")
+                         if sldId.get("id") in numbers]
+        if slide_numbers:
+            sections.append((section.get("name"), slide_numbers))
+    return sections
+
+
+def _keep_slides(prs, numbers):
+    """numbers 순서대로 슬라이드만 남김 (같은 번호를 두 번 고르면 복제, None 이면 그대로)"""
+    if numbers is None:
+        return
+    slides = list(prs.slides)
+    chosen = [slides[number - 1] for number in numbers]
+    parts = {slide.part for slide in chosen}
+    delete_slides(prs, [slide for slide in slides if slide.part not in parts])
+    sldIdLst = prs.slides._sldIdLst
+    sldIds = {prs.part.related_part(sldId.rId): sldId for sldId in sldIdLst}
+    for slide in chosen:
+        sldId = sldIds.pop(slide.part, None)
+        if sldId is None:
+            clone_slide(slide, prs, slide.slide_layout)
+        else:
+            sldIdLst.append(sldId)          # 맨 뒤로 옮김
+
+
+def _share_images(prs):
+    """바탕 덱 안에서 내용이 같은 이미지 파트를 하나로 합침"""
+    index = image_index(prs.part.package)
+    for slide in prs.slides:
+        rels = slide.part.rels
+        for rId, rel in list(rels.items()):
+            if rel.is_external or rel.reltype != RT.IMAGE:
+                continue
+            part = rel.target_part
+            canonical = index.find(part.sha1, len(part.blob))
+            if canonical is not None and canonical is not part:
+                retarget(rels, rId, canonical)
+
+
+def _drop_empty_sections(prs):
+    for section in list(prs.part._element.iter(_P14 + "section")):
+        if next(section.iter(_P14 + "sldId"), None) is None:
+            section.getparent().remove(section)
+
+
+class _LayoutMap:
+    """원본 레이아웃 -> 결과 덱의 레이아웃 (같은 마스터가 없으면 옮겨 옴)"""
+
+    def __init__(self, prs):
+        self.prs = prs
+        self.masters = {_graph_signature(master.part): master for master in prs.slide_masters}
+        self.layouts = {}               # 원본 레이아웃 파트 -> 결과 레이아웃
+
+    def layout_for(self, layout):
+        found = self.layouts.get(layout.part)
+        if found is not None:
+            return found
+        src_master = layout.slide_master
+        signature = _graph_signature(src_master.part)
+        master = self.masters.get(signature)
+        if master is None:
+            master = self.masters[signature] = _import_master(src_master, self.prs)
+        index = list(src_master.slide_layouts).index(layout)
+        found = self.layouts[layout.part] = master.slide_layouts[index]
+        return found
+
+
+def _graph_signature(part):
+    """part 와 관계로 닿는 파트들(슬라이드 제외)의 내용 해시 (관계 순서 포함)"""
+    h = hashlib.sha1()
+    seen = set()
+    pending = [part]
+    while pending:
+        part = pending.pop()
+        if part in seen:
+            h.update(b"\0seen")
+            continue
+        seen.add(part)
+        h.update(b"\0part")
+        h.update(part.content_type.encode("utf-8"))
+        h.update(part.sha1.encode("ascii") if isinstance(part, ImagePart) else
+                 hashlib.sha1(part.blob).digest())
+        for rId, rel in sorted(part.rels.items()):
+            h.update(f"\0{rId}\0{rel.reltype}".encode("utf-8"))
+            if rel.is_external:
+                h.update(rel.target_ref.encode("utf-8"))
+            elif rel.reltype != RT.SLIDE:
+                pending.append(rel.target_part)
+    return h.hexdigest()
+
+
+def _import_master(src_master, prs):
+    """src_master 를 레이아웃/테마/이미지와 함께 prs 로 옮겨 오고 새 마스터 반환"""
+    pres_part = prs.part
+    package = pres_part.package
+    used = {part.partname for part in package.iter_parts()}
+    copied = {}
+
+    def copy_part(part):
+        if part in copied:
+            return copied[part]
+        if isinstance(part, ImagePart) or part.content_type.startswith("image/"):
+            # 이미지는 입력 전체에서 sha1 하나당 파트 하나 (PIL 이 못 읽는 형식은 내용 그대로)
+            new = copied[part] = shared_image_part(package, part)
+            return new
+        partname = _free_partname(part.partname, used)
+        new = copied[part] = PartFactory(partname, part.content_type, package, part.blob)
+        # rId 를 원본과 같게 두므로 XML 의 r:id 를 고칠 필요가 없음
+        rels = new.rels
+        for rId, rel in part.rels.items():
+            if rel.is_external:
+                rels._rels[rId] = _Relationship(rels._base_uri, rId, rel.reltype, RTM.EXTERNAL,
+                                                rel.target_ref)
+            else:
+                rels._rels[rId] = _Relationship(rels._base_uri, rId, rel.reltype, RTM.INTERNAL,
+                                                copy_part(rel.target_part))
+        return new
+
+    master_part = copy_part(src_master.part)
+    # 마스터/레이아웃 id 는 프레젠테이션 전체에서 겹치지 않게 새로 매김
+    pres = pres_part._element
+    sldMasterIdLst = pres.get_or_add_sldMasterIdLst()
+    ids = [int(node.get("id")) for node in sldMasterIdLst.iter(qn("p:sldMasterId"))]
+    for master in prs.slide_masters:
+        ids += [int(node.get("id")) for node in master._element.iter(qn("p:sldLayoutId"))]
+    next_id = max([_MIN_MASTER_ID - 1] + ids) + 1
+    sldMasterId = sldMasterIdLst._add_sldMasterId()
+    sldMasterId.set("id", str(next_id))
+    sldMasterId.set(qn("r:id"), pres_part.relate_to(master_part, RT.SLIDE_MASTER))
+    for node in master_part._element.iter(qn("p:sldLayoutId")):
+        next_id += 1
+        node.set("id", str(next_id))
+    return master_part.slide_master
+
+
+def _free_partname(partname, used):
+    """partname 과 같은 꼴(/ppt/slideLayouts/slideLayout%d.xml)에서 쓰지 않은 이름"""
+    match = re.fullmatch(r"(.*?)(\d*)(\.[^./]+)", partname)
+    prefix, _, ext = match.groups()
+    number = 1
+    while PackURI(f"{prefix}{number}{ext}") in used:
+        number += 1
+    partname = PackURI(f"{prefix}{number}{ext}")
+    used.add(partname)
+    return partname
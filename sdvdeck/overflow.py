@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+불릿 스택 넘침 검사와 재배치
+
+bullet_stack 은 항목마다 고정 간격(heading_step, bullet_step ...)으로 내려가기만 해서
+항목이 많거나 줄이 길면 슬라이드 아래로 넘쳐도 알 수 없었다. 여기서는 렌더링 없이
+글자 너비 표(textfit)로 줄 수를 세어 스택 높이를 구하고, 넘치면
+
+- shrink   글자 크기와 간격을 MIN_SCALE 까지 줄이고
+- columns  최상위 항목 경계에서 두 단으로 나누고
+- split    다음 슬라이드로 넘긴다 (그룹 중간에서 나뉘면 헤딩을 "(계속)" 으로 반복)
+
+"auto" 는 이 순서로 시도한다. 모두 안 되면 FLOOR_SCALE 까지 줄인다.
+넘치지 않는 스택은 원래 배치 그대로다.
+"""
+
+from dataclasses import dataclass, replace
+
+from pptx.util import Inches, Pt
+
+from sdvdeck.fonts import find_font
+from sdvdeck.textfit import EMU_PER_POINT, text_measure
+
+OVERFLOW_POLICIES = ("auto", "shrink", "columns", "split")
+_ATTEMPTS = {
+    "auto": ("shrink", "columns", "split"),
+    "shrink": ("shrink",),
+    "columns": ("columns",),
+    "split": ("split",),
+}
+
+MIN_SCALE = 0.75
+FLOOR_SCALE = 0.5
+SCALE_STEP = 0.05
+COLUMN_GAP = Inches(0.5)
+CONTINUED = " (계속)"
+
+# 크기를 지정하지 않은 문단의 기본 크기 (PowerPoint 기본값)
+DEFAULT_SIZE = Pt(18)
+# 텍스트박스 기본 좌우 여백 (0.1in 씩)
+TEXT_INSET = Inches(0.2)
+# 한 줄 높이 = 글자 크기 × LINE_HEIGHT (줄 간격 1.0 기준)
+LINE_HEIGHT = 1.2
+
+# 측정용 글꼴 (지정 글꼴이 없을 때, 한글 글리프가 있는 것만)
+MEASURE_FONTS = ("Malgun Gothic", "맑은 고딕", "Noto Sans CJK KR", "Noto Sans KR", "NanumGothic")
+
+_FONT_FILES = {}
+
+
+@dataclass(frozen=True)
+class StackPlan:
+    """배치 결과: 적용할 스택 스타일과 슬라이드별 단 목록 [[(x 오프셋, 너비, 항목들)]]"""
+    action: str
+    stack: object
+    pages: tuple
+
+
+def stack_entries(items):
+    """bullet_stack 항목을 [(종류, 텍스트, 소속 헤딩)] 으로 펼침"""
+    entries = []
+    for item in items:
+        if isinstance(item, dict):
+            heading = item.get('heading')
+            if heading is not None:
+                entries.append(("heading", heading, None))
+            for bullet in item.get('bullets', ()):
+                entries.append(("bullet", bullet, heading))
+        else:
+            entries.append(("item", item, None))
+    return entries
+
+
+def entry_box(kind, stack, width):
+    """(스타일, 간격, 높이, 들여쓰기, 너비, 앞에 붙일 표시)"""
+    if kind == "heading":
+        return stack.heading, stack.heading_step, stack.heading_height, 0, width, ""
+    if kind == "bullet":
+        return (stack.bullet, stack.bullet_step, stack.bullet_height, stack.bullet_indent,
+                width - stack.bullet_shrink, stack.bullet_mark)
+    return stack.item, stack.item_step, stack.item_height, 0, width, stack.bullet_mark
+
+
+def measure_font(family=None):
+    """줄 수 측정에 쓸 글꼴 파일 (없으면 None: 글자 종류별 추정 너비)"""
+    if family not in _FONT_FILES:
+        path = None
+        for name in (family, *MEASURE_FONTS):
+            if name is not None:
+                path = find_font(name)
+                if path is not None:
+                    break
+        _FONT_FILES[family] = path
+    return _FONT_FILES[family]
+
+
+def line_count(text, style, width):
+    size = (style.size or DEFAULT_SIZE) / EMU_PER_POINT
+    measure = text_measure(text, measure_font(style.font))
+    return len(measure.lines(max(width - TEXT_INSET, 1), size))
+
+
+def entry_steps(entries, stack, width):
+    """항목별 세로 간격 (줄이 넘어가면 늘어난 줄 수만큼 더함)"""
+    steps = []
+    for kind, text, _ in entries:
+        style, step, _, _, box_width, mark = entry_box(kind, stack, width)
+        lines = line_count(mark + text, style, box_width)
+        spacing = style.line_spacing if isinstance(style.line_spacing, float) else 1.0
+        extra = (lines - 1) * (style.size or DEFAULT_SIZE) * LINE_HEIGHT * spacing
+        steps.append(step + int(extra))
+    return steps
+
+
+def stack_height(entries, stack, width):
+    return sum(entry_steps(entries, stack, width))
+
+
+def scale_stack(stack, scale):
+    """글자 크기와 간격/높이를 scale 배로 (들여쓰기는 유지)"""
+    def text_style(style):
+        size = int(round((style.size or DEFAULT_SIZE) * scale / 127)) * 127   # 1/100 pt 단위
+        return replace(style, size=size)
+
+    def length(value):
+        return int(round(value * scale))
+
+    return replace(
+        stack,
+        heading=text_style(stack.heading), bullet=text_style(stack.bullet),
+        item=text_style(stack.item),
+        heading_height=length(stack.heading_height), heading_step=length(stack.heading_step),
+        bullet_height=length(stack.bullet_height), bullet_step=length(stack.bullet_step),
+        item_height=length(stack.item_height), item_step=length(stack.item_step),
+    )
+
+
+def plan_stack(entries, stack, width, available, policy="auto", can_split=False):
+    """entries 를 available 높이 안에 배치하는 StackPlan"""
+    if stack_height(entries, stack, width) <= available:
+        return StackPlan("fit", stack, (((0, width, entries),),))
+    for action in _ATTEMPTS[policy]:
+        if action == "shrink":
+            plan = _shrink(entries, stack, width, available, MIN_SCALE)
+        elif action == "columns":
+            plan = _columns(entries, stack, width, available)
+        else:
+            plan = _split(entries, stack, width, available) if can_split else None
+        if plan is not None:
+            return plan
+    return _shrink(entries, stack, width, available, FLOOR_SCALE, force=True)
+
+
+def _scales(lowest):
+    scale = 1.0 - SCALE_STEP
+    while scale >= lowest - 1e-9:
+        yield round(scale, 2)
+        scale -= SCALE_STEP
+
+
+def _shrink(entries, stack, width, available, lowest, force=False):
+    scaled = stack
+    for scale in _scales(lowest):
+        scaled = scale_stack(stack, scale)
+        if stack_height(entries, scaled, width) <= available:
+            return StackPlan("shrink", scaled, (((0, width, entries),),))
+    if force:
+        return StackPlan("shrink", scaled, (((0, width, entries),),))
+    return None
+
+
+def _top_level_starts(entries):
+    """최상위 항목이 시작하는 위치 (헤딩, 문자열 항목, 헤딩 없는 그룹의 첫 불릿)"""
+    starts = []
+    for i, (kind, _, heading) in enumerate(entries):
+        if kind != "bullet" or i == 0 or (heading is None and entries[i - 1][0] != "bullet"):
+            starts.append(i)
+    return starts
+
+
+def _columns(entries, stack, width, available):
+    column_width = (width - COLUMN_GAP) // 2
+    steps = entry_steps(entries, stack, column_width)
+    best = None
+    for cut in _top_level_starts(entries)[1:]:
+        left, right = sum(steps[:cut]), sum(steps[cut:])
+        if max(left, right) <= available and (best is None or max(left, right) < best[0]):
+            best = (max(left, right), cut)
+    if best is None:
+        return None
+    cut = best[1]
+    columns = ((0, column_width, entries[:cut]),
+               (column_width + COLUMN_GAP, column_width, entries[cut:]))
+    return StackPlan("columns", stack, (columns,))
+
+
+def _split(entries, stack, width, available):
+    steps = entry_steps(entries, stack, width)
+    pages = []
+    page, used = [], 0
+    for entry, step in zip(entries, steps):
+        if page and used + step > available:
+            pages.append(((0, width, page),))
+            page, used = [], 0
+            kind, _, heading = entry
+            if kind == "bullet" and heading is not None:
+                continued = ("heading", heading + CONTINUED, None)
+                page.append(continued)
+                used += entry_steps([continued], stack, width)[0]
+        page.append(entry)
+        used += step
+    pages.append(((0, width, page),))
+    return StackPlan("split", stack, tuple(pages))
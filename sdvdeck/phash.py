@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+지각 해시(dHash)로 눈으로 보기에 같은 이미지 찾기
+
+python-pptx 는 바이트가 같은 이미지만 한 파트로 합친다. 파일명만 다른 사본이나
+다시 저장된 같은 사진은 dHash 해밍 거리가 작으므로, 덱 안에서 처음 쓴 파일로
+바꿔 넣어 파트 하나만 들어가게 한다. 비율이 다르면 같은 이미지로 보지 않는다.
+"""
+
+import os
+
+from PIL import Image
+
+from sdvdeck.probe import file_sha1
+
+HASH_SIZE = 8
+# 이 거리 이하면 같은 이미지 (64비트 기준, 재압축/리사이즈 정도의 차이)
+DEFAULT_THRESHOLD = 4
+ASPECT_TOLERANCE = 0.02
+
+# 원본 sha1 -> (해시, 가로/세로 비율)
+_SIGNATURES = {}
+
+
+def dhash(im, size=HASH_SIZE):
+    """가로 인접 픽셀 밝기 차이로 만든 size*size 비트 해시"""
+    im.draft("L", (size * 8, size * 8))     # JPEG 는 축소 디코딩
+    small = im.convert("L").resize((size + 1, size), Image.LANCZOS)
+    pixels = small.tobytes()
+    value = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def image_signature(path):
+    """(dHash, 가로/세로 비율), 같은 내용 파일은 한 번만 계산"""
+    digest = file_sha1(path)
+    signature = _SIGNATURES.get(digest)
+    if signature is None:
+        with Image.open(path) as im:
+            width, height = im.size
+            signature = (dhash(im), width / height)
+        _SIGNATURES[digest] = signature
+    return signature
+
+
+def similar(a, b, threshold=DEFAULT_THRESHOLD):
+    """두 시그니처가 같은 이미지로 볼 만큼 가까운지"""
+    (hash_a, aspect_a), (hash_b, aspect_b) = a, b
+    return (hamming(hash_a, hash_b) <= threshold and
+            abs(aspect_a - aspect_b) <= ASPECT_TOLERANCE * aspect_a)
+
+
+class DuplicateIndex:
+    """덱 하나에서 쓴 이미지들의 대표 파일 색인"""
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.merged = {}            # 바꿔 넣은 경로 -> 대표 경로
+        self._seen = {}             # 경로 -> 대표 경로
+        self._canonical = []        # [(시그니처, 대표 경로)]
+
+    def canonical(self, path):
+        """path 와 같은 이미지를 이미 썼으면 그 경로, 아니면 path (읽을 수 없으면 그대로)"""
+        found = self._seen.get(path)
+        if found is not None:
+            return found
+        try:
+            signature = image_signature(path)
+        except (OSError, ValueError, ZeroDivisionError):
+            return path
+        found = path
+        for other, other_path in self._canonical:
+            if similar(signature, other, self.threshold):
+                found = other_path
+                self.merged[path] = other_path
+                break
+        else:
+            self._canonical.append((signature, path))
+        self._seen[path] = found
+        return found
+
+
+def find_duplicates(paths, threshold=DEFAULT_THRESHOLD):
+    """비슷한 이미지 묶음 [[경로, ...], ...] (두 개 이상인 묶음만, 거리 기준 연결)"""
+    signatures = []
+    for path in paths:
+        try:
+            signatures.append((path, image_signature(path)))
+        except (OSError, ValueError, ZeroDivisionError):
+            continue
+    parent = list(range(len(signatures)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, (_, a) in enumerate(signatures):
+        for j in range(i + 1, len(signatures)):
+            if similar(a, signatures[j][1], threshold):
+                parent[root(j)] = root(i)
+    groups = {}
+    for i, (path, _) in enumerate(signatures):
+        groups.setdefault(root(i), []).append(path)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def duplicate_report(folder, threshold=DEFAULT_THRESHOLD):
+    """폴더 이미지의 중복 묶음과 합쳤을 때 줄어드는 바이트 [(묶음, 절약 바이트)]"""
+    paths = sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                   if os.path.isfile(os.path.join(folder, name)))
+    report = []
+    for group in find_duplicates(paths, threshold):
+        sizes = [os.path.getsize(path) for path in group]
+        report.append((group, sum(sizes) - max(sizes)))
+    return report
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 헤더만 읽는 형식/크기/DPI 조회 (+ 디스크 메모)
+
+python-pptx 는 add_picture 마다 파일 전체를 읽어 PIL 로 열고 sha1 을 다시 계산하며,
+images.source_size() 는 EXIF 회전을 보려고 getexif() 를 부르는데 PNG 는 이때 픽셀까지
+디코딩한다. 여기서는 JPEG(SOF, JFIF, EXIF IFD0), PNG(IHDR, pHYs, eXIf), GIF 헤더만
+읽어 PIL 과 같은 값(형식, 픽셀 크기, info["dpi"], EXIF 회전)을 구한다. 그 밖의 형식은
+PIL 로 연다 (헤더만).
+
+결과와 파일 sha1 은 (경로, 크기, mtime_ns) 를 키로 .sdvdeck/image-probe.json 에
+남겨 다음 실행에서는 파일을 열지도 않는다.
+install() 은 python-pptx 의 Image._pil_props 를 헤더 조회로 바꾸며, 여러 번 불러도
+한 번만 적용된다.
+"""
+
+import atexit
+import hashlib
+import io
+import json
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+
+from pptx.parts.image import Image as PptxImage
+from pptx.util import lazyproperty
+
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                ".sdvdeck", "image-probe.json")
+
+# 저장 형식/판정 방식이 바뀌면 올려서 이전 메모를 무효화
+MANIFEST_VERSION = 1
+
+_EXIF_ORIENTATION = 0x0112
+_EXIF_X_RESOLUTION = 0x011A
+_EXIF_RESOLUTION_UNIT = 0x0128
+
+# 크기 정보가 있는 JPEG SOF 마커 (DHT/JPG/DAC 제외)
+_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """헤더에서 읽은 이미지 정보 (dpi 는 PIL info["dpi"] 와 같은 값, 없으면 None)"""
+    format: str
+    width: int
+    height: int
+    dpi: tuple = None
+    orientation: int = None
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    @property
+    def display_size(self):
+        """EXIF 회전을 반영한 (가로, 세로)"""
+        if self.orientation in (5, 6, 7, 8):
+            return self.height, self.width
+        return self.width, self.height
+
+
+def probe_stream(f):
+    """JPEG/PNG/GIF 헤더로 ImageInfo, 그 밖의 형식이나 잘린 파일이면 None"""
+    head = f.read(26)
+    try:
+        if head.startswith(b"\xff\xd8"):
+            f.seek(2)
+            return _probe_jpeg(f)
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            f.seek(8)
+            return _probe_png(f)
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            width, height = struct.unpack("<HH", head[6:10])
+            return ImageInfo("GIF", width, height)
+    except (struct.error, ValueError, IndexError, ZeroDivisionError):
+        pass
+    return None
+
+
+def probe_bytes(blob):
+    return probe_stream(io.BytesIO(blob))
+
+
+def probe_file(path):
+    """헤더 조회, 안 되면 PIL 로 (읽을 수 없는 파일이면 OSError)"""
+    with open(path, "rb") as f:
+        info = probe_stream(f)
+    if info is not None:
+        return info
+    return _pil_info(path)
+
+
+def _read_exact(f, n):
+    data = f.read(n)
+    if len(data) != n:
+        raise ValueError("truncated")
+    return data
+
+
+def _probe_jpeg(f):
+    size = dpi = exif = None
+    while True:
+        byte = _read_exact(f, 1)
+        if byte != b"\xff":
+            continue
+        marker = _read_exact(f, 1)[0]
+        while marker == 0xFF:               # 채움 바이트
+            marker = _read_exact(f, 1)[0]
+        if marker in (0x01, 0x00) or 0xD0 <= marker <= 0xD7:
+            continue
+        if marker in (0xD9, 0xDA):          # EOI, SOS: 헤더 끝
+            break
+        length = struct.unpack(">H", _read_exact(f, 2))[0]
+        if marker in _SOF_MARKERS:
+            height, width = struct.unpack(">HH", _read_exact(f, 5)[1:5])
+            size = (width, height)
+            f.seek(length - 7, io.SEEK_CUR)
+        elif marker == 0xE0:
+            segment = _read_exact(f, length - 2)
+            if segment.startswith(b"JFIF") and len(segment) >= 12 and dpi is None:
+                unit = segment[7]
+                density = struct.unpack(">HH", segment[8:12])
+                if unit == 1:
+                    dpi = density
+                elif unit == 2:
+                    dpi = tuple(d * 2.54 for d in density)
+        elif marker == 0xE1:
+            segment = _read_exact(f, length - 2)
+            if segment.startswith(b"Exif\0\0") and exif is None:
+                exif = segment[6:]
+        else:
+            f.seek(length - 2, io.SEEK_CUR)
+    if size is None:
+        return None
+    tags = _exif_tags(exif) if exif else {}
+    if dpi is None and exif:
+        # PIL 과 같이: JFIF 에 없으면 EXIF 해상도, 그것도 못 읽으면 72
+        try:
+            resolution = tags[_EXIF_X_RESOLUTION]
+            value = resolution[0] / resolution[1]
+            if tags[_EXIF_RESOLUTION_UNIT] == 3:
+                value *= 2.54
+            dpi = (value, value)
+        except (KeyError, TypeError, ZeroDivisionError):
+            dpi = (72, 72)
+    return ImageInfo("JPEG", size[0], size[1], dpi, tags.get(_EXIF_ORIENTATION))
+
+
+def _probe_png(f):
+    width = height = dpi = orientation = None
+    seen_data = False                   # PIL 은 IDAT 앞의 pHYs 만 봄
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            break
+        length, kind = struct.unpack(">I4s", header)
+        if kind == b"IHDR":
+            width, height = struct.unpack(">II", _read_exact(f, 8))
+            f.seek(length - 8 + 4, io.SEEK_CUR)
+        elif kind == b"pHYs" and not seen_data:
+            px, py, unit = struct.unpack(">IIB", _read_exact(f, 9))
+            if unit == 1:
+                dpi = (px * 0.0254, py * 0.0254)
+            f.seek(length - 9 + 4, io.SEEK_CUR)
+        elif kind == b"eXIf":
+            orientation = _exif_tags(_read_exact(f, length)).get(_EXIF_ORIENTATION)
+            f.seek(4, io.SEEK_CUR)
+        elif kind == b"IEND":
+            break
+        else:
+            seen_data = seen_data or kind == b"IDAT"
+            f.seek(length + 4, io.SEEK_CUR)     # IDAT 도 건너뜀 (디코딩 없음)
+    if width is None:
+        return None
+    return ImageInfo("PNG", width, height, dpi, orientation)
+
+
+def _exif_tags(data):
+    """EXIF(TIFF) IFD0 의 회전/해상도 태그 {태그: 값} (유리수는 (분자, 분모))"""
+    if data[:2] == b"II":
+        order = "<"
+    elif data[:2] == b"MM":
+        order = ">"
+    else:
+        return {}
+    try:
+        offset = struct.unpack(order + "I", data[4:8])[0]
+        count = struct.unpack(order + "H", data[offset:offset + 2])[0]
+        tags = {}
+        for i in range(count):
+            entry = data[offset + 2 + i * 12:offset + 14 + i * 12]
+            tag, kind, _, value = struct.unpack(order + "HHI4s", entry)
+            if tag in (_EXIF_ORIENTATION, _EXIF_RESOLUTION_UNIT) and kind == 3:
+                tags[tag] = struct.unpack(order + "H", value[:2])[0]
+            elif tag == _EXIF_X_RESOLUTION and kind in (5, 10):
+                pointer = struct.unpack(order + "I", value)[0]
+                fmt = order + ("II" if kind == 5 else "ii")
+                tags[tag] = struct.unpack(fmt, data[pointer:pointer + 8])
+        return tags
+    except struct.error:
+        return {}
+
+
+def _pil_info(path):
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(path) as im:
+            orientation = im.getexif().get(_EXIF_ORIENTATION)
+            return ImageInfo(im.format, im.size[0], im.size[1], im.info.get("dpi"), orientation)
+    except (UnidentifiedImageError, SyntaxError, ValueError) as e:
+        raise OSError(f"읽을 수 없는 이미지: {path}") from e
+
+
+class ProbeManifest:
+    """경로별 (크기, mtime_ns) 가 같으면 다시 읽지 않는 ImageInfo/sha1 메모"""
+
+    def __init__(self, path=DEFAULT_MANIFEST):
+        self.path = path
+        self._entries = None            # 절대 경로 -> {"stamp": [...], "info": [...], "sha1": ...}
+        self._dirty = False
+
+    def info(self, path):
+        entry = self._entry(path)
+        if "info" not in entry:
+            entry["info"] = list(_info_fields(probe_file(path)))
+            self._dirty = True
+        format, width, height, dpi, orientation = entry["info"]
+        return ImageInfo(format, width, height, None if dpi is None else tuple(dpi), orientation)
+
+    def sha1(self, path):
+        entry = self._entry(path)
+        if "sha1" not in entry:
+            h = hashlib.sha1()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+            entry["sha1"] = h.hexdigest()
+            self._dirty = True
+        return entry["sha1"]
+
+    def save(self):
+        """바뀐 내용이 있으면 저장 (다른 프로세스가 쓴 항목과 합침)"""
+        if not self._dirty:
+            return
+        entries = self._read()
+        entries.update(self._entries)
+        folder = os.path.dirname(self.path)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": entries}, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass                        # 메모를 못 써도 이번 실행에는 지장 없음
+        self._dirty = False
+
+    def _entry(self, path):
+        if self._entries is None:
+            self._entries = self._read()
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        entry = self._entries.get(path)
+        if entry is None or entry["stamp"] != stamp:
+            entry = self._entries[path] = {"stamp": stamp}
+            self._dirty = True
+        return entry
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+
+def _info_fields(info):
+    return info.format, info.width, info.height, info.dpi, info.orientation
+
+
+_DEFAULT = None
+
+
+def default_manifest():
+    """프로세스 공용 메모 (종료 시 저장)"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = ProbeManifest()
+        atexit.register(_DEFAULT.save)
+    return _DEFAULT
+
+
+def image_info(path):
+    """path 의 ImageInfo (메모 사용, 읽을 수 없으면 OSError)"""
+    return default_manifest().info(path)
+
+
+def file_sha1(path):
+    """path 내용의 sha1 (메모 사용)"""
+    return default_manifest().sha1(path)
+
+
+def flush_manifest():
+    """공용 메모를 바로 저장 (atexit 가 돌지 않는 풀 워커용)"""
+    if _DEFAULT is not None:
+        _DEFAULT.save()
+
+
+def _pil_props(self):
+    info = probe_bytes(self._blob)
+    if info is None:
+        return _original_pil_props._fget(self)
+    return info.format, info.size, info.dpi
+
+
+_original_pil_props = PptxImage._pil_props
+
+
+def install():
+    if getattr(PptxImage, "_sdvdeck_probe", False):
+        return
+    PptxImage._pil_props = lazyproperty(_pil_props)
+    PptxImage._sdvdeck_probe = True
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+재현 가능한 저장 (같은 덱이면 같은 바이트)
+
+같은 덱을 두 번 저장해도 zip 항목의 시각(저장 시각)과 만든 OS 표시가 달라 바이트가
+달라지므로 출력 해시로 캐시하거나 CI 에서 바뀐 덱만 올릴 수 없다. reproducible-builds
+관례대로 SOURCE_DATE_EPOCH 환경 변수가 있으면
+
+- zip 항목 시각을 그 시각(UTC, 1980 년 이전이면 1980-01-01)으로, 만든 OS 를 Unix 로 고정하고
+- 파트를 파트 이름 순으로 쓰고 ([Content_Types].xml, _rels/.rels 다음)
+- core.xml 이 없는 패키지에 python-pptx 가 새로 만드는 modified 도 그 시각으로 둔다.
+
+rId 와 도형 id 는 만든 순서대로 매기므로(관계 파일은 rId 숫자 순) 같은 빌드면
+같다. enable() 은 환경 변수를 설정하므로 빌드 워커 프로세스에도 이어진다.
+install() 은 여러 번 불러도 한 번만 적용된다.
+"""
+
+import datetime as dt
+import os
+import time
+
+from pptx.opc.serialized import PackageWriter
+from pptx.parts.coreprops import CorePropertiesPart
+
+# --reproducible 에서 SOURCE_DATE_EPOCH 가 없을 때 쓰는 시각 (zip 이 표현하는 가장 이른 시각)
+DEFAULT_EPOCH = 315532800       # 1980-01-01 00:00:00 UTC
+
+# zip 의 "만든 OS" (3 = Unix)
+CREATE_SYSTEM = 3
+
+
+def enable(epoch=DEFAULT_EPOCH):
+    """재현 가능한 저장 켜기 (SOURCE_DATE_EPOCH 가 이미 있으면 그 값을 씀)"""
+    os.environ.setdefault("SOURCE_DATE_EPOCH", str(int(epoch)))
+
+
+def source_date_epoch():
+    """SOURCE_DATE_EPOCH (없거나 잘못된 값이면 None)"""
+    value = os.environ.get("SOURCE_DATE_EPOCH")
+    try:
+        return None if value is None else max(int(value), DEFAULT_EPOCH)
+    except ValueError:
+        return None
+
+
+def enabled():
+    return source_date_epoch() is not None
+
+
+def zip_date_time():
+    """zip 항목 시각 (재현 모드가 아니면 지금 시각)"""
+    epoch = source_date_epoch()
+    if epoch is None:
+        return time.localtime(time.time())[:6]
+    return time.gmtime(epoch)[:6]
+
+
+def _write(cls, pkg_file, pkg_rels, parts):
+    if enabled():
+        parts = sorted(parts, key=lambda part: part.partname)
+    cls(pkg_file, pkg_rels, parts)._write()
+
+
+def _default_core_properties(cls, package):
+    core_props = _original_default.__func__(cls, package)
+    epoch = source_date_epoch()
+    if epoch is not None:
+        core_props.modified = dt.datetime.fromtimestamp(epoch, dt.timezone.utc).replace(tzinfo=None)
+    return core_props
+
+
+_original_default = CorePropertiesPart.default
+
+
+def install():
+    if getattr(PackageWriter, "_sdvdeck_reproducible", False):
+        return
+    PackageWriter.write = classmethod(_write)
+    CorePropertiesPart.default = classmethod(_default_core_properties)
+    PackageWriter._sdvdeck_reproducible = True
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+슬라이드 삭제
+
+python-pptx 에는 슬라이드 삭제 API 가 없어 p:sldIdLst 에서 p:sldId 만 지우는 방법이
+흔히 쓰인다. 그러면 presentation.xml.rels 의 관계가 남아 슬라이드 파트와 그 노트,
+이미지가 모두 그대로 저장된다 (템플릿 미디어 전체가 결과 덱에 실림).
+
+delete_slide() 는 sldId 와 함께 관계, 재구성 쇼(custShow)의 참조, 구역(p14:section)의
+id 까지 지운다. 패키지 저장은 관계를 따라 도달 가능한 파트만 쓰므로, 다른 곳에서
+참조하지 않는 슬라이드/노트/미디어 파트는 저장되지 않고, lazyzip 으로 연 템플릿이면
+압축을 풀지도 않는다.
+"""
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+
+from sdvdeck.fastpackage import forget_image_index
+
+_P14_SECTION_ID = "{http://schemas.microsoft.com/office/powerpoint/2010/main}sldId"
+
+
+def delete_slide(prs, slide):
+    """slide (Slide 또는 순번) 를 덱에서 지움"""
+    if isinstance(slide, int):
+        slide = prs.slides[slide]
+    _delete(prs, [slide])
+
+
+def delete_slides(prs, slides=None):
+    """여러 슬라이드를 지움 (None 이면 전부: 템플릿의 레이아웃/마스터만 남김)"""
+    _delete(prs, list(prs.slides) if slides is None else list(slides))
+
+
+def reachable_parts(prs):
+    """저장될 파트 목록 (패키지 관계를 따라 도달 가능한 것)"""
+    return list(prs.part.package.iter_parts())
+
+
+def _delete(prs, slides):
+    if not slides:
+        return
+    pres_part = prs.part
+    pres = pres_part._element
+    sldIdLst = prs.slides._sldIdLst
+    targets = {slide.part for slide in slides}
+    removed = []
+    for sldId in list(sldIdLst):
+        if pres_part.related_part(sldId.rId) in targets:
+            removed.append((sldId.rId, sldId.id))
+            sldIdLst.remove(sldId)
+    rIds = {rId for rId, _ in removed}
+    slide_ids = {str(slide_id) for _, slide_id in removed}
+
+    # 재구성 쇼와 구역에서 지운 슬라이드 참조 제거
+    for sld in pres.xpath("./p:custShowLst/p:custShow/p:sldLst/p:sld"):
+        if sld.get(qn("r:id")) in rIds:
+            sld.getparent().remove(sld)
+    for section_id in pres.iter(_P14_SECTION_ID):
+        if section_id.get("id") in slide_ids:
+            section_id.getparent().remove(section_id)
+
+    for rId in rIds:
+        rel = pres_part.rels.get(rId)
+        if rel is not None and rel.reltype == RT.SLIDE:
+            pres_part.drop_rel(rId)
+    # 이미지 색인은 도달 가능한 파트로 다시 만들게 함 (지운 슬라이드 이미지와 번호 해제)
+    forget_image_index(pres_part.package)
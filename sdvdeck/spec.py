@@ -0,0 +1,694 @@
+# -*- coding: utf-8 -*-
+"""
+선언형 덱 명세(YAML/JSON) 컴파일러
+
+명세 파일 하나에 테마(themes), 슬라이드(slides), 변형(variants)을 적고
+변형마다 슬라이드 id/태그를 골라 SlideBuilder 호출로 컴파일한다.
+검증과 단위 변환(인치, 포인트, 색상)은 파싱 단계에서 끝내 두므로
+파싱 결과를 캐시하면 변형 여러 개를 만들 때 파일을 다시 읽지 않는다.
+
+    themes:
+      basic:
+        header_color: "#002060"
+        title: {size: 28, bold: true, color: WHITE}
+    slides:
+      - id: intro
+        tags: [short]
+        title: "중국 SDV 표준 개요"
+        items:
+          - heading: "표준 구성"
+            bullets: ["Part 1", "Part 2"]
+    variants:
+      short: {theme: basic, output: short.pptx, tags: [short]}
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field, replace
+
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.util import Inches, Pt
+
+from sdvdeck.builder import (BoxStyle, SlideBuilder, StackStyle, TextStyle, Theme,
+                             apply_text_style, split_lines)
+from sdvdeck.clone import SlidePool
+from sdvdeck.images import UnsupportedImageError
+from sdvdeck.incremental import IncrementalBuild, slide_key
+from sdvdeck.overflow import OVERFLOW_POLICIES
+
+
+class SpecError(ValueError):
+    """명세 검증 오류 (위치 경로 포함)"""
+
+    def __init__(self, where, message):
+        super().__init__(f"{where}: {message}")
+        self.where = where
+
+
+# 기본 색상 이름 (명세의 colors: 로 추가/재정의 가능)
+NAMED_COLORS = {
+    "BLACK": RGBColor(0, 0, 0),
+    "WHITE": RGBColor(255, 255, 255),
+    "GRAY": RGBColor(128, 128, 128),
+    "DARK_GRAY": RGBColor(64, 64, 64),
+}
+
+_ALIGNS = {
+    "left": PP_ALIGN.LEFT,
+    "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT,
+    "justify": PP_ALIGN.JUSTIFY,
+}
+
+_ANCHORS = {
+    "top": MSO_ANCHOR.TOP,
+    "middle": MSO_ANCHOR.MIDDLE,
+    "bottom": MSO_ANCHOR.BOTTOM,
+}
+
+# 15분 발표 스크립트의 이미지 배치 (이미지 상자, 본문 폭)
+IMAGE_POSITIONS = {
+    "right": ((Inches(9), Inches(1.5), Inches(6.5)), Inches(8)),
+    "bottom": ((Inches(2), Inches(5), Inches(12)), Inches(14)),
+    "center": ((Inches(2), Inches(1.5), Inches(12)), None),
+}
+
+
+@dataclass(frozen=True)
+class Element:
+    """슬라이드에 직접 배치하는 도형/텍스트박스/이미지 하나"""
+    kind: object                  # "textbox", "picture" 또는 MSO_SHAPE 값
+    box: tuple
+    style: BoxStyle = BoxStyle()
+    paragraphs: tuple = ()
+    leading_blank: bool = False
+    image: str = None
+
+
+@dataclass(frozen=True)
+class Table:
+    box: tuple
+    rows: tuple
+    header: TextStyle
+    body: TextStyle
+    header_fill: RGBColor = None
+    column_styles: tuple = ()     # ((열 번호, TextStyle), ...)
+
+
+@dataclass(frozen=True)
+class SlideSpec:
+    id: str
+    tags: frozenset = frozenset()
+    title: str = None
+    background: RGBColor = None
+    layout: int = None
+    image: Element = None
+    content_width: int = None
+    items: tuple = ()
+    code: str = None
+    table: Table = None
+    elements: tuple = ()
+    page_number: bool = True
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    theme: str
+    output: str
+    slides: tuple = ()            # 명시한 슬라이드 id 순서
+    tags: frozenset = frozenset() # 또는 태그로 선택 (명세 순서 유지)
+
+
+@dataclass
+class DeckSpec:
+    source: str
+    base_dir: str
+    themes: dict
+    slides: list
+    variants: dict
+    _by_id: dict = field(default_factory=dict, repr=False)
+
+    def slide(self, slide_id):
+        return self._by_id[slide_id]
+
+    def select(self, variant):
+        """변형에 포함되는 슬라이드 목록"""
+        if variant.slides:
+            return [self._by_id[slide_id] for slide_id in variant.slides]
+        return [s for s in self.slides if s.tags & variant.tags]
+
+
+# 로딩 / 캐시 ------------------------------------------------------------
+
+# 절대 경로 -> ((mtime_ns, size), DeckSpec)
+_SPEC_CACHE = {}
+
+
+def load_spec(path):
+    """명세 파일을 읽어 검증된 DeckSpec 반환 (파일이 그대로면 캐시 재사용)"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _SPEC_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    spec = parse_spec(_read_data(path), path)
+    _SPEC_CACHE[path] = (stamp, spec)
+    return spec
+
+
+def clear_spec_cache():
+    _SPEC_CACHE.clear()
+
+
+def _read_data(path):
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise SpecError(path, "YAML 명세를 읽으려면 PyYAML 이 필요합니다 (pip install pyyaml)")
+        try:
+            return yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise SpecError(path, f"YAML 파싱 실패: {e}")
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        raise SpecError(path, f"JSON 파싱 실패: {e}")
+
+
+# 검증 / 변환 ------------------------------------------------------------
+
+def parse_spec(data, source="<spec>"):
+    """dict 형태 명세를 검증하고 DeckSpec 으로 변환"""
+    if not isinstance(data, dict):
+        raise SpecError(source, "최상위는 mapping 이어야 합니다")
+    _check_keys(data, source, {"colors", "themes", "slides", "variants"})
+    parser = _Parser(source)
+    parser.colors.update(_colors(data.get("colors", {}), "colors"))
+
+    themes = {}
+    for name, raw in _mapping(data.get("themes"), "themes").items():
+        themes[name] = parser.theme(raw, f"themes.{name}", name)
+    if not themes:
+        raise SpecError("themes", "테마가 하나 이상 필요합니다")
+
+    slides, by_id = [], {}
+    for i, raw in enumerate(_sequence(data.get("slides"), "slides")):
+        slide = parser.slide(raw, f"slides[{i}]")
+        if slide.id in by_id:
+            raise SpecError(f"slides[{i}].id", f"중복된 슬라이드 id '{slide.id}'")
+        by_id[slide.id] = slide
+        slides.append(slide)
+
+    variants = {}
+    for name, raw in _mapping(data.get("variants"), "variants").items():
+        variant = parser.variant(raw, f"variants.{name}", name)
+        if variant.theme not in themes:
+            raise SpecError(f"variants.{name}.theme", f"정의되지 않은 테마 '{variant.theme}'")
+        for slide_id in variant.slides:
+            if slide_id not in by_id:
+                raise SpecError(f"variants.{name}.slides", f"정의되지 않은 슬라이드 '{slide_id}'")
+        variants[name] = variant
+    if not variants:
+        raise SpecError("variants", "변형이 하나 이상 필요합니다")
+
+    base_dir = os.path.dirname(source) if os.path.isabs(source) else os.getcwd()
+    return DeckSpec(source, base_dir, themes, slides, variants, by_id)
+
+
+def _check_keys(raw, where, allowed):
+    unknown = set(raw) - set(allowed)
+    if unknown:
+        raise SpecError(where, f"알 수 없는 키 {sorted(unknown)}")
+
+
+def _mapping(raw, where):
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise SpecError(where, "mapping 이어야 합니다")
+    return raw
+
+
+def _sequence(raw, where):
+    if raw is None:
+        return []
+    if not isinstance(raw, list):
+        raise SpecError(where, "list 여야 합니다")
+    return raw
+
+
+def _colors(raw, where):
+    colors = {}
+    for name, value in _mapping(raw, where).items():
+        colors[name] = _parse_hex(value, f"{where}.{name}")
+    return colors
+
+
+def _parse_hex(value, where):
+    if isinstance(value, list) and len(value) == 3:
+        if all(isinstance(v, int) and not isinstance(v, bool) and 0 <= v <= 255 for v in value):
+            return RGBColor(*value)
+        raise SpecError(where, f"[r, g, b] 는 0-255 정수 세 개여야 합니다: {value!r}")
+    if isinstance(value, str) and value.startswith("#") and len(value) == 7:
+        try:
+            return RGBColor.from_string(value[1:].upper())
+        except ValueError:
+            pass
+    raise SpecError(where, f"색상은 '#RRGGBB' 또는 [r, g, b] 여야 합니다: {value!r}")
+
+
+class _Parser:
+    """명세 한 파일을 변환하는 동안 색상표를 들고 다니는 도우미"""
+
+    def __init__(self, source):
+        self.source = source
+        self.colors = dict(NAMED_COLORS)
+
+    # 스칼라 -------------------------------------------------------------
+
+    def color(self, value, where):
+        if isinstance(value, str) and value in self.colors:
+            return self.colors[value]
+        return _parse_hex(value, where)
+
+    @staticmethod
+    def number(value, where):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise SpecError(where, f"숫자여야 합니다: {value!r}")
+        return value
+
+    @staticmethod
+    def flag(value, where):
+        """true/false (null 은 지정하지 않은 것과 같음)"""
+        if value is not None and not isinstance(value, bool):
+            raise SpecError(where, f"true 또는 false 여야 합니다: {value!r}")
+        return value
+
+    @staticmethod
+    def string(value, where):
+        if not isinstance(value, str) or not value:
+            raise SpecError(where, f"문자열이 필요합니다: {value!r}")
+        return value
+
+    def positive(self, value, where):
+        if self.number(value, where) <= 0:
+            raise SpecError(where, f"0 보다 커야 합니다: {value!r}")
+        return value
+
+    def length(self, value, where):
+        return Inches(self.number(value, where))
+
+    def box(self, value, where, sizes=(4,)):
+        if not isinstance(value, list) or len(value) not in sizes:
+            raise SpecError(where, f"[{', '.join('xywh'[:max(sizes)])}] 형태(인치)여야 합니다")
+        return tuple(self.length(v, f"{where}[{i}]") for i, v in enumerate(value))
+
+    @staticmethod
+    def choice(value, table, where):
+        if value not in table:
+            raise SpecError(where, f"{sorted(table)} 중 하나여야 합니다: {value!r}")
+        return table[value]
+
+    # 스타일 ------------------------------------------------------------
+
+    def text_style(self, raw, where):
+        raw = _mapping(raw, where)
+        _check_keys(raw, where, {"size", "bold", "color", "align", "font", "line_spacing",
+                                 "space_after"})
+        return TextStyle(
+            size=Pt(self.number(raw["size"], f"{where}.size")) if "size" in raw else None,
+            bold=self.flag(raw["bold"], f"{where}.bold") if "bold" in raw else None,
+            color=self.color(raw["color"], f"{where}.color") if "color" in raw else None,
+            align=self.choice(raw["align"], _ALIGNS, f"{where}.align") if "align" in raw else None,
+            font=self.string(raw["font"], f"{where}.font") if "font" in raw else None,
+            line_spacing=self.positive(raw["line_spacing"], f"{where}.line_spacing")
+            if "line_spacing" in raw else None,
+            space_after=Pt(self.number(raw["space_after"], f"{where}.space_after"))
+            if "space_after" in raw else None,
+        )
+
+    def box_style(self, raw, where):
+        _check_keys(raw, where, {"fill", "line", "line_width", "margin_left", "margin_right",
+                                 "margin_top", "anchor", "word_wrap"})
+        line = raw.get("line")
+        if line is not None and line is not False:
+            line = self.color(line, f"{where}.line")
+        return BoxStyle(
+            fill=self.color(raw["fill"], f"{where}.fill") if "fill" in raw else None,
+            line=line,
+            line_width=Pt(self.number(raw["line_width"], f"{where}.line_width"))
+            if "line_width" in raw else None,
+            margin_left=self.length(raw["margin_left"], f"{where}.margin_left")
+            if "margin_left" in raw else None,
+            margin_right=self.length(raw["margin_right"], f"{where}.margin_right")
+            if "margin_right" in raw else None,
+            margin_top=self.length(raw["margin_top"], f"{where}.margin_top")
+            if "margin_top" in raw else None,
+            anchor=self.choice(raw["anchor"], _ANCHORS, f"{where}.anchor") if "anchor" in raw else None,
+            word_wrap=self.flag(raw["word_wrap"], f"{where}.word_wrap") if "word_wrap" in raw else None,
+        )
+
+    def theme(self, raw, where, name):
+        raw = _mapping(raw, where)
+        _check_keys(raw, where, {"header_color", "header_height", "header_line", "title",
+                                 "title_box", "title_in_band", "stack", "page", "page_box",
+                                 "content_box", "content_bottom", "overflow", "layout_index",
+                                 "slide_size", "clamp_to_slide"})
+        if "header_color" not in raw or "title" not in raw:
+            raise SpecError(where, "header_color 와 title 은 필수입니다")
+        stack_raw = _mapping(raw.get("stack"), f"{where}.stack")
+        _check_keys(stack_raw, f"{where}.stack", {"heading", "bullet", "item", "heading_height",
+                                                  "heading_step", "bullet_indent", "bullet_shrink",
+                                                  "bullet_height", "bullet_step", "item_height",
+                                                  "item_step", "bullet_mark"})
+        stack_kwargs = {}
+        for key in ("heading", "bullet", "item"):
+            stack_kwargs[key] = self.text_style(stack_raw.get(key), f"{where}.stack.{key}")
+        for key, value in stack_raw.items():
+            if key not in ("heading", "bullet", "item", "bullet_mark"):
+                stack_kwargs[key] = self.length(value, f"{where}.stack.{key}")
+        if "bullet_mark" in stack_raw:
+            stack_kwargs["bullet_mark"] = str(stack_raw["bullet_mark"])
+
+        kwargs = dict(
+            name=name,
+            header_color=self.color(raw["header_color"], f"{where}.header_color"),
+            title=self.text_style(raw["title"], f"{where}.title"),
+            stack=StackStyle(**stack_kwargs),
+            page=self.text_style(raw.get("page", {"size": 12, "color": "GRAY", "align": "right"}),
+                                 f"{where}.page"),
+        )
+        if "header_height" in raw:
+            kwargs["header_height"] = self.length(raw["header_height"], f"{where}.header_height")
+        if "header_line" in raw:
+            line = raw["header_line"]
+            kwargs["header_line"] = line if line is False else self.color(line, f"{where}.header_line")
+        if "title_box" in raw:
+            kwargs["title_box"] = self.box(raw["title_box"], f"{where}.title_box")
+        if "page_box" in raw:
+            kwargs["page_box"] = self.box(raw["page_box"], f"{where}.page_box")
+        if "content_box" in raw:
+            kwargs["content_box"] = self.box(raw["content_box"], f"{where}.content_box", sizes=(3,))
+        if "content_bottom" in raw:
+            kwargs["content_bottom"] = self.length(raw["content_bottom"], f"{where}.content_bottom")
+        if "overflow" in raw:
+            overflow = raw["overflow"]
+            if overflow not in (None, False, *OVERFLOW_POLICIES):
+                raise SpecError(f"{where}.overflow",
+                                f"{', '.join(OVERFLOW_POLICIES)} 또는 false 여야 합니다: {overflow!r}")
+            kwargs["overflow"] = overflow or None
+        if "slide_size" in raw:
+            kwargs["slide_width"], kwargs["slide_height"] = self.box(
+                raw["slide_size"], f"{where}.slide_size", sizes=(2,))
+        for key in ("title_in_band", "clamp_to_slide"):
+            if key in raw:
+                kwargs[key] = bool(raw[key])
+        if "layout_index" in raw:
+            kwargs["layout_index"] = int(self.number(raw["layout_index"], f"{where}.layout_index"))
+        return Theme(**kwargs)
+
+    # 슬라이드 ----------------------------------------------------------
+
+    def slide(self, raw, where):
+        raw = _mapping(raw, where)
+        _check_keys(raw, where, {"id", "tags", "title", "background", "layout", "image", "items",
+                                 "code", "table", "elements", "page_number"})
+        if not isinstance(raw.get("id"), str):
+            raise SpecError(f"{where}.id", "문자열 id 가 필요합니다")
+        where = f"{where}({raw['id']})"
+        kwargs = dict(id=raw["id"], tags=frozenset(_sequence(raw.get("tags"), f"{where}.tags")))
+        if "title" in raw:
+            kwargs["title"] = str(raw["title"])
+        if "background" in raw:
+            kwargs["background"] = self.color(raw["background"], f"{where}.background")
+        if "layout" in raw:
+            kwargs["layout"] = int(self.number(raw["layout"], f"{where}.layout"))
+        if "image" in raw:
+            kwargs["image"], kwargs["content_width"] = self.slide_image(raw["image"], f"{where}.image")
+        if "items" in raw:
+            kwargs["items"] = self.items(raw["items"], f"{where}.items")
+        if "code" in raw:
+            kwargs["code"] = str(raw["code"])
+        if "table" in raw:
+            kwargs["table"] = self.table(raw["table"], f"{where}.table")
+        if "elements" in raw:
+            kwargs["elements"] = tuple(self.element(e, f"{where}.elements[{i}]")
+                                       for i, e in enumerate(_sequence(raw["elements"], where)))
+        if "page_number" in raw:
+            kwargs["page_number"] = bool(raw["page_number"])
+        return SlideSpec(**kwargs)
+
+    def slide_image(self, raw, where):
+        if isinstance(raw, str):
+            raw = {"file": raw}
+        raw = _mapping(raw, where)
+        _check_keys(raw, where, {"file", "position", "box"})
+        if "file" not in raw:
+            raise SpecError(where, "file 이 필요합니다")
+        if "box" in raw:
+            box, content_width = self.box(raw["box"], f"{where}.box", sizes=(3, 4)), None
+        else:
+            box, content_width = self.choice(raw.get("position", "right"), IMAGE_POSITIONS,
+                                             f"{where}.position")
+        return Element(kind="picture", box=box, image=str(raw["file"])), content_width
+
+    def items(self, raw, where):
+        items = []
+        for i, item in enumerate(_sequence(raw, where)):
+            if isinstance(item, dict):
+                _check_keys(item, f"{where}[{i}]", {"heading", "bullets"})
+                normalized = {}
+                if "heading" in item:
+                    normalized["heading"] = str(item["heading"])
+                normalized["bullets"] = tuple(str(b) for b in
+                                              _sequence(item.get("bullets"), f"{where}[{i}].bullets"))
+                items.append(normalized)
+            elif isinstance(item, (str, int, float)):
+                items.append(str(item))
+            else:
+                raise SpecError(f"{where}[{i}]", "문자열 또는 {heading, bullets} 여야 합니다")
+        return tuple(items)
+
+    def table(self, raw, where):
+        raw = _mapping(raw, where)
+        _check_keys(raw, where, {"box", "rows", "header", "body", "header_fill", "columns"})
+        rows = _sequence(raw.get("rows"), f"{where}.rows")
+        if not rows or any(not isinstance(r, list) or len(r) != len(rows[0]) for r in rows):
+            raise SpecError(f"{where}.rows", "같은 길이의 행 목록이 필요합니다")
+        columns = tuple((self.column(k, len(rows[0]), f"{where}.columns.{k}"),
+                         self.text_style(v, f"{where}.columns.{k}"))
+                        for k, v in _mapping(raw.get("columns"), f"{where}.columns").items())
+        return Table(
+            box=self.box(raw.get("box"), f"{where}.box"),
+            rows=tuple(tuple(str(c) for c in r) for r in rows),
+            header=self.text_style(raw.get("header"), f"{where}.header"),
+            body=self.text_style(raw.get("body"), f"{where}.body"),
+            header_fill=self.color(raw["header_fill"], f"{where}.header_fill")
+            if "header_fill" in raw else None,
+            column_styles=columns,
+        )
+
+    @staticmethod
+    def column(key, count, where):
+        """columns 의 키 (0부터 시작하는 열 번호, YAML 에서 문자열 키여도 됨)"""
+        if isinstance(key, str) and key.strip().isdigit():
+            key = int(key)
+        if not isinstance(key, int) or isinstance(key, bool) or not 0 <= key < count:
+            raise SpecError(where, f"0-{count - 1} 사이의 열 번호여야 합니다: {key!r}")
+        return key
+
+    def element(self, raw, where):
+        raw = _mapping(raw, where)
+        if "picture" in raw:
+            _check_keys(raw, where, {"picture", "box"})
+            return Element(kind="picture", box=self.box(raw.get("box"), f"{where}.box", sizes=(3, 4)),
+                           image=str(raw["picture"]))
+        _check_keys(raw, where, {"shape", "box", "style", "text", "text_style", "style_all",
+                                 "paragraphs", "leading_blank"})
+        shape = raw.get("shape", "textbox")
+        if shape == "textbox":
+            kind = shape
+        else:
+            kind = getattr(MSO_SHAPE, str(shape).upper(), None)
+            if kind is None:
+                raise SpecError(f"{where}.shape", f"알 수 없는 도형 '{shape}'")
+        if "text" in raw:
+            paragraphs = split_lines(str(raw["text"]),
+                                     self.text_style(raw.get("text_style"), f"{where}.text_style"),
+                                     bool(raw.get("style_all", False)))
+        else:
+            paragraphs = []
+            for i, p in enumerate(_sequence(raw.get("paragraphs"), f"{where}.paragraphs")):
+                p = dict(_mapping(p, f"{where}.paragraphs[{i}]"))
+                text = str(p.pop("text", ""))
+                paragraphs.append((text, self.text_style(p, f"{where}.paragraphs[{i}]") if p else None))
+        return Element(
+            kind=kind,
+            box=self.box(raw.get("box"), f"{where}.box"),
+            style=self.box_style(_mapping(raw.get("style"), f"{where}.style"), f"{where}.style"),
+            paragraphs=tuple(paragraphs),
+            leading_blank=bool(raw.get("leading_blank", False)),
+        )
+
+    def variant(self, raw, where, name):
+        raw = _mapping(raw, where)
+        _check_keys(raw, where, {"theme", "output", "slides", "tags"})
+        for key in ("theme", "output"):
+            if not isinstance(raw.get(key), str):
+                raise SpecError(f"{where}.{key}", "문자열이 필요합니다")
+        if bool(raw.get("slides")) == bool(raw.get("tags")):
+            raise SpecError(where, "slides 와 tags 중 하나만 지정해야 합니다")
+        return Variant(
+            name=name,
+            theme=raw["theme"],
+            output=raw["output"],
+            slides=tuple(_sequence(raw.get("slides"), f"{where}.slides")),
+            tags=frozenset(_sequence(raw.get("tags"), f"{where}.tags")),
+        )
+
+
+# 컴파일 ------------------------------------------------------------------
+
+def compile_variant(spec, name, incremental=None, pool=None):
+    """변형 하나를 SlideBuilder 로 컴파일 (저장은 호출 측)
+
+    incremental(IncrementalBuild) 을 주면 입력이 그대로인 슬라이드는 이전 덱에서 복제한다.
+    pool(SlidePool) 을 주면 앞서 컴파일한 변형에 같은 슬라이드(테마, 내용, 쪽 번호가 같음)가
+    있을 때 다시 만들지 않고 복제하며, 새로 만든 슬라이드는 pool 에 넣는다.
+    """
+    variant = spec.variants[name]
+    theme = spec.themes[variant.theme]
+    deck = SlideBuilder(theme)
+    for number, slide_spec in enumerate(spec.select(variant), start=1):
+        if incremental is None and pool is None:
+            _compile_slide(deck, spec, slide_spec, number)
+            continue
+        key = slide_key(theme, replace(slide_spec, tags=frozenset()), number,
+                        files=_slide_images(spec, slide_spec))
+        if incremental is None:
+            _pooled_slide(pool, key, deck, spec, slide_spec, number)
+        elif pool is None:
+            incremental.slide(deck, key, _compile_slide, deck, spec, slide_spec, number)
+        else:
+            incremental.slide(deck, key, _pooled_slide, pool, key, deck, spec, slide_spec, number)
+    return deck
+
+
+def build_variants(spec, out_dir=None, names=None, incremental=False):
+    """변형들을 컴파일해 저장하고 [(변형 이름, 출력 경로, 소요 초, 재사용 슬라이드 수)] 반환
+
+    변형끼리 같은 슬라이드는 처음 컴파일한 변형에서 복제한다 (재사용 수에 포함).
+    """
+    pool = SlidePool()
+    results = []
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    for name in names or spec.variants:
+        if name not in spec.variants:
+            raise SpecError("variants", f"정의되지 않은 변형 '{name}'")
+        output = spec.variants[name].output
+        path = os.path.join(out_dir, os.path.basename(output)) if out_dir else \
+            os.path.join(spec.base_dir, output)
+        start = time.perf_counter()
+        cloned = pool.cloned
+        if incremental:
+            build = IncrementalBuild(path)
+            build.save(compile_variant(spec, name, build, pool).prs)
+            reused = build.reused
+        else:
+            compile_variant(spec, name, pool=pool).save(path)
+            reused = 0
+        reused += pool.cloned - cloned
+        results.append((name, path, time.perf_counter() - start, reused))
+    return results
+
+
+def _pooled_slide(pool, key, deck, spec, slide_spec, number):
+    slide = pool.clone(key, deck.prs)
+    if slide is None:
+        slide = pool.add(key, _compile_slide(deck, spec, slide_spec, number))
+    return slide
+
+
+def _slide_images(spec, slide_spec):
+    images = [slide_spec.image] if slide_spec.image is not None else []
+    images += [e for e in slide_spec.elements if e.kind == "picture"]
+    return [_image_path(spec, e.image) for e in images]
+
+
+def _compile_slide(deck, spec, slide_spec, number):
+    theme = deck.theme
+    if slide_spec.title is not None:
+        slide = deck.content_slide(slide_spec.title, background=slide_spec.background)
+    else:
+        slide = deck.new_slide(slide_spec.layout, background=slide_spec.background)
+
+    left, top, content_width = theme.content_box
+    if slide_spec.code is not None:
+        # 코드 예제는 오른쪽 절반을 차지
+        content_width = Inches(7)
+    if slide_spec.image is not None and _add_picture(deck, spec, slide, slide_spec.image):
+        content_width = slide_spec.content_width
+    if slide_spec.items and content_width is not None:
+        deck.bullet_stack(slide, slide_spec.items, left, top, content_width)
+    if slide_spec.code is not None:
+        deck.shape(slide, MSO_SHAPE.RECTANGLE, Inches(8.5), Inches(1.8), Inches(7), Inches(5.5),
+                   BoxStyle(fill=RGBColor(245, 245, 245)))
+        deck.text(slide, slide_spec.code, Inches(8.7), Inches(2), Inches(6.6), Inches(5),
+                  TextStyle(size=Pt(12), color=RGBColor(0, 0, 0), font="Consolas"))
+    if slide_spec.table is not None:
+        _add_table(slide, slide_spec.table)
+    for element in slide_spec.elements:
+        if element.kind == "picture":
+            _add_picture(deck, spec, slide, element)
+        else:
+            deck.shape(slide, element.kind, *element.box, element.style, element.paragraphs,
+                       element.leading_blank)
+    if slide_spec.page_number and number > 1:
+        deck.page_number(slide, number)
+    return slide
+
+
+def _add_picture(deck, spec, slide, element):
+    """이미지 추가 (파일이 없거나 읽을 수 없으면 건너뛰고 False 반환)"""
+    path = _image_path(spec, element.image)
+    if not os.path.exists(path):
+        return False
+    left, top, width = element.box[:3]
+    height = element.box[3] if len(element.box) == 4 else None
+    try:
+        deck.picture(slide, path, left, top, width=width, height=height)
+    except UnsupportedImageError:
+        return False
+    return True
+
+
+def _image_path(spec, path):
+    return path if os.path.isabs(path) else os.path.join(spec.base_dir, path)
+
+
+def _add_table(slide, table):
+    left, top, width, height = table.box
+    rows, cols = len(table.rows), len(table.rows[0])
+    grid = slide.shapes.add_table(rows, cols, left, top, width, height).table
+    column_styles = dict(table.column_styles)
+    for i, row in enumerate(table.rows):
+        for j, value in enumerate(row):
+            cell = grid.cell(i, j)
+            cell.text = value
+            if i == 0:
+                if table.header_fill is not None:
+                    cell.fill.solid()
+                    cell.fill.fore_color.rgb = table.header_fill
+                style = table.header
+            else:
+                style = column_styles.get(j, table.body)
+            apply_text_style(cell.text_frame.paragraphs[0], style)
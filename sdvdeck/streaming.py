@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 저장 (끝난 슬라이드를 바로 zip 에 쓰고 메모리에서 내림)
+
+prs.save() 는 마지막에 한 번에 직렬화하므로 저장 직전에는 모든 슬라이드의 lxml
+트리와 이미지 내용이 함께 메모리에 있다. StreamingWriter 는 flush() 할 때마다
+끝난 슬라이드와 그 슬라이드만 쓰는 파트(노트, 이미지, 미디어, 차트 ...)를 바로
+압축해 쓰고 (zipwriter 의 파트별 압축 방식), 패키지 안의 파트를 이름/콘텐츠 형식만 가진 WrittenPart 로 바꾼다.
+close() 는 남은 파트(마스터, 레이아웃, 테마 ...)와 [Content_Types].xml,
+패키지 관계를 쓴다. 최대 메모리는 flush 사이에 만든 슬라이드 몇 장 수준이다.
+
+    writer = StreamingWriter(prs, "out.pptx")
+    for api in apis:
+        slide = ...
+        writer.flush(slide)
+    writer.close()
+
+쓴 슬라이드는 다시 열 수 없고 (prs.slides[i] 는 ValueError), 저장 시 슬라이드
+파트 이름을 sldIdLst 순서로 다시 매기지 않는다 (덧붙인 순서 그대로).
+"""
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import Part
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.parts.image import ImagePart
+
+from sdvdeck.fastpackage import image_index, retarget
+from sdvdeck.zipwriter import PartZip
+
+# 슬라이드끼리 공유하는 파트로 가는 관계 (flush 에서 따라가지 않음)
+_SHARED_RELTYPES = frozenset((
+    RT.SLIDE, RT.SLIDE_LAYOUT, RT.SLIDE_MASTER, RT.NOTES_MASTER, RT.HANDOUT_MASTER, RT.THEME,
+))
+
+
+class WrittenPart(Part):
+    """이미 zip 에 쓴 파트 자리 (이름과 콘텐츠 형식만 남김, 관계 없음)"""
+
+    def __init__(self, part):
+        super().__init__(part.partname, part.content_type, part.package)
+
+    @property
+    def blob(self):
+        raise ValueError(f"이미 저장한 파트: {self.partname}")
+
+    @property
+    def slide(self):
+        raise ValueError(f"이미 저장한 슬라이드: {self.partname}")
+
+
+class WrittenImagePart(ImagePart):
+    """이미 쓴 이미지 (같은 이미지를 다시 넣을 때 재사용할 sha1, 크기 정보만 남김)"""
+
+    def __init__(self, part):
+        super().__init__(part.partname, part.content_type, part.package, None, part._filename)
+        self.__dict__["sha1"] = part.sha1
+        try:
+            self._written_px_size = part._px_size
+            self._written_dpi = part._dpi
+        except OSError:
+            # PIL 이 못 읽는 형식(HD Photo 등, 레이아웃 효과용)은 add_picture 로 다시 넣을 일이 없음
+            self._written_px_size = self._written_dpi = None
+
+    @property
+    def blob(self):
+        raise ValueError(f"이미 저장한 파트: {self.partname}")
+
+    @property
+    def _px_size(self):
+        return self._written_px_size
+
+    @property
+    def _dpi(self):
+        return self._written_dpi
+
+
+class StreamingWriter:
+    """prs 를 path 에 나눠 쓰는 저장기 (flush 로 슬라이드를 쓰고 close 로 마무리)
+
+    check_slide(번호, 슬라이드) 를 주면 슬라이드를 쓰기 전에 부른다 (검사 실패 시 예외).
+    """
+
+    def __init__(self, prs, path, check_slide=None):
+        self.prs = prs
+        self.path = path
+        self.check_slide = check_slide
+        self.written = {}               # 파트 이름 -> WrittenPart
+        self._flushed = 0               # sldIdLst 에서 쓴 슬라이드 수
+        self._zip = PartZip(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def flush(self, slide=None):
+        """slide 까지 (없으면 지금까지 만든 모든) 슬라이드를 씀"""
+        pres_part = self.prs.part
+        # 아직 쓰지 않은 슬라이드만 훑음 (앞쪽은 이미 WrittenPart)
+        pending = [(sldId.rId, pres_part.related_part(sldId.rId))
+                   for sldId in self.prs.slides._sldIdLst[self._flushed:]]
+        if slide is not None:
+            parts = [part for _, part in pending]
+            if slide.part not in parts:
+                return                  # 이미 쓴 슬라이드
+            pending = pending[:parts.index(slide.part) + 1]
+        for rId, slide_part in pending:
+            self._flushed += 1
+            if self.check_slide is not None:
+                self.check_slide(self._flushed, slide_part.slide)
+            self._write_tree(slide_part)
+            retarget(pres_part.rels, rId, self.written[slide_part.partname])
+
+    def close(self):
+        """남은 슬라이드와 공유 파트, 콘텐츠 형식, 패키지 관계를 쓰고 파일을 닫음"""
+        if self._zip is None:
+            return
+        self.flush()
+        package = self.prs.part.package
+        for part in list(package.iter_parts()):
+            if part.partname not in self.written:
+                self._write(part)
+        parts = list(self.written.values())
+        self._zip.writestr(CONTENT_TYPES_URI.membername,
+                           serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        self._zip.close()
+        self._zip = None
+
+    def _write_tree(self, part):
+        """part 와, 공유 파트가 아닌 관계로 닿는 파트들을 씀"""
+        pending = [part]
+        while pending:
+            part = pending.pop()
+            if part.partname in self.written:
+                continue
+            for rel in part.rels.values():
+                if not rel.is_external and rel.reltype not in _SHARED_RELTYPES:
+                    pending.append(rel.target_part)
+            self._write(part)
+
+    def _write(self, part):
+        self._zip.writestr(part.partname.membername, part.blob)
+        if part.rels:
+            self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        if isinstance(part, ImagePart):
+            written = WrittenImagePart(part)
+            # 같은 이미지를 다시 넣으면 쓴 자리를 재사용
+            index = image_index(part.package)
+            if index.by_sha1.get(written.sha1) is part:
+                index.by_sha1[written.sha1] = written
+        else:
+            written = WrittenPart(part)
+        self.written[part.partname] = written
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+한중일 문자를 고려한 텍스트 맞춤 (TextFrame.fit_text 대체)
+
+python-pptx 의 TextFitter 는 공백에서만 줄을 나누고, 이분 탐색의 후보 줄마다
+PIL 로 문자열 전체를 다시 그려 너비를 잰다. 공백 없는 중국어 문장은 한 줄로
+취급되고, 글자 수가 많으면 PIL 호출이 수천 번이 된다. 여기서는
+
+- UAX #14 의 주요 규칙으로 줄바꿈 가능 위치를 구하고 (한자/가나/한글 사이,
+  공백 뒤, 여는 괄호 뒤 금지, 닫는 괄호/마침표 앞 금지, 영문/숫자 단어 유지)
+- 글자별 advance 너비를 (글꼴 파일, 크기)마다 한 번만 재어 두고
+- 누적 합(prefix sum)과 이분 탐색으로 줄을 채운다.
+
+문단 구분(\\n, \\v)은 강제 줄바꿈으로 처리한다 (원래 구현은 공백으로 합쳐 버림).
+install() 은 여러 번 불러도 한 번만 적용된다.
+"""
+
+import unicodedata
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
+from PIL import ImageFont
+from pptx.text.layout import TextFitter
+
+EMU_PER_POINT = 12700
+
+# 줄바꿈 분류 (UAX #14 의 일부)
+BK, SP, ZW, GL, CM = "BK", "SP", "ZW", "GL", "CM"
+OP, CL, CP, EX, IS, NS, QU = "OP", "CL", "CP", "EX", "IS", "NS", "QU"
+BA, HY, ID, NU, AL = "BA", "HY", "ID", "NU", "AL"
+
+_FIXED_CLASSES = {
+    "\n": BK, "\r": BK, "\v": BK, "\f": BK, "\x85": BK, "\u2028": BK, "\u2029": BK,
+    " ": SP, "\t": SP,
+    "\u200b": ZW,
+    "\u00a0": GL, "\u202f": GL, "\u2007": GL, "\u2060": GL, "\ufeff": GL,
+    ")": CP, "]": CP,
+    "!": EX, "?": EX, "！": EX, "？": EX,
+    ",": IS, ".": IS, ":": IS, ";": IS, "/": IS,
+    "、": CL, "。": CL, "，": CL, "．": CL, "｡": CL, "､": CL,
+    "：": NS, "；": NS, "・": NS, "ー": NS, "々": NS, "〻": NS,
+    "ゝ": NS, "ゞ": NS, "ヽ": NS, "ヾ": NS,
+    "\"": QU, "'": QU,
+    "-": HY, "\u00ad": BA, "\u2010": BA, "\u2013": BA, "|": BA,
+}
+# 작은 가나 (앞에서 끊지 않음)
+_FIXED_CLASSES.update((ch, NS) for ch in "ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶ")
+
+_IDEOGRAPHIC_RANGES = (
+    (0x1100, 0x11FF),       # 한글 자모
+    (0x2E80, 0x2FDF),       # 한자 부수
+    (0x3000, 0x303F),       # CJK 기호 (위에서 따로 분류한 것 제외)
+    (0x3040, 0x30FF),       # 히라가나, 가타카나
+    (0x3130, 0x318F),       # 한글 호환 자모
+    (0x3400, 0x4DBF),       # CJK 확장 A
+    (0x4E00, 0x9FFF),       # CJK 통합 한자
+    (0xAC00, 0xD7A3),       # 한글 음절
+    (0xF900, 0xFAFF),       # CJK 호환 한자
+    (0xFF01, 0xFF60),       # 전각 문자
+    (0x20000, 0x3FFFD),     # CJK 확장 B 이후
+)
+
+_CLASS_CACHE = {}
+
+
+def line_break_class(ch):
+    cls = _CLASS_CACHE.get(ch)
+    if cls is not None:
+        return cls
+    cls = _FIXED_CLASSES.get(ch)
+    if cls is None:
+        category = unicodedata.category(ch)
+        code = ord(ch)
+        if category == "Ps":
+            cls = OP
+        elif category == "Pe":
+            cls = CL
+        elif category in ("Pi", "Pf"):
+            cls = QU
+        elif category in ("Mn", "Mc", "Me"):
+            cls = CM
+        elif category == "Nd":
+            cls = NU
+        elif any(low <= code <= high for low, high in _IDEOGRAPHIC_RANGES):
+            cls = ID
+        else:
+            cls = AL
+    _CLASS_CACHE[ch] = cls
+    return cls
+
+
+def break_opportunities(text):
+    """줄바꿈 가능 위치 [(i, 강제 여부)]: text[i] 앞에서 끊을 수 있음 (끝 위치 포함)"""
+    classes = [line_break_class(ch) for ch in text]
+    result = []
+    before = None                   # 공백을 건너뛴 직전 글자의 분류
+    for i in range(1, len(text)):
+        prev, cls = classes[i - 1], classes[i]
+        if prev != SP:
+            before = prev
+        if prev == BK:
+            if not (text[i - 1] == "\r" and text[i] == "\n"):
+                result.append((i, True))
+            continue
+        if cls in (BK, SP, ZW, CM):
+            continue
+        if before == ZW:
+            result.append((i, False))
+            continue
+        if prev == GL or cls == GL or cls in (CL, CP, EX, IS):
+            continue
+        if before == OP:
+            continue
+        if prev == SP:
+            result.append((i, False))
+            continue
+        if cls in (QU, BA, HY, NS) or before == QU:
+            continue
+        if before in (AL, NU, IS, CP) and cls in (AL, NU, OP):
+            continue
+        if before in (HY, BA) and cls == NU:
+            continue
+        result.append((i, False))
+    result.append((len(text), True))
+    return result
+
+
+# 글꼴 파일이 없을 때의 글자 너비 (em 비율): 전각은 1, 공백은 좁게, 나머지는 평균 라틴 글자
+_ESTIMATED_EM = {ID: 1.0, SP: 0.28, CM: 0.0}
+_LATIN_EM = 0.55
+
+
+def estimated_width(ch, point_size):
+    return _ESTIMATED_EM.get(line_break_class(ch), _LATIN_EM) * point_size
+
+
+class GlyphWidths:
+    """(글꼴 파일, 포인트 크기)별 글자 advance 너비 표 (픽셀 = 포인트)"""
+
+    _tables = {}
+    _fonts = {}
+
+    @classmethod
+    def table(cls, font_file, point_size):
+        key = (font_file, point_size)
+        table = cls._tables.get(key)
+        if table is None:
+            table = cls._tables[key] = {}
+        return table
+
+    @classmethod
+    def font(cls, font_file, point_size):
+        key = (font_file, point_size)
+        font = cls._fonts.get(key)
+        if font is None:
+            font = cls._fonts[key] = ImageFont.truetype(font_file, point_size)
+        return font
+
+    @classmethod
+    def widths(cls, text, font_file, point_size):
+        """글자별 너비 (font_file 이 None 이면 글꼴 없이 em 비율로 추정)"""
+        table = cls.table(font_file, point_size)
+        missing = set(text).difference(table)
+        if missing:
+            font = None if font_file is None else cls.font(font_file, point_size)
+            for ch in missing:
+                if line_break_class(ch) == BK:
+                    table[ch] = 0.0
+                elif font is None:
+                    table[ch] = estimated_width(ch, point_size)
+                else:
+                    table[ch] = font.getlength(ch)
+        return [table[ch] for ch in text]
+
+    @classmethod
+    def line_height(cls, font_file, point_size):
+        """원래 TextFitter 와 같은 기준 ("Ty" 높이)"""
+        table = cls.table(font_file, point_size)
+        height = table.get(None)
+        if height is None:
+            left, top, right, bottom = cls.font(font_file, point_size).getbbox("Ty")
+            height = table[None] = bottom - top
+        return height
+
+
+class TextMeasure:
+    """텍스트 하나의 줄바꿈 위치를 한 번 구해 두고 크기별로 줄 수/줄 목록을 계산"""
+
+    def __init__(self, text, font_file):
+        self.text = text
+        self.font_file = font_file
+        self.breaks = break_opportunities(text) if text else [(0, True)]
+        self._positions = [pos for pos, _ in self.breaks]
+        self._classes = [line_break_class(ch) for ch in text]
+        self._sums = {}
+
+    def prefix_sums(self, point_size):
+        sums = self._sums.get(point_size)
+        if sums is None:
+            widths = GlyphWidths.widths(self.text, self.font_file, point_size)
+            sums = self._sums[point_size] = [0.0, *accumulate(widths)]
+        return sums
+
+    def lines(self, width, point_size):
+        """width(EMU) 안에 들어가도록 나눈 [(시작, 끝)] (끝의 공백/줄바꿈 제외)"""
+        limit = width / EMU_PER_POINT
+        sums = self.prefix_sums(point_size)
+        positions = self._positions
+        result = []
+        start, k = 0, 0
+        while k < len(self.breaks):
+            # 다음 강제 줄바꿈까지의 후보 중 끝 공백을 뺀 너비가 limit 이하인 마지막 것
+            hard = k
+            while not self.breaks[hard][1]:
+                hard += 1
+            base = sums[start]
+            j = bisect_right(positions, 0, k, hard + 1,
+                             key=lambda pos: 0 if sums[self._trim(start, pos)] - base <= limit else 1)
+            if j == k:
+                end = self._emergency_break(sums, start, positions[k], limit)
+            else:
+                end = positions[j - 1]
+            result.append((start, self._trim(start, end)))
+            start = end
+            while start < len(self.text) and self._classes[start] == SP:
+                start += 1
+            k = bisect_right(positions, start)
+            if start >= len(self.text):
+                break
+        return result or [(0, 0)]
+
+    def wrap(self, width, point_size):
+        return [self.text[start:end] for start, end in self.lines(width, point_size)]
+
+    def fits(self, extents, point_size):
+        width, height = extents
+        line_height = GlyphWidths.line_height(self.font_file, point_size) * EMU_PER_POINT
+        return len(self.lines(width, point_size)) * line_height <= height
+
+    def best_fit_font_size(self, extents, max_size):
+        """max_size 이하에서 extents 에 들어가는 가장 큰 정수 크기 (없으면 None)"""
+        low, high, best = 1, int(max_size), None
+        while low <= high:
+            mid = (low + high) // 2
+            if self.fits(extents, mid):
+                best, low = mid, mid + 1
+            else:
+                high = mid - 1
+        return best
+
+    def _trim(self, start, end):
+        while end > start and self._classes[end - 1] in (SP, BK):
+            end -= 1
+        return end
+
+    def _emergency_break(self, sums, start, end, limit):
+        """한 단어가 줄보다 길면 글자 단위로 자름 (최소 한 글자)"""
+        pos = bisect_right(sums, sums[start] + limit, start + 1, end + 1) - 1
+        return max(pos, start + 1)
+
+
+@lru_cache(maxsize=256)
+def text_measure(text, font_file):
+    """같은 텍스트를 다시 맞출 때 줄바꿈 위치/누적 합 재사용"""
+    return TextMeasure(text, font_file)
+
+
+def best_fit_font_size(text, extents, max_size, font_file):
+    """TextFitter.best_fit_font_size 와 같은 인자/결과"""
+    return text_measure(text, font_file).best_fit_font_size(extents, max_size)
+
+
+def _best_fit_font_size(cls, text, extents, max_size, font_file):
+    return best_fit_font_size(text, extents, max_size, font_file)
+
+
+def install():
+    if getattr(TextFitter, "_sdvdeck_cjk", False):
+        return
+    TextFitter.best_fit_font_size = classmethod(_best_fit_font_size)
+    TextFitter._sdvdeck_cjk = True
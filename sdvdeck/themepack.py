@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+템플릿 테마 팩 캐시
+
+KETI 템플릿처럼 마스터/레이아웃만 쓰려고 여는 .pptx 도 매번 슬라이드, 노트, 미디어까지
+읽고 관계를 풀어야 한다. 여기서는 템플릿에서 슬라이드, 노트/유인물 마스터, 미리보기
+그림을 걷어낸 "테마 팩"(슬라이드 마스터, 레이아웃, 테마, 포함 글꼴만 남은 .pptx)을
+한 번 만들어 두고 그 뒤로는 팩만 연다.
+
+    .sdvdeck/theme-packs/<sha1>.pptx
+
+키는 sha1(PACK_VERSION + 템플릿 내용) 이라 템플릿이 바뀌면 새 팩을 만들고, 같은
+프로세스에서는 팩 내용을 메모리에 두어 디스크도 다시 읽지 않는다.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from sdvdeck.probe import file_sha1
+from sdvdeck.slides import delete_slides
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            ".sdvdeck", "theme-packs")
+
+# 팩에 남기는 내용이 바뀌면 올려서 이전 팩을 무효화
+PACK_VERSION = 1
+
+# 테마 팩에서 빼는 마스터 (p:presentation 의 목록 요소, 관계 종류)
+_DROPPED_MASTERS = (
+    ("p:notesMasterIdLst", RT.NOTES_MASTER),
+    ("p:handoutMasterIdLst", RT.HANDOUT_MASTER),
+)
+
+# sha1 -> 팩 내용
+_PACKS = {}
+
+
+def pack_key(template_path):
+    text = f"{PACK_VERSION}:{file_sha1(template_path)}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def pack_path(template_path, root=DEFAULT_ROOT):
+    return os.path.join(root, pack_key(template_path) + ".pptx")
+
+
+def make_theme_pack(template_path):
+    """템플릿에서 마스터/레이아웃/테마/글꼴만 남긴 .pptx 내용"""
+    prs = Presentation(template_path)
+    delete_slides(prs)
+    pres_part = prs.part
+    pres = pres_part._element
+    for tag, reltype in _DROPPED_MASTERS:
+        for id_list in pres.xpath(f"./{tag}"):
+            pres.remove(id_list)
+        _drop_rels(pres_part.rels, reltype)
+    _drop_rels(pres_part.package._rels, RT.THUMBNAIL)
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def load_theme_pack(template_path, root=DEFAULT_ROOT):
+    """템플릿의 테마 팩으로 연 Presentation (슬라이드 없음)"""
+    return Presentation(io.BytesIO(theme_pack(template_path, root)))
+
+
+def theme_pack(template_path, root=DEFAULT_ROOT):
+    """테마 팩 내용 (메모리 -> 디스크 -> 새로 만들기 순)"""
+    key = pack_key(template_path)
+    blob = _PACKS.get(key)
+    if blob is not None:
+        return blob
+    path = os.path.join(root, key + ".pptx")
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+    except OSError:
+        blob = make_theme_pack(template_path)
+        _write(path, blob)
+    _PACKS[key] = blob
+    return blob
+
+
+def clear_theme_packs(root=DEFAULT_ROOT):
+    """메모리와 디스크의 테마 팩을 모두 지움"""
+    _PACKS.clear()
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return
+    for name in names:
+        if name.endswith(".pptx"):
+            try:
+                os.remove(os.path.join(root, name))
+            except OSError:
+                pass
+
+
+def _drop_rels(rels, reltype):
+    for rId, rel in list(rels.items()):
+        if rel.reltype == reltype:
+            rels.pop(rId)
+
+
+def _write(path, blob):
+    folder = os.path.dirname(path)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+    except OSError:
+        pass                            # 팩을 못 써도 이번 실행에는 지장 없음
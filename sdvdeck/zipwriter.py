@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+파트별 압축 방식과 여러 스레드 DEFLATE 로 쓰는 .pptx zip
+
+python-pptx 의 _ZipPkgWriter 는 모든 파트를 ZIP_DEFLATED 로 쓰므로 이미 압축된
+JPEG/PNG/동영상까지 다시 deflate 하느라 CPU 를 쓴다 (크기는 거의 줄지 않음).
+여기서는
+
+- 확장자가 STORED_EXTENSIONS 인 파트는 ZIP_STORED 로, 나머지(XML 등)는 DEFLATE 로 쓰고
+- threads 가 2 이상이면 DEFLATE 를 스레드 풀에서 미리 해 두고 (zlib 은 GIL 을 놓음)
+  넣은 순서대로 zip 에 붙인다. 압축 결과는 한 스레드로 쓸 때와 같다.
+  미리 압축한 내용은 zipfile._ZipWriteFile 의 압축기를 바꿔 끼워 쓰는데, 이는 CPython
+  구현 세부라 처음 쓸 때 작은 zip 으로 왕복 확인하고, 안 되면 한 스레드 writestr 로 쓴다.
+
+build -j 처럼 프로세스를 여럿 띄울 때는 CPU 가 이미 차 있으므로 기본은 1 스레드다.
+install() 은 여러 번 불러도 한 번만 적용된다.
+"""
+
+import io
+import os
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from pptx.opc.serialized import _ZipPkgWriter
+from pptx.util import lazyproperty
+
+from sdvdeck import reproducible
+
+# 다시 압축해도 거의 줄지 않는 형식
+STORED_EXTENSIONS = frozenset((
+    "jpg", "jpeg", "png", "gif", "webp", "wdp", "jxr", "emz", "wmz",
+    "mp3", "m4a", "wma", "mp4", "m4v", "mov", "wmv", "avi",
+    "xlsx", "docx", "pptx", "zip",
+))
+
+# 이보다 작은 파트는 스레드로 넘기는 비용이 더 큼
+PARALLEL_MIN_BYTES = 16 * 1024
+
+DEFAULT_THREADS = 1
+
+
+def set_threads(threads):
+    """이후 저장에 쓸 DEFLATE 스레드 수 (None 이면 CPU 수)"""
+    global DEFAULT_THREADS
+    DEFAULT_THREADS = threads or os.cpu_count() or 1
+
+
+def compress_type(membername):
+    ext = membername.rsplit(".", 1)[-1].lower() if "." in membername else ""
+    return zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+def deflate(data):
+    """ZipFile 이 ZIP_DEFLATED 로 쓸 때와 같은 raw deflate 스트림"""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _Deflated:
+    """미리 압축한 내용을 돌려주는 압축기 (_ZipWriteFile 의 압축기 자리에 끼움)"""
+
+    def __init__(self, compressed):
+        self.compressed = compressed
+
+    def compress(self, data):
+        compressed, self.compressed = self.compressed, b""
+        return compressed
+
+    def flush(self):
+        return b""
+
+
+_PRECOMPRESSED_OK = None
+
+
+def precompressed_supported():
+    """이 파이썬의 zipfile 에서 미리 압축한 내용을 끼워 쓸 수 있는지 (한 번만 확인)"""
+    global _PRECOMPRESSED_OK
+    if _PRECOMPRESSED_OK is None:
+        _PRECOMPRESSED_OK = _check_precompressed()
+    return _PRECOMPRESSED_OK
+
+
+def _check_precompressed():
+    data = b"<sdvdeck/>" * 1000
+    buf = io.BytesIO()
+    try:
+        with zipfile.ZipFile(buf, "w") as z:
+            zinfo = zipfile.ZipInfo("check.xml")
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            zinfo.file_size = len(data)
+            with z.open(zinfo, mode="w") as dest:
+                if not hasattr(dest, "_compressor"):
+                    return False
+                dest._compressor = _Deflated(deflate(data))
+                dest.write(data)
+        with zipfile.ZipFile(buf) as z:
+            info = z.getinfo("check.xml")
+            return z.read(info) == data and info.compress_size < len(data)
+    except (AttributeError, TypeError, ValueError, zipfile.BadZipFile, zlib.error):
+        return False
+
+
+class PartZip:
+    """ZipFile.writestr/close 와 같은 모양으로 쓰는 .pptx zip"""
+
+    def __init__(self, file, threads=None):
+        self.zip = zipfile.ZipFile(file, "w", compression=zipfile.ZIP_DEFLATED,
+                                   strict_timestamps=False)
+        threads = DEFAULT_THREADS if threads is None else threads
+        if threads > 1 and not precompressed_supported():
+            threads = 1
+        self._pool = ThreadPoolExecutor(threads) if threads > 1 else None
+        # 순서를 지키려고 앞 항목이 끝날 때까지 뒤 항목도 기다림 (최대 _limit 개)
+        self._pending = deque()
+        self._limit = 4 * threads
+
+    def writestr(self, membername, data):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        method = compress_type(membername)
+        future = None
+        if self._pool is not None and method == zipfile.ZIP_DEFLATED \
+                and len(data) >= PARALLEL_MIN_BYTES:
+            future = self._pool.submit(deflate, data)
+        self._pending.append((membername, data, method, future))
+        self._drain(block=False)
+
+    def close(self):
+        self._drain(block=True)
+        if self._pool is not None:
+            self._pool.shutdown()
+        self.zip.close()
+
+    def _drain(self, block):
+        pending = self._pending
+        while pending:
+            future = pending[0][3]
+            if future is not None and not future.done() and not block \
+                    and len(pending) <= self._limit:
+                return
+            membername, data, method, future = pending.popleft()
+            self._write(membername, data, method, None if future is None else future.result())
+
+    def _write(self, membername, data, method, compressed):
+        zinfo = zipfile.ZipInfo(membername, date_time=reproducible.zip_date_time())
+        zinfo.compress_type = method
+        if reproducible.enabled():
+            zinfo.create_system = reproducible.CREATE_SYSTEM
+        zinfo.external_attr = 0o600 << 16
+        if compressed is None:
+            self.zip.writestr(zinfo, data)
+            return
+        zinfo.file_size = len(data)
+        with self.zip.open(zinfo, mode="w") as dest:
+            dest._compressor = _Deflated(compressed)
+            dest.write(data)
+
+
+def _zipf(self):
+    return PartZip(self._pkg_file)
+
+
+def install():
+    if getattr(_ZipPkgWriter, "_sdvdeck_zip", False):
+        return
+    # _ZipPkgWriter.write/__exit__ 는 self._zipf.writestr()/close() 만 부름
+    _ZipPkgWriter._zipf = lazyproperty(_zipf)
+    _ZipPkgWriter._sdvdeck_zip = True
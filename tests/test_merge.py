@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""sdvdeck.merge: 덱 합치기/나누기 (저장소의 .pptx 를 입력으로 씀)"""
+
+import collections
+import hashlib
+import os
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from sdvdeck.merge import merge_decks, split_deck
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DETAILED = os.path.join(ROOT, "China_SDV_Standard_Detailed_Analysis_2025.pptx")
+KETI_STYLE = os.path.join(ROOT, "China_SDV_Standard_KETI_Style_25pages.pptx")
+KETI = os.path.join(ROOT, "중국SDV표준 소개_KETI 박부식.pptx")
+
+
+def _slide_count(path):
+    return len(Presentation(path).slides)
+
+
+def _check_package(path):
+    """zip 이름이 겹치지 않고, 미디어는 내용당 하나이며, 다시 열리는지"""
+    with zipfile.ZipFile(path) as z:
+        names = z.namelist()
+        assert [n for n, c in collections.Counter(names).items() if c > 1] == []
+        media = [n for n in names if n.startswith("ppt/media/")]
+        digests = {hashlib.sha1(z.read(n)).hexdigest() for n in media}
+        assert len(digests) == len(media)
+        assert z.testzip() is None
+        content_types = z.read("[Content_Types].xml").decode("utf-8")
+    return Presentation(path), media, content_types
+
+
+def test_merge_with_keti_deck_second(tmp_path):
+    """KETI 템플릿(HD Photo 이미지가 있는 마스터) 덱을 뒤에 붙여도 합쳐짐"""
+    output = str(tmp_path / "merged.pptx")
+    count = merge_decks([(DETAILED, None), (KETI_STYLE, None), (KETI, None)], output)
+
+    assert count == _slide_count(DETAILED) + _slide_count(KETI_STYLE) + _slide_count(KETI)
+    prs, media, content_types = _check_package(output)
+    assert len(prs.slides) == count
+    assert any(name.endswith(".wdp") for name in media)
+    assert 'Extension="wdp"' in content_types
+
+
+def test_merge_dedups_media_across_inputs(tmp_path):
+    """같은 덱을 두 번 넣어도 이미지는 한 번만 들어감"""
+    once = str(tmp_path / "once.pptx")
+    twice = str(tmp_path / "twice.pptx")
+    merge_decks([(KETI_STYLE, "1-3"), (KETI, None)], once)
+    count = merge_decks([(KETI_STYLE, "1-3"), (KETI, None), (KETI, "1-2")], twice)
+
+    assert count == 3 + _slide_count(KETI) + 2
+    _, media_once, _ = _check_package(once)
+    _, media_twice, _ = _check_package(twice)
+    assert len(media_twice) == len(media_once)
+
+
+def test_merge_bad_range_removes_output(tmp_path):
+    output = str(tmp_path / "bad.pptx")
+    with pytest.raises(ValueError):
+        merge_decks([(KETI_STYLE, None), (KETI, "1-99")], output)
+    assert not os.path.exists(output)
+
+
+def test_split_by_ranges(tmp_path):
+    results = split_deck(KETI_STYLE, ["1-5", "6-10,25"], str(tmp_path))
+
+    assert [count for _, count in results] == [5, 6]
+    for path, count in results:
+        prs, _, _ = _check_package(path)
+        assert len(prs.slides) == count